@@ -0,0 +1,38 @@
+import hmac
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials
+
+from ..auth import authenticate_token
+from ..auth.dependencies import bearer_scheme
+from ..core.config import get_settings
+from ..dependencies.metrics import worker_metrics_dependency
+from ..metrics import WorkerMetrics, registry
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter()
+
+
+async def require_metrics_access(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+) -> None:
+    if not credentials:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    settings = get_settings()
+    if settings.metrics_token and hmac.compare_digest(
+        credentials.credentials.encode(), settings.metrics_token.encode()
+    ):
+        return
+    if settings.metrics_role not in authenticate_token(credentials.credentials).roles:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
+
+
+@router.get("/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_access)])
+async def metrics(
+    worker_metrics: Optional[WorkerMetrics] = Depends(worker_metrics_dependency),
+) -> PlainTextResponse:
+    body = await worker_metrics.render() if worker_metrics else registry.render()
+    return PlainTextResponse(body, media_type=PROMETHEUS_CONTENT_TYPE)
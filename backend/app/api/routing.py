@@ -0,0 +1,132 @@
+import functools
+import inspect
+from typing import Any, Callable, Coroutine, Dict, Optional, Type, get_type_hints
+
+from fastapi import Request, Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.dependencies.utils import get_typed_return_annotation
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from ..core.config import get_settings
+from ..core.tracing import span
+from ..utils.http_cache import (
+    etag_matches,
+    latest_last_modified,
+    not_modified_since,
+    payload_etag,
+    upstream_validator_scope,
+)
+
+TRUSTED_RESPONSE_PARAM = "_trusted_response"
+
+_NOT_MODIFIED_HEADERS = ("cache-control", "etag", "last-modified", "vary")
+
+_SERIALIZATION_DEFAULTS = {
+    "response_model_include": None,
+    "response_model_exclude": None,
+    "response_model_by_alias": True,
+    "response_model_exclude_unset": False,
+    "response_model_exclude_defaults": False,
+    "response_model_exclude_none": False,
+}
+
+
+def trusted_model_endpoint(
+    endpoint: Callable[..., Any],
+    response_model: Type[BaseModel],
+    status_code: Optional[int] = None,
+) -> Callable[..., Any]:
+    signature = inspect.signature(endpoint)
+    hints = get_type_hints(endpoint, include_extras=True)
+    parameters = [
+        parameter.replace(annotation=hints.get(parameter.name, parameter.annotation))
+        for parameter in signature.parameters.values()
+    ]
+    parameters.append(
+        inspect.Parameter(TRUSTED_RESPONSE_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Response)
+    )
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        sub_response: Response = kwargs.pop(TRUSTED_RESPONSE_PARAM)
+        result = await endpoint(*args, **kwargs)
+        if type(result) is not response_model:
+            return result
+
+        with span("pydantic.serialize", {"model": response_model.__name__}):
+            content = to_json(result, by_alias=True)
+        response = Response(
+            content=content,
+            status_code=sub_response.status_code or status_code or 200,
+            media_type="application/json",
+        )
+        response.raw_headers.extend(sub_response.raw_headers)
+        return response
+
+    wrapper.__signature__ = signature.replace(parameters=parameters)  # type: ignore[attr-defined]
+    wrapper.__trusted_model__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+class ConditionalRoute(APIRoute):
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        policy = get_settings().cache_control_policy
+        cache_control = next((policy[tag] for tag in self.tags if tag in policy), None)
+
+        async def conditional_handler(request: Request) -> Response:
+            if request.method != "GET":
+                return await handler(request)
+
+            with upstream_validator_scope() as upstream_last_modified:
+                response = await handler(request)
+            body = getattr(response, "body", None)
+            if response.status_code != 200 or not isinstance(body, bytes):
+                return response
+
+            etag = payload_etag(body)
+            response.headers["ETag"] = etag
+            response.headers.add_vary_header("Authorization")
+            if cache_control and "cache-control" not in response.headers:
+                response.headers["Cache-Control"] = cache_control
+            last_modified = latest_last_modified(upstream_last_modified)
+            if last_modified:
+                response.headers["Last-Modified"] = last_modified
+
+            if not self._is_unchanged(request, etag, last_modified):
+                return response
+            headers = {name: value for name, value in response.headers.items() if name in _NOT_MODIFIED_HEADERS}
+            return Response(status_code=304, headers=headers, background=response.background)
+
+        return conditional_handler
+
+    @staticmethod
+    def _is_unchanged(request: Request, etag: str, last_modified: Optional[str]) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            return etag_matches(if_none_match, etag)
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and last_modified:
+            return not_modified_since(if_modified_since, last_modified)
+        return False
+
+
+class TrustedModelRoute(ConditionalRoute):
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        response_model = kwargs.get("response_model", DefaultPlaceholder(None))
+        if isinstance(response_model, DefaultPlaceholder):
+            response_model = get_typed_return_annotation(endpoint)
+
+        if self._can_trust(endpoint, response_model, kwargs):
+            endpoint = trusted_model_endpoint(endpoint, response_model, kwargs.get("status_code"))
+        super().__init__(path, endpoint, **kwargs)
+
+    @staticmethod
+    def _can_trust(endpoint: Callable[..., Any], response_model: Any, options: Dict[str, Any]) -> bool:
+        if getattr(endpoint, "__trusted_model__", False) or not inspect.iscoroutinefunction(endpoint):
+            return False
+        if not (isinstance(response_model, type) and issubclass(response_model, BaseModel)):
+            return False
+        return all(options.get(name, default) == default for name, default in _SERIALIZATION_DEFAULTS.items())
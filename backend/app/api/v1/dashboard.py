@@ -0,0 +1,26 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from ...auth import get_current_admin
+from ...auth.models import AdminUser
+from ...clients.remnawave import RemnaWaveAdminAPIClient
+from ...dependencies.readmodel import read_model_dependency
+from ...dependencies.remnawave import remnawave_client_dependency
+from ...readmodel import ReadModelStore
+from ...schemas.dashboard import DashboardResponse
+from ...services.dashboard import DashboardService
+from ..routing import TrustedModelRoute
+
+router = APIRouter(route_class=TrustedModelRoute)
+
+
+@router.get("", response_model=DashboardResponse)
+async def dashboard(
+    current_admin: AdminUser = Depends(get_current_admin),
+    client: RemnaWaveAdminAPIClient = Depends(remnawave_client_dependency),
+    read_model: Optional[ReadModelStore] = Depends(read_model_dependency),
+    recent_limit: int = Query(5, ge=1, le=50, alias="recentLimit"),
+) -> DashboardResponse:
+    service = DashboardService(client, read_model=read_model)
+    return await service.get_dashboard(recent_limit=recent_limit)
@@ -1,13 +1,17 @@
+from dataclasses import asdict
+
 from fastapi import APIRouter, Depends
 
 from ...auth import get_current_admin
 from ...auth.models import AdminUser
+from ...cache import get_response_cache
 from ...clients.remnawave import RemnaWaveAdminAPIClient
 from ...dependencies.remnawave import remnawave_client_dependency
 from ...services.health import HealthService
-from ...schemas.health import HealthResponse
+from ...schemas.health import HealthResponse, UpstreamStatsResponse
+from ..routing import TrustedModelRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TrustedModelRoute)
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -17,3 +21,19 @@ async def healthcheck(
 ) -> HealthResponse:
     service = HealthService(client)
     return await service.get_health()
+
+
+@router.get("/health/upstream", response_model=UpstreamStatsResponse)
+async def upstream_stats(
+    current_admin: AdminUser = Depends(get_current_admin),
+    client: RemnaWaveAdminAPIClient = Depends(remnawave_client_dependency),
+) -> UpstreamStatsResponse:
+    pool = client.pool_stats()
+    return UpstreamStatsResponse.model_validate(
+        {
+            "pool": asdict(pool) if pool else None,
+            "resilience": asdict(client.resilience_stats()),
+            "coalescing": asdict(client.singleflight_stats()),
+            "cache": asdict(get_response_cache().stats()),
+        }
+    )
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+
+from ...auth import require_role
+from ...auth.models import AdminUser
+from ...core.config import get_settings
+from ...dependencies.profiling import profile_store_dependency
+from ...profiling import ProfileRecord, ProfileStore, collapsed_stacks, speedscope_document
+from ...schemas.profiling import ProfileDetailResponse, ProfileListResponse, ProfileSummary
+from ..routing import TrustedModelRoute
+
+router = APIRouter(route_class=TrustedModelRoute)
+
+require_profiler = require_role(get_settings().profiling_role)
+
+
+def _get_record(store: ProfileStore, request_id: str) -> ProfileRecord:
+    record = store.get(request_id)
+    if record is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return record
+
+
+def _summary(record: ProfileRecord) -> ProfileSummary:
+    return ProfileSummary(
+        request_id=record.request_id,
+        admin_id=record.admin_id,
+        method=record.method,
+        path=record.path,
+        status_code=record.status_code,
+        started_at=record.started_at,
+        duration_ms=round(record.duration_ms, 3),
+        cpu_time_ms=round(record.cpu_time_ms, 3),
+    )
+
+
+@router.get("", response_model=ProfileListResponse)
+async def list_profiles(
+    current_admin: AdminUser = Depends(require_profiler),
+    store: ProfileStore = Depends(profile_store_dependency),
+) -> ProfileListResponse:
+    return ProfileListResponse(items=[_summary(record) for record in store.list()], capacity=store.capacity)
+
+
+@router.get("/{request_id}", response_model=ProfileDetailResponse)
+async def get_profile(
+    request_id: str,
+    current_admin: AdminUser = Depends(require_profiler),
+    store: ProfileStore = Depends(profile_store_dependency),
+) -> ProfileDetailResponse:
+    record = _get_record(store, request_id)
+    return ProfileDetailResponse(
+        **_summary(record).model_dump(),
+        sample_count=record.session.sample_count,
+        collapsed_stacks=collapsed_stacks(record.session),
+    )
+
+
+@router.get("/{request_id}/speedscope")
+async def get_profile_speedscope(
+    request_id: str,
+    current_admin: AdminUser = Depends(require_profiler),
+    store: ProfileStore = Depends(profile_store_dependency),
+) -> Response:
+    record = _get_record(store, request_id)
+    return Response(
+        content=speedscope_document(record.session),
+        media_type="application/json",
+        headers={"Content-Disposition": f'attachment; filename="{request_id}.speedscope.json"'},
+    )
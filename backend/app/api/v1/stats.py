@@ -1,13 +1,20 @@
+from typing import AsyncIterator
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
 from ...auth import get_current_admin
 from ...auth.models import AdminUser
 from ...clients.remnawave import RemnaWaveAdminAPIClient
+from ...core.config import get_settings
+from ...dependencies.live import live_stats_dependency
 from ...dependencies.remnawave import remnawave_client_dependency
+from ...live import LiveStatsBroadcaster
 from ...schemas.stats import StatsOverviewResponse
 from ...services.stats import StatsService
+from ..routing import TrustedModelRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TrustedModelRoute)
 
 
 @router.get("/overview", response_model=StatsOverviewResponse)
@@ -17,3 +24,24 @@ async def stats_overview(
 ) -> StatsOverviewResponse:
     service = StatsService(client)
     return await service.get_overview()
+
+
+@router.get("/live", response_class=StreamingResponse)
+async def stats_live(
+    current_admin: AdminUser = Depends(get_current_admin),
+    broadcaster: LiveStatsBroadcaster = Depends(live_stats_dependency),
+) -> StreamingResponse:
+    heartbeat = get_settings().live_stats_heartbeat
+
+    async def events() -> AsyncIterator[bytes]:
+        async with broadcaster.subscribe() as subscription:
+            yield b"retry: 5000\n\n"
+            while True:
+                event = await subscription.next(heartbeat)
+                yield event.encode() if event is not None else b": keepalive\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
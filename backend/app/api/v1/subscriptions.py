@@ -1,25 +1,35 @@
-from typing import Optional
+from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from ...auth import get_current_admin
 from ...auth.models import AdminUser
 from ...clients.remnawave import RemnaWaveAdminAPIClient
+from ...dependencies.readmodel import read_model_dependency
 from ...dependencies.remnawave import remnawave_client_dependency
+from ...readmodel import ReadModelStore
+from ...schemas.common import BatchRequest
 from ...schemas.subscriptions import (
+    Subscription,
+    SubscriptionBatchResponse,
+    SubscriptionBulkUpdateRequest,
     SubscriptionDetailResponse,
     SubscriptionListResponse,
     SubscriptionUpdateRequest,
 )
 from ...services.subscriptions import SubscriptionsService
+from ...utils.export import export_response, progress_response
+from ..routing import TrustedModelRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TrustedModelRoute)
 
 
 def get_subscriptions_service(
     client: RemnaWaveAdminAPIClient = Depends(remnawave_client_dependency),
+    read_model: Optional[ReadModelStore] = Depends(read_model_dependency),
 ) -> SubscriptionsService:
-    return SubscriptionsService(client)
+    return SubscriptionsService(client, read_model=read_model)
 
 
 @router.get("/", response_model=SubscriptionListResponse)
@@ -41,6 +51,42 @@ async def list_subscriptions(
     )
 
 
+@router.get("/export", response_class=StreamingResponse)
+async def export_subscriptions(
+    current_admin: AdminUser = Depends(get_current_admin),
+    service: SubscriptionsService = Depends(get_subscriptions_service),
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    status: Optional[str] = Query(default=None),
+    user_id: Optional[int] = Query(default=None),
+    is_trial: Optional[bool] = Query(default=None, alias="isTrial"),
+) -> StreamingResponse:
+    rows = service.iter_subscriptions(status=status, user_id=user_id, is_trial=is_trial)
+    return await export_response(
+        rows,
+        export_format=export_format,
+        model=Subscription,
+        filename="subscriptions",
+    )
+
+
+@router.post("/batch", response_model=SubscriptionBatchResponse)
+async def get_subscriptions_batch(
+    request: BatchRequest,
+    current_admin: AdminUser = Depends(get_current_admin),
+    service: SubscriptionsService = Depends(get_subscriptions_service),
+) -> SubscriptionBatchResponse:
+    return await service.get_subscriptions_batch(request.ids)
+
+
+@router.post("/bulk", response_class=StreamingResponse)
+async def bulk_update_subscriptions(
+    request: SubscriptionBulkUpdateRequest,
+    current_admin: AdminUser = Depends(get_current_admin),
+    service: SubscriptionsService = Depends(get_subscriptions_service),
+) -> StreamingResponse:
+    return progress_response(service.bulk_update_subscriptions(request.ids, request.patch))
+
+
 @router.get("/{subscription_id}", response_model=SubscriptionDetailResponse)
 async def get_subscription(
     subscription_id: int,
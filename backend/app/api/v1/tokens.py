@@ -1,24 +1,30 @@
-from fastapi import APIRouter, Depends, Query
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from ...auth import get_current_admin
 from ...auth.models import AdminUser
 from ...clients.remnawave import RemnaWaveAdminAPIClient
 from ...dependencies.remnawave import remnawave_client_dependency
+from ...dependencies.search import token_search_index_dependency
 from ...schemas.tokens import (
     TokenCreateRequest,
     TokenCreateResponse,
     TokenListResponse,
     TokenRevokeResponse,
 )
+from ...search import SearchIndex, SearchSuperseded, search_tasks
 from ...services.tokens import TokensService
+from ..routing import TrustedModelRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TrustedModelRoute)
 
 
 def get_tokens_service(
     client: RemnaWaveAdminAPIClient = Depends(remnawave_client_dependency),
+    search_index: Optional[SearchIndex] = Depends(token_search_index_dependency),
 ) -> TokensService:
-    return TokensService(client)
+    return TokensService(client, search_index=search_index)
 
 
 @router.get("/", response_model=TokenListResponse)
@@ -29,7 +35,13 @@ async def list_tokens(
     offset: int = Query(0, ge=0),
     search: str | None = Query(default=None),
 ) -> TokenListResponse:
-    return await service.list_tokens(limit=limit, offset=offset, search=search)
+    listing = service.list_tokens(limit=limit, offset=offset, search=search)
+    if not search:
+        return await listing
+    try:
+        return await search_tasks.run(("tokens", current_admin.id), listing)
+    except SearchSuperseded:
+        raise HTTPException(status_code=409, detail="Search superseded")
 
 
 @router.post("/", response_model=TokenCreateResponse)
@@ -1,21 +1,38 @@
-from typing import Optional
+from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 from ...auth import get_current_admin
 from ...auth.models import AdminUser
 from ...clients.remnawave import RemnaWaveAdminAPIClient
+from ...dependencies.readmodel import read_model_dependency
 from ...dependencies.remnawave import remnawave_client_dependency
-from ...schemas.users import UserDetailResponse, UserListResponse, UserUpdateRequest
+from ...dependencies.search import user_search_index_dependency
+from ...readmodel import ReadModelStore
+from ...schemas.common import BatchRequest
+from ...schemas.users import (
+    UserBatchResponse,
+    UserBulkUpdateRequest,
+    UserDetailResponse,
+    UserListResponse,
+    UserSummary,
+    UserUpdateRequest,
+)
+from ...search import SearchIndex, SearchSuperseded, search_tasks
 from ...services.users import UsersService
+from ...utils.export import export_response, progress_response
+from ..routing import TrustedModelRoute
 
-router = APIRouter()
+router = APIRouter(route_class=TrustedModelRoute)
 
 
 def get_users_service(
     client: RemnaWaveAdminAPIClient = Depends(remnawave_client_dependency),
+    read_model: Optional[ReadModelStore] = Depends(read_model_dependency),
+    search_index: Optional[SearchIndex] = Depends(user_search_index_dependency),
 ) -> UsersService:
-    return UsersService(client)
+    return UsersService(client, read_model=read_model, search_index=search_index)
 
 
 @router.get("/", response_model=UserListResponse)
@@ -28,13 +45,54 @@ async def list_users(
     promo_group_id: Optional[int] = Query(default=None, alias="promoGroupId"),
     search: Optional[str] = Query(default=None),
 ) -> UserListResponse:
-    return await service.list_users(
+    listing = service.list_users(
         limit=limit,
         offset=offset,
         status_filter=status,
         promo_group_id=promo_group_id,
         search=search,
     )
+    if not search:
+        return await listing
+    try:
+        return await search_tasks.run(("users", current_admin.id), listing)
+    except SearchSuperseded:
+        raise HTTPException(status_code=409, detail="Search superseded")
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_users(
+    current_admin: AdminUser = Depends(get_current_admin),
+    service: UsersService = Depends(get_users_service),
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    status: Optional[str] = Query(default=None),
+    promo_group_id: Optional[int] = Query(default=None, alias="promoGroupId"),
+    search: Optional[str] = Query(default=None),
+) -> StreamingResponse:
+    rows = service.iter_users(
+        status_filter=status,
+        promo_group_id=promo_group_id,
+        search=search,
+    )
+    return await export_response(rows, export_format=export_format, model=UserSummary, filename="users")
+
+
+@router.post("/batch", response_model=UserBatchResponse)
+async def get_users_batch(
+    request: BatchRequest,
+    current_admin: AdminUser = Depends(get_current_admin),
+    service: UsersService = Depends(get_users_service),
+) -> UserBatchResponse:
+    return await service.get_users_batch(request.ids)
+
+
+@router.post("/bulk", response_class=StreamingResponse)
+async def bulk_update_users(
+    request: UserBulkUpdateRequest,
+    current_admin: AdminUser = Depends(get_current_admin),
+    service: UsersService = Depends(get_users_service),
+) -> StreamingResponse:
+    return progress_response(service.bulk_update_users(request.ids, request.patch))
 
 
 @router.get("/{user_id}", response_model=UserDetailResponse)
@@ -1,3 +1,3 @@
-from .dependencies import get_current_admin
+from .dependencies import authenticate_token, get_current_admin, require_role
 
-__all__ = ["get_current_admin"]
+__all__ = ["authenticate_token", "get_current_admin", "require_role"]
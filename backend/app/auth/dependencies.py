@@ -1,10 +1,12 @@
 import logging
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from ..core.config import get_settings
+from .jwt.cache import VerifiedTokenCache
 from .jwt.tokens import decode_access_token
 from .models import AdminUser
 
@@ -12,14 +14,37 @@ logger = logging.getLogger(__name__)
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+verified_token_cache = VerifiedTokenCache(get_settings().admin_jwt_cache_size)
+
 
 async def get_current_admin(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
 ) -> AdminUser:
     if not credentials:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    return authenticate_token(credentials.credentials)
+
+
+def require_role(role: str) -> Callable[..., Awaitable[AdminUser]]:
+    async def dependency(current_admin: AdminUser = Depends(get_current_admin)) -> AdminUser:
+        if role not in current_admin.roles:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient permissions")
+        return current_admin
+
+    return dependency
+
+
+def authenticate_token(token: str) -> AdminUser:
+    settings = get_settings()
+    key_fingerprint = (
+        settings.admin_jwt_algorithm,
+        settings.admin_jwt_secret,
+        settings.admin_jwt_public_key,
+    )
 
-    token = credentials.credentials
+    cached = verified_token_cache.get(token, key_fingerprint)
+    if cached is not None:
+        return cached
 
     try:
         payload = decode_access_token(token)
@@ -35,4 +60,6 @@ async def get_current_admin(
     if not isinstance(roles, list):
         roles = [roles]
 
-    return AdminUser(id=subject, roles=roles)
+    admin = AdminUser(id=subject, roles=roles)
+    verified_token_cache.put(token, admin, payload.get("exp"))
+    return admin
@@ -0,0 +1,47 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from ..models import AdminUser
+
+
+class VerifiedTokenCache:
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._entries: "OrderedDict[bytes, Tuple[AdminUser, float]]" = OrderedDict()
+        self._max_entries = max(max_entries, 1)
+        self._key_fingerprint: Optional[Hashable] = None
+
+    def get(self, token: str, key_fingerprint: Hashable) -> Optional[AdminUser]:
+        if key_fingerprint != self._key_fingerprint:
+            self._entries.clear()
+            self._key_fingerprint = key_fingerprint
+            return None
+
+        digest = self._digest(token)
+        cached = self._entries.get(digest)
+        if cached is None:
+            return None
+
+        admin, expires_at = cached
+        if expires_at <= time.time():
+            del self._entries[digest]
+            return None
+
+        self._entries.move_to_end(digest)
+        return admin
+
+    def put(self, token: str, admin: AdminUser, expires_at: Any) -> None:
+        if not isinstance(expires_at, (int, float)) or expires_at <= time.time():
+            return
+
+        self._entries[self._digest(token)] = (admin, float(expires_at))
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
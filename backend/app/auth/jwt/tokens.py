@@ -1,9 +1,29 @@
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict
 
 import jwt
 
-from ...core.config import get_settings
+from ...core.config import Settings, get_settings
+
+HMAC_ALGORITHMS = frozenset({"HS256", "HS384", "HS512"})
+
+
+@lru_cache(maxsize=8)
+def _load_key(algorithm: str, pem: str) -> Any:
+    return jwt.get_algorithm_by_name(algorithm).prepare_key(pem)
+
+
+def signing_key(settings: Settings) -> Any:
+    if settings.admin_jwt_algorithm in HMAC_ALGORITHMS:
+        return settings.admin_jwt_secret
+    return _load_key(settings.admin_jwt_algorithm, settings.admin_jwt_private_key)
+
+
+def verification_key(settings: Settings) -> Any:
+    if settings.admin_jwt_algorithm in HMAC_ALGORITHMS:
+        return settings.admin_jwt_secret
+    return _load_key(settings.admin_jwt_algorithm, settings.admin_jwt_public_key)
 
 
 def create_access_token(subject: str, additional_claims: Dict[str, Any] | None = None) -> str:
@@ -16,9 +36,9 @@ def create_access_token(subject: str, additional_claims: Dict[str, Any] | None =
     }
     if additional_claims:
         payload.update(additional_claims)
-    return jwt.encode(payload, settings.admin_jwt_secret, algorithm=settings.admin_jwt_algorithm)
+    return jwt.encode(payload, signing_key(settings), algorithm=settings.admin_jwt_algorithm)
 
 
 def decode_access_token(token: str) -> Dict[str, Any]:
     settings = get_settings()
-    return jwt.decode(token, settings.admin_jwt_secret, algorithms=[settings.admin_jwt_algorithm])
+    return jwt.decode(token, verification_key(settings), algorithms=[settings.admin_jwt_algorithm])
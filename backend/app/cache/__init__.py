@@ -0,0 +1,23 @@
+from .backends import (
+    CacheBackend,
+    RedisCacheBackend,
+    SQLiteCacheBackend,
+    create_cache_backend,
+    resolve_cache_backend,
+)
+from .entry import CacheEntry, CachedUpstreamError
+from .response import CacheStats, ResponseCache, TTLPolicy, get_response_cache
+
+__all__ = [
+    "CacheBackend",
+    "CacheEntry",
+    "CacheStats",
+    "CachedUpstreamError",
+    "RedisCacheBackend",
+    "ResponseCache",
+    "SQLiteCacheBackend",
+    "TTLPolicy",
+    "create_cache_backend",
+    "get_response_cache",
+    "resolve_cache_backend",
+]
@@ -0,0 +1,389 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+from .entry import CacheEntry, CachedUpstreamError
+
+logger = logging.getLogger(__name__)
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    resource TEXT NOT NULL,
+    data TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_cache_entries_resource ON cache_entries (resource);
+CREATE INDEX IF NOT EXISTS ix_cache_entries_expires_at ON cache_entries (expires_at);
+
+CREATE TABLE IF NOT EXISTS cache_versions (
+    resource TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS cache_invalidations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    origin TEXT NOT NULL,
+    prefix TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+def matches_prefix(key: str, prefix: str) -> bool:
+    return key == prefix or key.startswith(prefix + "/") or key.startswith(prefix + "?")
+
+
+def resource_of(key: str) -> str:
+    return "/" + key.split("?", 1)[0].strip("/").split("/", 1)[0]
+
+
+def encode_entry(entry: CacheEntry) -> str:
+    error = entry.error
+    return json.dumps(
+        {
+            "value": entry.value,
+            "stored_at": entry.stored_at,
+            "ttl": entry.ttl,
+            "stale_ttl": entry.stale_ttl,
+            "latency_ms": entry.latency_ms,
+            "last_modified": entry.last_modified,
+            "error": None
+            if error is None
+            else {"status_code": getattr(error, "status_code", 500), "detail": getattr(error, "detail", str(error))},
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def decode_entry(data: str) -> CacheEntry:
+    raw = json.loads(data)
+    error = raw.get("error")
+    return CacheEntry(
+        value=raw["value"],
+        stored_at=raw["stored_at"],
+        ttl=raw["ttl"],
+        stale_ttl=raw["stale_ttl"],
+        latency_ms=raw.get("latency_ms", 0.0),
+        error=None if error is None else CachedUpstreamError(error["status_code"], error["detail"]),
+        last_modified=raw.get("last_modified"),
+    )
+
+
+class CacheBackend(ABC):
+    name = "shared"
+
+    def __init__(self) -> None:
+        self.origin = uuid.uuid4().hex
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry, *, expected_version: Optional[int] = None) -> bool:
+        ...
+
+    @abstractmethod
+    async def resource_version(self, resource: str) -> int:
+        ...
+
+    @abstractmethod
+    async def delete_prefix(self, prefix: str) -> int:
+        ...
+
+    @abstractmethod
+    async def publish_invalidation(self, prefix: str) -> None:
+        ...
+
+    @abstractmethod
+    def invalidations(self) -> AsyncIterator[str]:
+        ...
+
+    async def close(self) -> None:
+        pass
+
+
+class SQLiteCacheBackend(CacheBackend):
+    name = "sqlite"
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_entries: int = 1024,
+        poll_interval: float = 0.5,
+        retention: float = 60.0,
+    ) -> None:
+        super().__init__()
+        self._path = path
+        self._max_entries = max(max_entries, 1)
+        self._poll_interval = poll_interval
+        self._retention = retention
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._last_invalidation_id = 0
+        self._writes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None, timeout=5.0)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SQLITE_SCHEMA)
+            row = connection.execute("SELECT COALESCE(MAX(id), 0) FROM cache_invalidations").fetchone()
+            self._last_invalidation_id = row[0]
+            self._connection = connection
+        return self._connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+            connection.execute("COMMIT")
+        except BaseException:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        def run() -> Optional[str]:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT data FROM cache_entries WHERE key = ? AND expires_at > ?", (key, time.time())
+                ).fetchone()
+            return row[0] if row else None
+
+        data = await asyncio.to_thread(run)
+        return decode_entry(data) if data is not None else None
+
+    async def set(self, key: str, entry: CacheEntry, *, expected_version: Optional[int] = None) -> bool:
+        data = encode_entry(entry)
+        expires_at = entry.stored_at + entry.ttl + entry.stale_ttl
+        resource = resource_of(key)
+
+        def run() -> bool:
+            with self._lock:
+                with self._transaction() as connection:
+                    if expected_version is not None and self._version(connection, resource) != expected_version:
+                        return False
+                    connection.execute(
+                        "INSERT OR REPLACE INTO cache_entries (key, resource, data, expires_at) VALUES (?, ?, ?, ?)",
+                        (key, resource, data, expires_at),
+                    )
+                self._writes += 1
+                if self._writes % 64 == 0:
+                    self._trim(connection)
+                return True
+
+        return await asyncio.to_thread(run)
+
+    async def resource_version(self, resource: str) -> int:
+        def run() -> int:
+            with self._lock:
+                return self._version(self._connect(), resource)
+
+        return await asyncio.to_thread(run)
+
+    @staticmethod
+    def _version(connection: sqlite3.Connection, resource: str) -> int:
+        row = connection.execute("SELECT version FROM cache_versions WHERE resource = ?", (resource,)).fetchone()
+        return row[0] if row else 0
+
+    def _trim(self, connection: sqlite3.Connection) -> None:
+        connection.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (time.time(),))
+        excess = connection.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0] - self._max_entries
+        if excess > 0:
+            connection.execute(
+                "DELETE FROM cache_entries WHERE key IN "
+                "(SELECT key FROM cache_entries ORDER BY expires_at LIMIT ?)",
+                (excess,),
+            )
+
+    async def delete_prefix(self, prefix: str) -> int:
+        prefix = prefix.rstrip("/")
+
+        def run() -> int:
+            with self._lock, self._transaction() as connection:
+                connection.execute(
+                    "INSERT INTO cache_versions (resource, version) VALUES (?, 1) "
+                    "ON CONFLICT (resource) DO UPDATE SET version = version + 1",
+                    (resource_of(prefix),),
+                )
+                return self._delete_prefix(connection, prefix)
+
+        return await asyncio.to_thread(run)
+
+    @staticmethod
+    def _delete_prefix(connection: sqlite3.Connection, prefix: str) -> int:
+        return connection.execute(
+            "DELETE FROM cache_entries WHERE resource = ? AND "
+            "(key = ? OR substr(key, 1, ?) = ? OR substr(key, 1, ?) = ?)",
+            (
+                resource_of(prefix),
+                prefix,
+                len(prefix) + 1,
+                prefix + "/",
+                len(prefix) + 1,
+                prefix + "?",
+            ),
+        ).rowcount
+
+    async def publish_invalidation(self, prefix: str) -> None:
+        def run() -> None:
+            now = time.time()
+            with self._lock:
+                connection = self._connect()
+                connection.execute(
+                    "INSERT INTO cache_invalidations (origin, prefix, created_at) VALUES (?, ?, ?)",
+                    (self.origin, prefix, now),
+                )
+                connection.execute("DELETE FROM cache_invalidations WHERE created_at < ?", (now - self._retention,))
+
+        await asyncio.to_thread(run)
+
+    async def invalidations(self) -> AsyncIterator[str]:
+        while True:
+            for prefix in await asyncio.to_thread(self._poll_invalidations):
+                yield prefix
+            await asyncio.sleep(self._poll_interval)
+
+    def _poll_invalidations(self) -> List[str]:
+        with self._lock:
+            connection = self._connect()
+            rows = connection.execute(
+                "SELECT id, origin, prefix FROM cache_invalidations WHERE id > ? ORDER BY id",
+                (self._last_invalidation_id,),
+            ).fetchall()
+        if rows:
+            self._last_invalidation_id = rows[-1][0]
+        return [prefix for _, origin, prefix in rows if origin != self.origin]
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class RedisCacheBackend(CacheBackend):
+    name = "redis"
+
+    def __init__(self, client: Any, *, namespace: str = "bff:cache") -> None:
+        super().__init__()
+        self._client = client
+        self._namespace = namespace
+        self._channel = f"{namespace}:invalidate"
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self._namespace}:entry:{key}"
+
+    def _index_key(self, resource: str) -> str:
+        return f"{self._namespace}:index:{resource}"
+
+    def _version_key(self, resource: str) -> str:
+        return f"{self._namespace}:version:{resource}"
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        data = await self._client.get(self._entry_key(key))
+        return decode_entry(data) if data is not None else None
+
+    async def set(self, key: str, entry: CacheEntry, *, expected_version: Optional[int] = None) -> bool:
+        resource = resource_of(key)
+        if expected_version is not None and await self.resource_version(resource) != expected_version:
+            return False
+        lifetime_ms = max(int((entry.ttl + entry.stale_ttl) * 1000), 1)
+        index_key = self._index_key(resource)
+        await self._client.set(self._entry_key(key), encode_entry(entry), px=lifetime_ms)
+        await self._client.sadd(index_key, key)
+        index_ttl = max(lifetime_ms // 1000, 1) * 2
+        if await self._client.ttl(index_key) < index_ttl:
+            await self._client.expire(index_key, index_ttl)
+        if expected_version is not None and await self.resource_version(resource) != expected_version:
+            await self._client.delete(self._entry_key(key))
+            return False
+        return True
+
+    async def resource_version(self, resource: str) -> int:
+        return int(await self._client.get(self._version_key(resource)) or 0)
+
+    async def delete_prefix(self, prefix: str) -> int:
+        prefix = prefix.rstrip("/")
+        index_key = self._index_key(resource_of(prefix))
+        await self._client.incr(self._version_key(resource_of(prefix)))
+        keys = [key for key in await self._client.smembers(index_key) if matches_prefix(key, prefix)]
+        if not keys:
+            return 0
+        deleted = await self._client.delete(*(self._entry_key(key) for key in keys))
+        await self._client.srem(index_key, *keys)
+        return deleted
+
+    async def publish_invalidation(self, prefix: str) -> None:
+        await self._client.publish(self._channel, json.dumps({"origin": self.origin, "prefix": prefix}))
+
+    async def invalidations(self) -> AsyncIterator[str]:
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(self._channel)
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                payload = json.loads(message["data"])
+                if payload.get("origin") != self.origin:
+                    yield payload["prefix"]
+        finally:
+            await pubsub.unsubscribe(self._channel)
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+def resolve_cache_backend(configured: str, workers: int) -> str:
+    backend = configured.lower()
+    if backend == "auto":
+        return "sqlite" if workers > 1 else "memory"
+    if backend == "memory" and workers > 1:
+        logger.warning(
+            "CACHE_BACKEND=memory with %s workers: invalidations and write-through stay inside one worker, "
+            "so the others keep serving pre-write pages until their TTL and stale window expire",
+            workers,
+        )
+    return backend
+
+
+def create_cache_backend(settings: Any) -> Optional[CacheBackend]:
+    backend = resolve_cache_backend(settings.cache_backend, 1)
+    if backend == "memory":
+        return None
+    if backend == "sqlite":
+        return SQLiteCacheBackend(
+            settings.cache_sqlite_path,
+            max_entries=settings.cache_max_entries,
+            poll_interval=settings.cache_invalidation_poll_interval,
+        )
+    if backend == "redis":
+        if settings.cache_redis_url.startswith("memory://"):
+            from .fake_redis import FakeRedis
+
+            return RedisCacheBackend(FakeRedis())
+        try:
+            from redis.asyncio import Redis
+        except ImportError:
+            logger.warning("CACHE_BACKEND=redis but the redis package is not installed, using in-process cache")
+            return None
+        return RedisCacheBackend(Redis.from_url(settings.cache_redis_url, decode_responses=True))
+    logger.warning("Unknown CACHE_BACKEND %r, using in-process cache", settings.cache_backend)
+    return None
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+class CachedUpstreamError(Exception):
+    def __init__(self, status_code: int, detail: str) -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    stored_at: float
+    ttl: float
+    stale_ttl: float
+    latency_ms: float = 0.0
+    error: Optional[Exception] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, now: float) -> bool:
+        return now - self.stored_at <= self.ttl
+
+    def is_servable(self, now: float) -> bool:
+        return now - self.stored_at <= self.ttl + self.stale_ttl
@@ -0,0 +1,124 @@
+import asyncio
+import math
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+
+class FakeRedisServer:
+    def __init__(self) -> None:
+        self.strings: Dict[str, Tuple[str, Optional[float]]] = {}
+        self.sets: Dict[str, Tuple[Set[str], Optional[float]]] = {}
+        self.channels: Dict[str, List["asyncio.Queue[Dict[str, Any]]"]] = {}
+
+    def alive(self, expires_at: Optional[float]) -> bool:
+        return expires_at is None or expires_at > time.time()
+
+
+_default_server = FakeRedisServer()
+
+
+class FakePubSub:
+    def __init__(self, server: FakeRedisServer) -> None:
+        self._server = server
+        self._queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self._channels: Set[str] = set()
+
+    async def subscribe(self, *channels: str) -> None:
+        for channel in channels:
+            self._server.channels.setdefault(channel, []).append(self._queue)
+            self._channels.add(channel)
+            await self._queue.put({"type": "subscribe", "channel": channel, "data": len(self._channels)})
+
+    async def unsubscribe(self, *channels: str) -> None:
+        for channel in channels or tuple(self._channels):
+            subscribers = self._server.channels.get(channel, [])
+            if self._queue in subscribers:
+                subscribers.remove(self._queue)
+            self._channels.discard(channel)
+
+    async def listen(self) -> AsyncIterator[Dict[str, Any]]:
+        while True:
+            yield await self._queue.get()
+
+    async def aclose(self) -> None:
+        await self.unsubscribe()
+
+
+class FakeRedis:
+    def __init__(self, server: Optional[FakeRedisServer] = None) -> None:
+        self._server = server or _default_server
+
+    async def get(self, key: str) -> Optional[str]:
+        value = self._server.strings.get(key)
+        if value is None or not self._server.alive(value[1]):
+            self._server.strings.pop(key, None)
+            return None
+        return value[0]
+
+    async def set(self, key: str, value: str, px: Optional[int] = None) -> bool:
+        self._server.strings[key] = (value, time.time() + px / 1000 if px else None)
+        return True
+
+    async def incr(self, key: str) -> int:
+        value = int(await self.get(key) or 0) + 1
+        expires_at = self._server.strings.get(key, (None, None))[1]
+        self._server.strings[key] = (str(value), expires_at)
+        return value
+
+    async def delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            if self._server.strings.pop(key, None) is not None or self._server.sets.pop(key, None) is not None:
+                deleted += 1
+        return deleted
+
+    async def sadd(self, key: str, *members: str) -> int:
+        current = await self.smembers(key)
+        added = len(set(members) - current)
+        expires_at = self._server.sets.get(key, (None, None))[1]
+        self._server.sets[key] = (current | set(members), expires_at)
+        return added
+
+    async def srem(self, key: str, *members: str) -> int:
+        current = await self.smembers(key)
+        removed = len(current & set(members))
+        if key in self._server.sets:
+            self._server.sets[key] = (current - set(members), self._server.sets[key][1])
+        return removed
+
+    async def smembers(self, key: str) -> Set[str]:
+        value = self._server.sets.get(key)
+        if value is None or not self._server.alive(value[1]):
+            self._server.sets.pop(key, None)
+            return set()
+        return set(value[0])
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        for store in (self._server.strings, self._server.sets):
+            if key in store:
+                store[key] = (store[key][0], time.time() + seconds)
+                return True
+        return False
+
+    async def ttl(self, key: str) -> int:
+        for store in (self._server.strings, self._server.sets):
+            value = store.get(key)
+            if value is None:
+                continue
+            if not self._server.alive(value[1]):
+                store.pop(key, None)
+                return -2
+            return -1 if value[1] is None else math.ceil(value[1] - time.time())
+        return -2
+
+    async def publish(self, channel: str, message: str) -> int:
+        subscribers = self._server.channels.get(channel, [])
+        for queue in subscribers:
+            queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(subscribers)
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(self._server)
+
+    async def aclose(self) -> None:
+        pass
@@ -0,0 +1,396 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from ..core.config import get_settings
+from .backends import CacheBackend, create_cache_backend, matches_prefix, resource_of
+from .entry import CacheEntry
+
+logger = logging.getLogger(__name__)
+
+FetchResult = Tuple[Any, float, Optional[str]]
+Fetcher = Callable[[], Awaitable[FetchResult]]
+
+PAGINATION_PARAMS = frozenset({"limit", "offset"})
+
+
+def list_item_ids(value: Any) -> List[Any]:
+    if not isinstance(value, dict):
+        return []
+    return [
+        item["id"]
+        for field in value.values()
+        if isinstance(field, list)
+        for item in field
+        if isinstance(item, dict) and "id" in item
+    ]
+
+
+def patch_list_items(value: Dict[str, Any], item_id: Any, changes: Mapping[str, Any]) -> Dict[str, Any]:
+    patched = dict(value)
+    for field, items in value.items():
+        if isinstance(items, list):
+            patched[field] = [
+                {name: changes.get(name, old) for name, old in item.items()}
+                if isinstance(item, dict) and item.get("id") == item_id
+                else item
+                for item in items
+            ]
+    return patched
+
+
+def is_list_key(key: str, resource: str) -> bool:
+    return key.partition("?")[0] == resource
+
+
+def is_filtered_list_key(key: str) -> bool:
+    return any(name not in PAGINATION_PARAMS for name, _ in parse_qsl(key.partition("?")[2]))
+
+
+@dataclass
+class CacheStats:
+    size: int
+    max_entries: int
+    hits: int
+    misses: int
+    stale_hits: int
+    negative_hits: int
+    evictions: int
+    refreshes: int
+    write_throughs: int
+    hit_ratio: float
+    backend: str = "memory"
+    shared_hits: int = 0
+    shared_errors: int = 0
+    remote_invalidations: int = 0
+
+
+class TTLPolicy:
+    def __init__(self, rules: Mapping[str, float], default_ttl: float = 0.0) -> None:
+        self._rules = sorted(rules.items(), key=lambda item: len(item[0]), reverse=True)
+        self._default_ttl = default_ttl
+
+    def ttl_for(self, path: str) -> float:
+        for prefix, ttl in self._rules:
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                return ttl
+        return self._default_ttl
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        *,
+        policy: TTLPolicy,
+        max_entries: int = 1024,
+        stale_ttl: float = 0.0,
+        negative_ttl: float = 0.0,
+        backend: Optional[CacheBackend] = None,
+    ) -> None:
+        self.policy = policy
+        self.backend = backend
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._pages_by_item: Dict[Tuple[str, Any], Set[str]] = {}
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._max_entries = max(max_entries, 1)
+        self._stale_ttl = stale_ttl
+        self._negative_ttl = negative_ttl
+        self._generation = 0
+        self._listener: Optional[asyncio.Task] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.negative_hits = 0
+        self.evictions = 0
+        self.refreshes = 0
+        self.shared_hits = 0
+        self.shared_errors = 0
+        self.remote_invalidations = 0
+        self.write_throughs = 0
+
+    @staticmethod
+    def make_key(path: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        if not params:
+            return path
+        query = urlencode(sorted((key, value) for key, value in params.items() if value is not None))
+        return f"{path}?{query}" if query else path
+
+    async def get_or_fetch(self, key: str, ttl: float, fetch: Fetcher) -> CacheEntry:
+        now = time.time()
+        entry = self._entries.get(key)
+        if self.backend is not None and (entry is None or not entry.is_servable(now)):
+            shared = await self._load_shared(key)
+            if shared is not None and shared.is_servable(now):
+                self.shared_hits += 1
+                self._store(key, shared)
+                entry = shared
+
+        if entry is not None:
+            if entry.is_fresh(now):
+                self._entries.move_to_end(key)
+                if entry.error is not None:
+                    self.negative_hits += 1
+                else:
+                    self.hits += 1
+                return entry
+
+            if entry.error is None and entry.is_servable(now):
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                self._schedule_refresh(key, ttl, fetch)
+                return entry
+
+        self.misses += 1
+        return await self._fetch_and_store(key, ttl, fetch)
+
+    async def invalidate(self, prefix: str) -> int:
+        removed = self.invalidate_prefix(prefix)
+        if self.backend is not None:
+            try:
+                await self.backend.delete_prefix(prefix)
+                await self.backend.publish_invalidation(prefix)
+            except Exception as exc:
+                self.shared_errors += 1
+                logger.warning("Shared cache invalidation failed for %s: %s", prefix, exc)
+        return removed
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        prefix = prefix.rstrip("/")
+        self._generation += 1
+        keys = [key for key in self._entries if matches_prefix(key, prefix)]
+        for key in keys:
+            self._delete(key)
+        return len(keys)
+
+    async def write_through(
+        self,
+        resource: str,
+        item_id: Any,
+        changes: Mapping[str, Any],
+        *,
+        detail_key: Optional[str] = None,
+        detail_value: Any = None,
+        last_modified: Optional[str] = None,
+    ) -> int:
+        self._generation += 1
+        updated: Dict[str, CacheEntry] = {}
+        for key in list(self._entries):
+            if is_list_key(key, resource) and is_filtered_list_key(key):
+                self._delete(key)
+        for key in list(self._pages_by_item.get((resource, item_id), ())):
+            entry = self._entries[key]
+            if entry.error is None:
+                updated[key] = replace(
+                    entry,
+                    value=patch_list_items(entry.value, item_id, changes),
+                    last_modified=None,
+                )
+
+        if detail_key is not None:
+            ttl = self.policy.ttl_for(detail_key)
+            if ttl > 0:
+                updated[detail_key] = CacheEntry(
+                    value=detail_value,
+                    stored_at=time.time(),
+                    ttl=ttl,
+                    stale_ttl=self._stale_ttl,
+                    last_modified=last_modified,
+                )
+            elif detail_key in self._entries:
+                self._delete(detail_key)
+
+        for key, entry in updated.items():
+            self._store(key, entry)
+        self.write_throughs += len(updated)
+
+        if self.backend is not None:
+            try:
+                await self.backend.delete_prefix(resource)
+                for key, entry in updated.items():
+                    await self.backend.set(key, entry)
+                await self.backend.publish_invalidation(resource)
+            except Exception as exc:
+                self.shared_errors += 1
+                logger.warning("Shared cache write-through failed for %s: %s", resource, exc)
+        return len(updated)
+
+    def start(self) -> None:
+        if self.backend is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self.backend is not None:
+            await self.backend.close()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._pages_by_item.clear()
+
+    def stats(self) -> CacheStats:
+        lookups = self.hits + self.stale_hits + self.negative_hits + self.misses
+        served = self.hits + self.stale_hits + self.negative_hits
+        return CacheStats(
+            size=len(self._entries),
+            max_entries=self._max_entries,
+            hits=self.hits,
+            misses=self.misses,
+            stale_hits=self.stale_hits,
+            negative_hits=self.negative_hits,
+            evictions=self.evictions,
+            refreshes=self.refreshes,
+            write_throughs=self.write_throughs,
+            hit_ratio=round(served / lookups, 4) if lookups else 0.0,
+            backend=self.backend.name if self.backend is not None else "memory",
+            shared_hits=self.shared_hits,
+            shared_errors=self.shared_errors,
+            remote_invalidations=self.remote_invalidations,
+        )
+
+    async def _fetch_and_store(self, key: str, ttl: float, fetch: Fetcher) -> CacheEntry:
+        generation = self._generation
+        version = await self._shared_version(key)
+        try:
+            value, latency_ms, last_modified = await fetch()
+        except Exception as exc:
+            if getattr(exc, "status_code", None) != 404 or self._negative_ttl <= 0:
+                raise
+            entry = CacheEntry(
+                value=None,
+                stored_at=time.time(),
+                ttl=self._negative_ttl,
+                stale_ttl=0.0,
+                error=exc,
+            )
+            await self._store_fetched(key, entry, generation, version)
+            return entry
+
+        entry = CacheEntry(
+            value=value,
+            stored_at=time.time(),
+            ttl=ttl,
+            stale_ttl=self._stale_ttl,
+            latency_ms=latency_ms,
+            last_modified=last_modified,
+        )
+        await self._store_fetched(key, entry, generation, version)
+        return entry
+
+    async def _store_fetched(self, key: str, entry: CacheEntry, generation: int, version: Optional[int]) -> None:
+        if generation != self._generation:
+            return
+        if self.backend is not None:
+            try:
+                stored = await self.backend.set(key, entry, expected_version=version)
+            except Exception as exc:
+                self.shared_errors += 1
+                logger.warning("Shared cache write failed for %s: %s", key, exc)
+                stored = True
+            if not stored or generation != self._generation:
+                return
+        self._store(key, entry)
+
+    async def _shared_version(self, key: str) -> Optional[int]:
+        if self.backend is None:
+            return None
+        try:
+            return await self.backend.resource_version(resource_of(key))
+        except Exception as exc:
+            self.shared_errors += 1
+            logger.warning("Shared cache version read failed for %s: %s", key, exc)
+            return None
+
+    async def _load_shared(self, key: str) -> Optional[CacheEntry]:
+        try:
+            return await self.backend.get(key)  # type: ignore[union-attr]
+        except Exception as exc:
+            self.shared_errors += 1
+            logger.warning("Shared cache read failed for %s: %s", key, exc)
+            return None
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        previous = self._entries.get(key)
+        if previous is not None:
+            self._unindex(key, previous)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._index(key, entry)
+        while len(self._entries) > self._max_entries:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._unindex(evicted_key, evicted)
+            self.evictions += 1
+
+    def _delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._unindex(key, entry)
+
+    def _index(self, key: str, entry: CacheEntry) -> None:
+        resource = key.partition("?")[0]
+        if resource.count("/") != 1:
+            return
+        for item_id in list_item_ids(entry.value):
+            self._pages_by_item.setdefault((resource, item_id), set()).add(key)
+
+    def _unindex(self, key: str, entry: CacheEntry) -> None:
+        resource = key.partition("?")[0]
+        if resource.count("/") != 1:
+            return
+        for item_id in list_item_ids(entry.value):
+            pages = self._pages_by_item.get((resource, item_id))
+            if pages is not None:
+                pages.discard(key)
+                if not pages:
+                    del self._pages_by_item[(resource, item_id)]
+
+    def _schedule_refresh(self, key: str, ttl: float, fetch: Fetcher) -> None:
+        if key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._fetch_and_store(key, ttl, fetch)
+                self.refreshes += 1
+            except Exception as exc:
+                logger.warning("Background cache refresh failed for %s: %s", key, exc)
+
+        task = asyncio.create_task(refresh())
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async for prefix in self.backend.invalidations():  # type: ignore[union-attr]
+                    self.invalidate_prefix(prefix)
+                    self.remote_invalidations += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.shared_errors += 1
+                logger.warning("Cache invalidation listener failed: %s", exc)
+                await asyncio.sleep(1.0)
+
+
+@lru_cache()
+def get_response_cache() -> ResponseCache:
+    settings = get_settings()
+    return ResponseCache(
+        policy=TTLPolicy(settings.cache_ttl_policy, default_ttl=settings.cache_default_ttl),
+        max_entries=settings.cache_max_entries,
+        stale_ttl=settings.cache_stale_ttl,
+        negative_ttl=settings.cache_negative_ttl,
+        backend=create_cache_backend(settings),
+    )
@@ -1,12 +1,45 @@
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
 
 import httpx
 
+from ..core.tracing import inject_trace_headers, span
+from ..metrics import (
+    path_template,
+    upstream_request_duration_seconds,
+    upstream_requests_total,
+    upstream_response_bytes_total,
+    upstream_retries_total,
+)
+from .resilience import CIRCUIT_FAILURE_STATUSES, CircuitBreaker, RetryBudget, RetryPolicy
+from .transport import PoolStats, PooledTransport
+
 logger = logging.getLogger(__name__)
 
+COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+
+@dataclass
+class SingleFlightStats:
+    leaders: int
+    followers: int
+    in_flight: int
+    coalescing_ratio: float
+
+
+@dataclass
+class ResilienceStats:
+    retries: int
+    retry_budget_balance: float
+    retry_budget_exhausted: int
+    circuit_state: str
+    circuit_opened: int
+    circuit_rejected: int
+
 
 class RemnaWaveAdminAPIClient:
     def __init__(
@@ -15,14 +48,27 @@ class RemnaWaveAdminAPIClient:
         token: str,
         timeout: float = 10.0,
         retries: int = 3,
+        *,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
+        self._transport = transport
         self._client = httpx.AsyncClient(
             base_url=base_url,
             headers={"X-API-Key": token} if token else {},
             timeout=timeout,
+            transport=transport,
         )
-        self._retries = max(retries, 1)
+        self._retry_policy = retry_policy or RetryPolicy(max_attempts=max(retries, 1))
+        self._retry_budget = retry_budget or RetryBudget()
+        self._circuit = circuit_breaker or CircuitBreaker()
+        self._retried = 0
         self._timeout = timeout
+        self._in_flight: Dict[Hashable, "asyncio.Task[httpx.Response]"] = {}
+        self._leaders = 0
+        self._followers = 0
 
     async def request(
         self,
@@ -31,32 +77,140 @@ class RemnaWaveAdminAPIClient:
         *,
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> httpx.Response:
+        method = method.upper()
+        if method not in COALESCED_METHODS or json is not None or headers:
+            return await self._send(method, path, params=params, json=json, headers=headers)
+
+        key = self._flight_key(method, path, params)
+        task = self._in_flight.get(key)
+        if task is None:
+            self._leaders += 1
+            task = asyncio.ensure_future(self._send(method, path, params=params))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda finished: self._finish_flight(key, finished))
+        else:
+            self._followers += 1
+
+        # Shielded so that a cancelled waiter does not cancel the call shared with the others.
+        return await asyncio.shield(task)
+
+    def singleflight_stats(self) -> SingleFlightStats:
+        total = self._leaders + self._followers
+        return SingleFlightStats(
+            leaders=self._leaders,
+            followers=self._followers,
+            in_flight=len(self._in_flight),
+            coalescing_ratio=round(self._followers / total, 4) if total else 0.0,
+        )
+
+    def _finish_flight(self, key: Hashable, task: "asyncio.Task[httpx.Response]") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    @staticmethod
+    def _flight_key(method: str, path: str, params: Optional[Dict[str, Any]]) -> Tuple[Any, ...]:
+        frozen = tuple(sorted((key, str(value)) for key, value in (params or {}).items()))
+        return method, path, frozen
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        idempotent = self._retry_policy.allows_method(method, headers)
+        template = path_template(path)
+        self._retry_budget.record_request()
         attempt = 0
-        backoff = 0.5
         while True:
-            try:
-                response = await self._client.request(
-                    method=method,
-                    url=path,
-                    params=params,
-                    json=json,
-                )
-                response.raise_for_status()
-                return response
-            except (httpx.HTTPStatusError, httpx.TransportError) as exc:
-                attempt += 1
-                if attempt >= self._retries:
-                    logger.exception("RemnaWave API request failed: %s", exc)
+            attempt += 1
+            self._circuit.before_call()
+            response: Optional[httpx.Response] = None
+            started = time.perf_counter()
+            attributes = {"http.method": method, "http.route": template, "retry.attempt": attempt}
+            with span(f"remnawave {method} {template}", attributes, kind="client") as current:
+                request_headers = dict(headers or {})
+                inject_trace_headers(request_headers)
+                try:
+                    response = await self._client.request(
+                        method=method,
+                        url=path,
+                        params=params,
+                        json=json,
+                        headers=request_headers or None,
+                    )
+                    if current is not None:
+                        current.set_attribute("http.status_code", response.status_code)
+                    self._record_outcome(method, template, started, str(response.status_code))
+                    self._record_transfer(response)
+                    response.raise_for_status()
+                    return response
+                except httpx.HTTPStatusError as exc:
+                    error: httpx.HTTPError = exc
+                except httpx.TransportError as exc:
+                    self._record_outcome(method, template, started, type(exc).__name__)
+                    error = exc
+                except asyncio.CancelledError:
+                    self._circuit.release()
+                    raise
+                except Exception as exc:
+                    if response is None:
+                        self._record_outcome(method, template, started, type(exc).__name__)
                     raise
-                logger.warning(
-                    "RemnaWave API request error (attempt %s/%s): %s",
-                    attempt,
-                    self._retries,
-                    exc,
-                )
-                await asyncio.sleep(backoff)
-                backoff = min(backoff * 2, 5.0)
+
+            if not self._retry_policy.is_retryable(error, idempotent):
+                raise error
+            delay = self._retry_policy.delay(attempt, response)
+            if attempt >= self._retry_policy.max_attempts or delay is None or not self._retry_budget.try_spend():
+                logger.warning("RemnaWave API request failed after %s attempt(s): %s", attempt, error)
+                raise error
+
+            self._retried += 1
+            upstream_retries_total.inc((method, template))
+            logger.warning(
+                "RemnaWave API request error, retrying in %.2fs (attempt %s/%s): %s",
+                delay,
+                attempt,
+                self._retry_policy.max_attempts,
+                error,
+            )
+            await asyncio.sleep(delay)
+
+    def _record_outcome(self, method: str, template: str, started: float, status: str) -> None:
+        upstream_request_duration_seconds.observe((method, template), time.perf_counter() - started)
+        upstream_requests_total.inc((method, template, status))
+        if not status.isdigit() or int(status) in CIRCUIT_FAILURE_STATUSES:
+            self._circuit.record_failure()
+        else:
+            self._circuit.record_success()
+
+    @staticmethod
+    def _record_transfer(response: httpx.Response) -> None:
+        encoding = response.headers.get("content-encoding", "identity")
+        upstream_response_bytes_total.inc((encoding, "wire"), response.num_bytes_downloaded)
+        upstream_response_bytes_total.inc((encoding, "raw"), len(response.content))
+
+    def resilience_stats(self) -> ResilienceStats:
+        return ResilienceStats(
+            retries=self._retried,
+            retry_budget_balance=round(self._retry_budget.balance, 2),
+            retry_budget_exhausted=self._retry_budget.exhausted,
+            circuit_state=self._circuit.state,
+            circuit_opened=self._circuit.opened,
+            circuit_rejected=self._circuit.rejected,
+        )
+
+    def pool_stats(self) -> Optional[PoolStats]:
+        if isinstance(self._transport, PooledTransport):
+            return self._transport.stats()
+        return None
 
     async def close(self) -> None:
         await self._client.aclose()
@@ -0,0 +1,145 @@
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+import httpx
+
+RETRYABLE_STATUSES = frozenset({408, 429, 502, 503, 504})
+CIRCUIT_FAILURE_STATUSES = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class CircuitOpenError(httpx.TransportError):
+    pass
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 3
+    backoff_base: float = 0.2
+    backoff_max: float = 5.0
+    max_retry_after: float = 30.0
+
+    def allows_method(self, method: str, headers: Optional[Mapping[str, str]] = None) -> bool:
+        if method in IDEMPOTENT_METHODS:
+            return True
+        return any(name.lower() == IDEMPOTENCY_KEY_HEADER.lower() for name in headers or {})
+
+    def is_retryable(self, exc: Exception, idempotent: bool) -> bool:
+        if isinstance(exc, CircuitOpenError):
+            return False
+        if isinstance(exc, httpx.HTTPStatusError):
+            return idempotent and exc.response.status_code in RETRYABLE_STATUSES
+        if isinstance(exc, NOT_SENT_ERRORS):
+            return True
+        return idempotent and isinstance(exc, httpx.TransportError)
+
+    def delay(self, attempt: int, response: Optional[httpx.Response] = None) -> Optional[float]:
+        retry_after = parse_retry_after(response.headers.get("retry-after")) if response is not None else None
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_retry_after else None
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def write_not_applied(exc: BaseException) -> bool:
+    if isinstance(exc, (CircuitOpenError, *NOT_SENT_ERRORS)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        response = exc.response
+        return response.status_code == 429 or (response.status_code == 503 and "retry-after" in response.headers)
+    return False
+
+
+class RetryBudget:
+    def __init__(self, *, ratio: float = 0.2, min_per_second: float = 1.0, capacity: float = 10.0) -> None:
+        self._ratio = ratio
+        self._min_per_second = min_per_second
+        self._capacity = max(capacity, 1.0)
+        self._balance = self._capacity
+        self._updated_at = time.monotonic()
+        self.exhausted = 0
+
+    def record_request(self) -> None:
+        self._refill()
+        self._balance = min(self._balance + self._ratio, self._capacity)
+
+    def try_spend(self) -> bool:
+        self._refill()
+        if self._balance >= 1.0:
+            self._balance -= 1.0
+            return True
+        self.exhausted += 1
+        return False
+
+    @property
+    def balance(self) -> float:
+        self._refill()
+        return self._balance
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._balance = min(self._balance + elapsed * self._min_per_second, self._capacity)
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, *, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+        self._failure_threshold = max(failure_threshold, 1)
+        self._recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.state = self.CLOSED
+        self.opened = 0
+        self.rejected = 0
+
+    def before_call(self) -> None:
+        if self.state == self.CLOSED:
+            return
+        if self.state == self.OPEN and time.monotonic() - self._opened_at >= self._recovery_timeout:
+            self.state = self.HALF_OPEN
+            self._probing = False
+        if self.state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+        self.rejected += 1
+        raise CircuitOpenError("RemnaWave API circuit is open, failing fast")
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probing = False
+        self.state = self.CLOSED
+
+    def release(self) -> None:
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._probing = False
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+            if self.state != self.OPEN:
+                self.opened += 1
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
@@ -0,0 +1,178 @@
+import asyncio
+import ipaddress
+import logging
+import socket
+import time
+import typing
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import httpcore
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    def __init__(self, ttl: float = 300.0, backend: Optional[httpcore.AsyncNetworkBackend] = None) -> None:
+        self._backend = backend or httpcore.AnyIOBackend()
+        self._ttl = ttl
+        self._cache: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self.lookups = 0
+        self.hits = 0
+        self.connects = 0
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[typing.Iterable[httpcore.SOCKET_OPTION]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        self.connects += 1
+        if self._ttl <= 0 or _is_ip_address(host):
+            return await self._backend.connect_tcp(
+                host,
+                port,
+                timeout=timeout,
+                local_address=local_address,
+                socket_options=socket_options,
+            )
+
+        addresses = await self._resolve(host, port)
+        last_exc: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                last_exc = exc
+
+        self._cache.pop((host, port), None)
+        assert last_exc is not None
+        raise last_exc
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[typing.Iterable[httpcore.SOCKET_OPTION]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+    async def _resolve(self, host: str, port: int) -> List[str]:
+        now = time.monotonic()
+        cached = self._cache.get((host, port))
+        if cached and cached[0] > now:
+            self.hits += 1
+            return cached[1]
+
+        self.lookups += 1
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except socket.gaierror as exc:
+            raise httpcore.ConnectError(str(exc)) from exc
+
+        addresses: List[str] = []
+        for _, _, _, _, sockaddr in infos:
+            address = str(sockaddr[0])
+            if address not in addresses:
+                addresses.append(address)
+
+        self._cache[(host, port)] = (now + self._ttl, addresses)
+        return addresses
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+@dataclass
+class PoolStats:
+    max_connections: Optional[int]
+    max_keepalive_connections: Optional[int]
+    keepalive_expiry: Optional[float]
+    http2: bool
+    connections: int
+    active_connections: int
+    idle_connections: int
+    http2_connections: int
+    connections_opened: int
+    requests: int
+    dns_lookups: int
+    dns_cache_hits: int
+
+
+class PooledTransport(httpx.AsyncHTTPTransport):
+    def __init__(
+        self,
+        *,
+        limits: httpx.Limits,
+        http2: bool = False,
+        dns_cache_ttl: float = 300.0,
+        verify: bool = True,
+    ) -> None:
+        if http2 and not http2_available():
+            logger.warning("HTTP/2 requested for RemnaWave API but 'h2' is not installed, falling back to HTTP/1.1")
+            http2 = False
+
+        super().__init__(verify=verify, limits=limits, http2=http2)
+
+        self._limits = limits
+        self._http2 = http2
+        self._network_backend = CachingDNSBackend(ttl=dns_cache_ttl)
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(verify=verify),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=self._network_backend,
+        )
+        self._requests = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._requests += 1
+        return await super().handle_async_request(request)
+
+    def stats(self) -> PoolStats:
+        connections = self._pool.connections
+        idle = sum(1 for connection in connections if connection.is_idle())
+        http2_connections = sum(1 for connection in connections if "HTTP/2" in connection.info())
+        return PoolStats(
+            max_connections=self._limits.max_connections,
+            max_keepalive_connections=self._limits.max_keepalive_connections,
+            keepalive_expiry=self._limits.keepalive_expiry,
+            http2=self._http2,
+            connections=len(connections),
+            active_connections=len(connections) - idle,
+            idle_connections=idle,
+            http2_connections=http2_connections,
+            connections_opened=self._network_backend.connects,
+            requests=self._requests,
+            dns_lookups=self._network_backend.lookups,
+            dns_cache_hits=self._network_backend.hits,
+        )
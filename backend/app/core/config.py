@@ -1,8 +1,9 @@
 from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
-from pydantic import AnyHttpUrl, BaseSettings, Field
+from pydantic import AnyHttpUrl, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -10,6 +11,12 @@ class Settings(BaseSettings):
     app_env: str = Field(default="development", alias="APP_ENV")
     host: str = Field(default="0.0.0.0", alias="BACKEND_HOST")
     port: int = Field(default=8080, alias="BACKEND_PORT")
+    backend_workers: int = Field(default=0, alias="BACKEND_WORKERS")
+    backend_max_requests: int = Field(default=10000, alias="BACKEND_MAX_REQUESTS")
+    backend_max_requests_jitter: int = Field(default=1000, alias="BACKEND_MAX_REQUESTS_JITTER")
+    backend_graceful_timeout: int = Field(default=30, alias="BACKEND_GRACEFUL_TIMEOUT")
+    backend_keepalive_timeout: int = Field(default=5, alias="BACKEND_KEEPALIVE_TIMEOUT")
+    backend_backlog: int = Field(default=2048, alias="BACKEND_BACKLOG")
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
 
     remnawave_api_base_url: AnyHttpUrl = Field(
@@ -18,20 +25,108 @@ class Settings(BaseSettings):
     remnawave_api_token: str = Field(default="", alias="REMNAWAVE_API_TOKEN")
     remnawave_api_timeout: float = Field(default=10.0, alias="REMNAWAVE_API_TIMEOUT")
     remnawave_api_retries: int = Field(default=3, alias="REMNAWAVE_API_RETRIES")
+    remnawave_retry_backoff_base: float = Field(default=0.2, alias="REMNAWAVE_RETRY_BACKOFF_BASE")
+    remnawave_retry_backoff_max: float = Field(default=5.0, alias="REMNAWAVE_RETRY_BACKOFF_MAX")
+    remnawave_retry_budget_ratio: float = Field(default=0.2, alias="REMNAWAVE_RETRY_BUDGET_RATIO")
+    remnawave_retry_budget_min_per_second: float = Field(default=1.0, alias="REMNAWAVE_RETRY_BUDGET_MIN_PER_SECOND")
+    remnawave_circuit_failure_threshold: int = Field(default=5, alias="REMNAWAVE_CIRCUIT_FAILURE_THRESHOLD")
+    remnawave_circuit_recovery_timeout: float = Field(default=30.0, alias="REMNAWAVE_CIRCUIT_RECOVERY_TIMEOUT")
+    remnawave_pool_max_connections: int = Field(default=100, alias="REMNAWAVE_POOL_MAX_CONNECTIONS")
+    remnawave_pool_max_keepalive: int = Field(default=20, alias="REMNAWAVE_POOL_MAX_KEEPALIVE")
+    remnawave_pool_keepalive_expiry: float = Field(default=30.0, alias="REMNAWAVE_POOL_KEEPALIVE_EXPIRY")
+    remnawave_http2: bool = Field(default=False, alias="REMNAWAVE_HTTP2")
+    remnawave_dns_cache_ttl: float = Field(default=300.0, alias="REMNAWAVE_DNS_CACHE_TTL")
+
+    cache_backend: str = Field(default="auto", alias="CACHE_BACKEND")
+    cache_sqlite_path: str = Field(default="data/cache.sqlite3", alias="CACHE_SQLITE_PATH")
+    cache_redis_url: str = Field(default="redis://localhost:6379/0", alias="CACHE_REDIS_URL")
+    cache_invalidation_poll_interval: float = Field(default=0.5, alias="CACHE_INVALIDATION_POLL_INTERVAL")
+    cache_max_entries: int = Field(default=1024, alias="CACHE_MAX_ENTRIES")
+    cache_default_ttl: float = Field(default=0.0, alias="CACHE_DEFAULT_TTL")
+    cache_stale_ttl: float = Field(default=30.0, alias="CACHE_STALE_TTL")
+    cache_negative_ttl: float = Field(default=5.0, alias="CACHE_NEGATIVE_TTL")
+    cache_ttl_policy: Dict[str, float] = Field(
+        default_factory=lambda: {
+            "/health": 15.0,
+            "/stats": 60.0,
+            "/users": 10.0,
+            "/subscriptions": 10.0,
+            "/tokens": 10.0,
+        },
+        alias="CACHE_TTL_POLICY",
+    )
+    cache_control_policy: Dict[str, str] = Field(
+        default_factory=lambda: {
+            "health": "private, no-cache",
+            "dashboard": "private, max-age=10",
+            "stats": "private, max-age=30",
+            "users": "private, no-cache",
+            "subscriptions": "private, no-cache",
+            "tokens": "private, no-store",
+            "profiles": "private, no-store",
+        },
+        alias="CACHE_CONTROL_POLICY",
+    )
+
+    pagination_page_size: int = Field(default=200, alias="PAGINATION_PAGE_SIZE")
+    pagination_min_page_size: int = Field(default=50, alias="PAGINATION_MIN_PAGE_SIZE")
+    pagination_max_page_size: int = Field(default=1000, alias="PAGINATION_MAX_PAGE_SIZE")
+    pagination_concurrency: int = Field(default=4, alias="PAGINATION_CONCURRENCY")
+    pagination_target_latency_ms: float = Field(default=1000.0, alias="PAGINATION_TARGET_LATENCY_MS")
+    live_stats_interval: float = Field(default=5.0, alias="LIVE_STATS_INTERVAL")
+    live_stats_max_pending: int = Field(default=8, alias="LIVE_STATS_MAX_PENDING")
+    live_stats_heartbeat: float = Field(default=15.0, alias="LIVE_STATS_HEARTBEAT")
+    dashboard_section_timeout: float = Field(default=3.0, alias="DASHBOARD_SECTION_TIMEOUT")
+    batch_concurrency: int = Field(default=10, alias="BATCH_CONCURRENCY")
+    bulk_concurrency: int = Field(default=5, alias="BULK_CONCURRENCY")
+    bulk_rate_limit: float = Field(default=20.0, alias="BULK_RATE_LIMIT")
+    bulk_max_retries: int = Field(default=2, alias="BULK_MAX_RETRIES")
+
+    read_model_enabled: bool = Field(default=False, alias="READ_MODEL_ENABLED")
+    read_model_path: str = Field(default="data/read_model.sqlite3", alias="READ_MODEL_PATH")
+    read_model_sync_interval: float = Field(default=60.0, alias="READ_MODEL_SYNC_INTERVAL")
+    read_model_max_staleness: float = Field(default=180.0, alias="READ_MODEL_MAX_STALENESS")
+    search_index_enabled: bool = Field(default=False, alias="SEARCH_INDEX_ENABLED")
+    search_index_refresh_interval: float = Field(default=300.0, alias="SEARCH_INDEX_REFRESH_INTERVAL")
+    search_index_snapshot_path: str = Field(default="data/search_index.json", alias="SEARCH_INDEX_SNAPSHOT_PATH")
 
     admin_jwt_secret: str = Field(default="dev-secret-change-me", alias="ADMIN_JWT_SECRET")
     admin_jwt_algorithm: str = Field(default="HS256", alias="ADMIN_JWT_ALGORITHM")
     admin_jwt_expires_minutes: int = Field(default=60, alias="ADMIN_JWT_EXPIRES_MINUTES")
+    admin_jwt_private_key: str = Field(default="", alias="ADMIN_JWT_PRIVATE_KEY")
+    admin_jwt_public_key: str = Field(default="", alias="ADMIN_JWT_PUBLIC_KEY")
+    admin_jwt_cache_size: int = Field(default=1024, alias="ADMIN_JWT_CACHE_SIZE")
 
     allowed_origins: List[AnyHttpUrl] = Field(default_factory=list, alias="WEB_API_ALLOWED_ORIGINS")
 
+    compression_enabled: bool = Field(default=True, alias="COMPRESSION_ENABLED")
+    compression_encodings: str = Field(default="zstd,br,gzip", alias="COMPRESSION_ENCODINGS")
+    compression_minimum_size: int = Field(default=1024, alias="COMPRESSION_MINIMUM_SIZE")
+    compression_gzip_level: int = Field(default=1, alias="COMPRESSION_GZIP_LEVEL")
+    compression_brotli_quality: int = Field(default=4, alias="COMPRESSION_BROTLI_QUALITY")
+    compression_zstd_level: int = Field(default=3, alias="COMPRESSION_ZSTD_LEVEL")
+
+    metrics_enabled: bool = Field(default=True, alias="METRICS_ENABLED")
+    metrics_token: str = Field(default="", alias="METRICS_TOKEN")
+    metrics_role: str = Field(default="metrics", alias="METRICS_ROLE")
+    metrics_multiprocess_dir: str = Field(default="data/metrics", alias="METRICS_MULTIPROCESS_DIR")
+
+    profiling_enabled: bool = Field(default=False, alias="PROFILING_ENABLED")
+    profiling_role: str = Field(default="profiler", alias="PROFILING_ROLE")
+    profiling_interval: float = Field(default=0.001, alias="PROFILING_INTERVAL")
+    profiling_max_profiles: int = Field(default=20, alias="PROFILING_MAX_PROFILES")
+
     sentry_dsn: str = Field(default="", alias="SENTRY_DSN")
     otel_exporter_otlp_endpoint: str = Field(default="", alias="OTEL_EXPORTER_OTLP_ENDPOINT")
+    otel_service_name: str = Field(default="bedolaga-admin-bff", alias="OTEL_SERVICE_NAME")
+    otel_traces_sampler_ratio: float = Field(default=1.0, alias="OTEL_TRACES_SAMPLER_RATIO")
 
-    class Config:
-        env_file = Path(__file__).resolve().parents[3] / ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        env_file=Path(__file__).resolve().parents[3] / ".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
 
 
 @lru_cache()
@@ -0,0 +1,117 @@
+import logging
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, MutableMapping, Optional
+
+logger = logging.getLogger(__name__)
+
+MEMORY_EXPORTER = "memory"
+
+_NOOP_SPAN: ContextManager[Any] = nullcontext()
+_tracer: Any = None
+_provider: Any = None
+_memory_exporter: Any = None
+_span_kinds: Dict[str, Any] = {}
+
+
+def tracing_available() -> bool:
+    try:
+        import opentelemetry.sdk.trace  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def configure_tracing(
+    endpoint: str,
+    *,
+    service_name: str,
+    sample_ratio: float = 1.0,
+) -> bool:
+    global _tracer, _provider, _memory_exporter, _span_kinds
+
+    shutdown_tracing()
+    if not endpoint:
+        return False
+    if not tracing_available():
+        logger.warning("OTEL_EXPORTER_OTLP_ENDPOINT is set but opentelemetry-sdk is not installed, tracing disabled")
+        return False
+
+    if endpoint != MEMORY_EXPORTER:
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError:
+            logger.warning("opentelemetry-exporter-otlp-proto-http is not installed, tracing disabled")
+            return False
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    from opentelemetry.trace import SpanKind
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBased(TraceIdRatioBased(min(max(sample_ratio, 0.0), 1.0))),
+    )
+    if endpoint == MEMORY_EXPORTER:
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+        _memory_exporter = InMemorySpanExporter()
+        provider.add_span_processor(SimpleSpanProcessor(_memory_exporter))
+    else:
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=_traces_url(endpoint))))
+
+    _span_kinds = {"server": SpanKind.SERVER, "client": SpanKind.CLIENT, "internal": SpanKind.INTERNAL}
+    _provider = provider
+    _tracer = provider.get_tracer("bedolaga-admin-bff")
+    return True
+
+
+def shutdown_tracing() -> None:
+    global _tracer, _provider, _memory_exporter
+
+    if _provider is not None:
+        _provider.shutdown()
+    _tracer = None
+    _provider = None
+    _memory_exporter = None
+
+
+def tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def get_memory_exporter() -> Any:
+    return _memory_exporter
+
+
+def span(name: str, attributes: Optional[Dict[str, Any]] = None, *, kind: Optional[str] = None) -> ContextManager[Any]:
+    if _tracer is None:
+        return _NOOP_SPAN
+    return _tracer.start_as_current_span(name, attributes=attributes, kind=_span_kinds[kind or "internal"])
+
+
+def server_span(name: str, carrier: MutableMapping[str, str], attributes: Dict[str, Any]) -> ContextManager[Any]:
+    if _tracer is None:
+        return _NOOP_SPAN
+    from opentelemetry.propagate import extract
+
+    return _tracer.start_as_current_span(
+        name,
+        context=extract(carrier),
+        kind=_span_kinds["server"],
+        attributes=attributes,
+    )
+
+
+def inject_trace_headers(headers: MutableMapping[str, str]) -> None:
+    if _tracer is None:
+        return
+    from opentelemetry.propagate import inject
+
+    inject(headers)
+
+
+def _traces_url(endpoint: str) -> str:
+    endpoint = endpoint.rstrip("/")
+    return endpoint if endpoint.endswith("/v1/traces") else f"{endpoint}/v1/traces"
@@ -0,0 +1,7 @@
+from fastapi import Request
+
+from ..live import LiveStatsBroadcaster
+
+
+def live_stats_dependency(request: Request) -> LiveStatsBroadcaster:
+    return request.app.state.live_stats
@@ -0,0 +1,9 @@
+from typing import Optional
+
+from fastapi import Request
+
+from ..metrics import WorkerMetrics
+
+
+def worker_metrics_dependency(request: Request) -> Optional[WorkerMetrics]:
+    return getattr(request.app.state, "worker_metrics", None)
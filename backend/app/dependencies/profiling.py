@@ -0,0 +1,10 @@
+from fastapi import HTTPException, Request, status
+
+from ..profiling import ProfileStore
+
+
+def profile_store_dependency(request: Request) -> ProfileStore:
+    store = getattr(request.app.state, "profile_store", None)
+    if store is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profiling is disabled")
+    return store
@@ -0,0 +1,9 @@
+from typing import Optional
+
+from fastapi import Request
+
+from ..readmodel import ReadModelStore
+
+
+def read_model_dependency(request: Request) -> Optional[ReadModelStore]:
+    return getattr(request.app.state, "read_model", None)
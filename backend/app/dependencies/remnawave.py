@@ -1,16 +1,42 @@
-from collections.abc import AsyncGenerator
+import httpx
+from fastapi import Request
 
 from ..clients.remnawave import RemnaWaveAdminAPIClient
-from ..core.config import get_settings
+from ..clients.resilience import CircuitBreaker, RetryBudget, RetryPolicy
+from ..clients.transport import PooledTransport
+from ..core.config import Settings
 
 
-async def remnawave_client_dependency() -> AsyncGenerator[RemnaWaveAdminAPIClient, None]:
-    settings = get_settings()
-
-    async with RemnaWaveAdminAPIClient(
+def create_remnawave_client(settings: Settings) -> RemnaWaveAdminAPIClient:
+    transport = PooledTransport(
+        limits=httpx.Limits(
+            max_connections=settings.remnawave_pool_max_connections,
+            max_keepalive_connections=settings.remnawave_pool_max_keepalive,
+            keepalive_expiry=settings.remnawave_pool_keepalive_expiry,
+        ),
+        http2=settings.remnawave_http2,
+        dns_cache_ttl=settings.remnawave_dns_cache_ttl,
+    )
+    return RemnaWaveAdminAPIClient(
         base_url=str(settings.remnawave_api_base_url),
         token=settings.remnawave_api_token,
         timeout=settings.remnawave_api_timeout,
-        retries=settings.remnawave_api_retries,
-    ) as client:
-        yield client
+        transport=transport,
+        retry_policy=RetryPolicy(
+            max_attempts=max(settings.remnawave_api_retries, 1),
+            backoff_base=settings.remnawave_retry_backoff_base,
+            backoff_max=settings.remnawave_retry_backoff_max,
+        ),
+        retry_budget=RetryBudget(
+            ratio=settings.remnawave_retry_budget_ratio,
+            min_per_second=settings.remnawave_retry_budget_min_per_second,
+        ),
+        circuit_breaker=CircuitBreaker(
+            failure_threshold=settings.remnawave_circuit_failure_threshold,
+            recovery_timeout=settings.remnawave_circuit_recovery_timeout,
+        ),
+    )
+
+
+def remnawave_client_dependency(request: Request) -> RemnaWaveAdminAPIClient:
+    return request.app.state.remnawave_client
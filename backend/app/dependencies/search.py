@@ -0,0 +1,13 @@
+from typing import Optional
+
+from fastapi import Request
+
+from ..search import SearchIndex
+
+
+def user_search_index_dependency(request: Request) -> Optional[SearchIndex]:
+    return getattr(request.app.state, "user_search_index", None)
+
+
+def token_search_index_dependency(request: Request) -> Optional[SearchIndex]:
+    return getattr(request.app.state, "token_search_index", None)
@@ -0,0 +1,3 @@
+from .broadcaster import LiveEvent, LiveStatsBroadcaster, LiveSubscription, merge_patch
+
+__all__ = ["LiveEvent", "LiveStatsBroadcaster", "LiveSubscription", "merge_patch"]
@@ -0,0 +1,141 @@
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Set
+
+from ..clients.remnawave import RemnaWaveAdminAPIClient
+from ..services.health import HealthService
+from ..services.stats import StatsService
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def merge_patch(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    patch: Dict[str, Any] = {key: None for key in previous.keys() - current.keys()}
+    for key, value in current.items():
+        old = previous.get(key, _MISSING)
+        if isinstance(value, dict) and isinstance(old, dict):
+            nested = merge_patch(old, value)
+            if nested:
+                patch[key] = nested
+        elif old is _MISSING or old != value:
+            patch[key] = value
+    return patch
+
+
+@dataclass(frozen=True)
+class LiveEvent:
+    event: str
+    version: int
+    data: Dict[str, Any]
+
+    def encode(self) -> bytes:
+        payload = json.dumps(self.data, ensure_ascii=False, separators=(",", ":"))
+        return f"id: {self.version}\nevent: {self.event}\ndata: {payload}\n\n".encode("utf-8")
+
+
+class LiveSubscription:
+    def __init__(self, max_pending: int) -> None:
+        self._queue: "asyncio.Queue[LiveEvent]" = asyncio.Queue(maxsize=max(max_pending, 1))
+        self.dropped = 0
+
+    def offer(self, event: LiveEvent, snapshot: Callable[[], LiveEvent]) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+                self.dropped += 1
+            self._queue.put_nowait(snapshot())
+
+    async def next(self, timeout: float) -> Optional[LiveEvent]:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class LiveStatsBroadcaster:
+    def __init__(
+        self,
+        client: RemnaWaveAdminAPIClient,
+        *,
+        interval: float,
+        max_pending: int,
+    ) -> None:
+        self._client = client
+        self._interval = interval
+        self._max_pending = max_pending
+        self._subscribers: Set[LiveSubscription] = set()
+        self._snapshot: Dict[str, Any] = {}
+        self._version = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[LiveSubscription]:
+        subscription = LiveSubscription(self._max_pending)
+        if self._snapshot:
+            subscription.offer(self._snapshot_event(), self._snapshot_event)
+        self._subscribers.add(subscription)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        try:
+            yield subscription
+        finally:
+            self._subscribers.discard(subscription)
+            if not self._subscribers and self._task is not None:
+                self._task.cancel()
+                self._task = None
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def refresh(self) -> None:
+        health, stats = await asyncio.gather(
+            HealthService(self._client).get_health(),
+            StatsService(self._client).get_overview(),
+            return_exceptions=True,
+        )
+        snapshot = dict(self._snapshot)
+        for name, result in (("health", health), ("stats", stats)):
+            if isinstance(result, Exception):
+                logger.warning("Live stats refresh failed for %s: %s", name, result)
+                continue
+            snapshot[name] = result.model_dump(mode="json")
+
+        patch = merge_patch(self._snapshot, snapshot)
+        if not patch:
+            return
+        self._snapshot = snapshot
+        self._version += 1
+        event = LiveEvent("patch", self._version, patch)
+        for subscription in list(self._subscribers):
+            subscription.offer(event, self._snapshot_event)
+
+    def _snapshot_event(self) -> LiveEvent:
+        return LiveEvent("snapshot", self._version, self._snapshot)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Live stats poller failed: %s", exc)
+            await asyncio.sleep(self._interval)
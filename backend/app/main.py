@@ -1,11 +1,34 @@
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
+from .api.metrics import router as metrics_router
 from .api.router import api_router
+from .cache import get_response_cache
 from .core.config import get_settings
 from .core.logging import configure_logging
+from .core.tracing import configure_tracing, shutdown_tracing
+from .dependencies.remnawave import create_remnawave_client
+from .live import LiveStatsBroadcaster
+from .profiling import ProfileStore, profiler_available
+from .readmodel import ReadModelStore
+from .readmodel.syncer import ReadModelSyncer
+from .metrics import EventLoopMonitor, WorkerMetrics, registry
+from .metrics.collectors import runtime_collector
 from .middleware.audit import AuditMiddleware
+from .middleware.compression import CompressionMiddleware
 from .middleware.correlation import CorrelationIdMiddleware
+from .middleware.metrics import MetricsMiddleware
+from .middleware.profiling import ProfilingMiddleware
+from .middleware.tracing import TracingMiddleware
+from .search import SearchIndex
+from .search.indexer import SearchIndexer
+from .utils.compression import available_encodings
+
+logger = logging.getLogger(__name__)
 
 
 def create_app() -> FastAPI:
@@ -13,26 +36,132 @@ def create_app() -> FastAPI:
 
     configure_logging(settings.log_level)
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        configure_tracing(
+            settings.otel_exporter_otlp_endpoint,
+            service_name=settings.otel_service_name,
+            sample_ratio=settings.otel_traces_sampler_ratio,
+        )
+        leader = getattr(app.state, "worker_slot", 0) == 0
+        shared = getattr(app.state, "worker_count", 1) > 1
+        app.state.remnawave_client = create_remnawave_client(settings)
+        get_response_cache().start()
+        loop_monitor = EventLoopMonitor()
+        collector = runtime_collector(app.state.remnawave_client, get_response_cache(), loop_monitor)
+        if settings.metrics_enabled:
+            loop_monitor.start()
+            registry.add_collector(collector)
+            if shared:
+                app.state.worker_metrics = WorkerMetrics(
+                    registry,
+                    settings.metrics_multiprocess_dir,
+                    slot=app.state.worker_slot,
+                    workers=app.state.worker_count,
+                )
+                app.state.worker_metrics.start()
+        app.state.live_stats = LiveStatsBroadcaster(
+            app.state.remnawave_client,
+            interval=settings.live_stats_interval,
+            max_pending=settings.live_stats_max_pending,
+        )
+        syncer = None
+        if settings.read_model_enabled:
+            app.state.read_model = ReadModelStore(settings.read_model_path, syncing=leader)
+            if leader:
+                syncer = ReadModelSyncer(
+                    app.state.remnawave_client,
+                    app.state.read_model,
+                    interval=settings.read_model_sync_interval,
+                )
+                syncer.start()
+        indexer = None
+        if settings.search_index_enabled:
+            app.state.user_search_index = SearchIndex()
+            app.state.token_search_index = SearchIndex(store_documents=True)
+            indexer = SearchIndexer(
+                app.state.remnawave_client,
+                users=app.state.user_search_index,
+                tokens=app.state.token_search_index,
+                interval=settings.search_index_refresh_interval,
+                snapshot_path=settings.search_index_snapshot_path if shared else None,
+                leader=leader,
+            )
+            indexer.start()
+        try:
+            yield
+        finally:
+            registry.remove_collector(collector)
+            await loop_monitor.stop()
+            if getattr(app.state, "worker_metrics", None):
+                await app.state.worker_metrics.stop()
+            await app.state.live_stats.stop()
+            if indexer:
+                await indexer.stop()
+            if syncer:
+                await syncer.stop()
+            if settings.read_model_enabled:
+                app.state.read_model.close()
+            await app.state.remnawave_client.close()
+            await get_response_cache().stop()
+            shutdown_tracing()
+
     app = FastAPI(
         title=settings.app_name,
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        lifespan=lifespan,
     )
 
     if settings.allowed_origins:
         app.add_middleware(
             CORSMiddleware,
-            allow_origins=[str(origin) for origin in settings.allowed_origins],
+            allow_origins=[str(origin).rstrip("/") for origin in settings.allowed_origins],
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
         )
 
-    app.add_middleware(CorrelationIdMiddleware)
     app.add_middleware(AuditMiddleware)
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+    if settings.otel_exporter_otlp_endpoint:
+        app.add_middleware(TracingMiddleware)
+    if settings.profiling_enabled:
+        if profiler_available():
+            app.state.profile_store = ProfileStore(settings.profiling_max_profiles)
+            app.add_middleware(
+                ProfilingMiddleware,
+                store=app.state.profile_store,
+                role=settings.profiling_role,
+                interval=settings.profiling_interval,
+            )
+        else:
+            logger.warning("PROFILING_ENABLED is set but pyinstrument is not installed, profiling disabled")
+    if settings.compression_enabled:
+        configured = [encoding.strip() for encoding in settings.compression_encodings.split(",") if encoding.strip()]
+        encodings = available_encodings(configured)
+        if len(encodings) < len(configured):
+            logger.warning(
+                "COMPRESSION_ENCODINGS lists %s but the encoder package is not installed, skipping",
+                ", ".join(encoding for encoding in configured if encoding not in encodings),
+            )
+        app.add_middleware(
+            CompressionMiddleware,
+            encodings=encodings,
+            levels={
+                "gzip": settings.compression_gzip_level,
+                "br": settings.compression_brotli_quality,
+                "zstd": settings.compression_zstd_level,
+            },
+            minimum_size=settings.compression_minimum_size,
+        )
+    app.add_middleware(CorrelationIdMiddleware)
 
     app.include_router(api_router, prefix="/api")
+    if settings.metrics_enabled:
+        app.include_router(metrics_router)
 
     return app
 
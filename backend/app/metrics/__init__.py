@@ -0,0 +1,34 @@
+from .instruments import (
+    http_compression_bytes_total,
+    http_compression_seconds_total,
+    http_request_duration_seconds,
+    http_requests_total,
+    path_template,
+    registry,
+    upstream_request_duration_seconds,
+    upstream_requests_total,
+    upstream_response_bytes_total,
+    upstream_retries_total,
+)
+from .loop import EventLoopMonitor
+from .multiprocess import WorkerMetrics
+from .registry import Counter, Histogram, MetricFamily, MetricsRegistry
+
+__all__ = [
+    "Counter",
+    "EventLoopMonitor",
+    "Histogram",
+    "MetricFamily",
+    "MetricsRegistry",
+    "WorkerMetrics",
+    "http_compression_bytes_total",
+    "http_compression_seconds_total",
+    "http_request_duration_seconds",
+    "http_requests_total",
+    "path_template",
+    "registry",
+    "upstream_request_duration_seconds",
+    "upstream_requests_total",
+    "upstream_response_bytes_total",
+    "upstream_retries_total",
+]
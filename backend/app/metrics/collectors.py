@@ -0,0 +1,102 @@
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Optional
+
+from ..cache import ResponseCache
+from ..clients.remnawave import RemnaWaveAdminAPIClient
+from .loop import EventLoopMonitor
+from .registry import MetricFamily
+
+
+def runtime_collector(
+    client: RemnaWaveAdminAPIClient,
+    cache: ResponseCache,
+    loop_monitor: Optional[EventLoopMonitor] = None,
+) -> Callable[[], List[MetricFamily]]:
+    def collect() -> List[MetricFamily]:
+        families: List[MetricFamily] = []
+
+        cache_stats = cache.stats()
+        lookups = MetricFamily("bff_response_cache_lookups_total", "counter", "Response cache lookups by result.")
+        for result in ("hits", "stale_hits", "negative_hits", "misses"):
+            lookups.add(getattr(cache_stats, result), {"result": result})
+        families.append(lookups)
+        families.append(
+            MetricFamily("bff_response_cache_hit_ratio", "gauge", "Share of lookups served from cache.").add(
+                cache_stats.hit_ratio
+            )
+        )
+        families.append(
+            MetricFamily("bff_response_cache_entries", "gauge", "Entries held by the response cache.").add(
+                cache_stats.size
+            )
+        )
+        families.append(
+            MetricFamily("bff_response_cache_evictions_total", "counter", "LRU evictions.").add(cache_stats.evictions)
+        )
+
+        pool = client.pool_stats()
+        if pool is not None:
+            connections = MetricFamily("bff_upstream_pool_connections", "gauge", "Upstream pool connections by state.")
+            connections.add(pool.active_connections, {"state": "active"})
+            connections.add(pool.idle_connections, {"state": "idle"})
+            families.append(connections)
+            families.extend(
+                _counters(
+                    asdict(pool),
+                    {
+                        "connections_opened": "Upstream TCP connections opened.",
+                        "dns_lookups": "DNS lookups performed for the upstream host.",
+                        "dns_cache_hits": "DNS lookups served from the cache.",
+                    },
+                    "bff_upstream_pool_",
+                )
+            )
+
+        flights = client.singleflight_stats()
+        coalesced = MetricFamily("bff_upstream_singleflight_total", "counter", "Upstream GETs by single-flight role.")
+        coalesced.add(flights.leaders, {"role": "leader"})
+        coalesced.add(flights.followers, {"role": "follower"})
+        families.append(coalesced)
+
+        resilience = client.resilience_stats()
+        families.append(
+            MetricFamily("bff_upstream_retry_budget_balance", "gauge", "Retries currently allowed by the budget.").add(
+                resilience.retry_budget_balance
+            )
+        )
+        families.append(
+            MetricFamily(
+                "bff_upstream_retry_budget_exhausted_total", "counter", "Retries denied by the retry budget."
+            ).add(resilience.retry_budget_exhausted)
+        )
+        circuit = MetricFamily("bff_upstream_circuit_state", "gauge", "1 for the current circuit breaker state.")
+        for state in ("closed", "open", "half_open"):
+            circuit.add(1 if resilience.circuit_state == state else 0, {"state": state})
+        families.append(circuit)
+        families.append(
+            MetricFamily("bff_upstream_circuit_rejected_total", "counter", "Calls rejected by the open circuit.").add(
+                resilience.circuit_rejected
+            )
+        )
+
+        if loop_monitor is not None:
+            families.append(
+                MetricFamily("bff_event_loop_lag_seconds", "gauge", "Last measured event loop scheduling lag.").add(
+                    loop_monitor.lag_seconds
+                )
+            )
+            families.append(
+                MetricFamily(
+                    "bff_event_loop_lag_max_seconds", "gauge", "Worst event loop lag since the previous scrape."
+                ).add(loop_monitor.reset_max())
+            )
+        return families
+
+    return collect
+
+
+def _counters(values: Dict[str, Any], help_texts: Dict[str, str], prefix: str) -> List[MetricFamily]:
+    return [
+        MetricFamily(f"{prefix}{name}_total", "counter", help_text).add(values[name])
+        for name, help_text in help_texts.items()
+    ]
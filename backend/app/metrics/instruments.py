@@ -0,0 +1,54 @@
+import re
+from functools import lru_cache
+
+from .registry import MetricsRegistry
+
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    "bff_http_requests_total",
+    "HTTP requests handled by the BFF.",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = registry.histogram(
+    "bff_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route"),
+)
+http_compression_bytes_total = registry.counter(
+    "bff_http_compression_bytes_total",
+    "Response body bytes before (raw) and after (wire) compression.",
+    ("encoding", "stage"),
+)
+http_compression_seconds_total = registry.counter(
+    "bff_http_compression_seconds_total",
+    "CPU time spent compressing response bodies.",
+    ("encoding",),
+)
+upstream_requests_total = registry.counter(
+    "bff_upstream_requests_total",
+    "RemnaWave API calls by path template and outcome.",
+    ("method", "path", "status"),
+)
+upstream_request_duration_seconds = registry.histogram(
+    "bff_upstream_request_duration_seconds",
+    "RemnaWave API call latency by path template.",
+    ("method", "path"),
+)
+upstream_response_bytes_total = registry.counter(
+    "bff_upstream_response_bytes_total",
+    "RemnaWave API response bytes as received (wire) and after decoding (raw).",
+    ("encoding", "stage"),
+)
+upstream_retries_total = registry.counter(
+    "bff_upstream_retries_total",
+    "RemnaWave API calls retried by the client.",
+    ("method", "path"),
+)
+
+_ID_SEGMENT = re.compile(r"/(?:\d+|[0-9a-fA-F-]{32,36})(?=/|$)")
+
+
+@lru_cache(maxsize=1024)
+def path_template(path: str) -> str:
+    return _ID_SEGMENT.sub("/{id}", path)
@@ -0,0 +1,36 @@
+import asyncio
+import time
+from typing import Optional
+
+
+class EventLoopMonitor:
+    def __init__(self, interval: float = 0.5) -> None:
+        self._interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self.lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def reset_max(self) -> float:
+        value, self.max_lag_seconds = self.max_lag_seconds, self.lag_seconds
+        return value
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self._interval)
+            self.lag_seconds = max(time.perf_counter() - started - self._interval, 0.0)
+            self.max_lag_seconds = max(self.max_lag_seconds, self.lag_seconds)
@@ -0,0 +1,112 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .registry import MetricFamily, MetricsRegistry, render_families
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_INTERVAL = 5.0
+SNAPSHOT_MAX_AGE = 60.0
+
+
+class WorkerMetrics:
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        directory: str,
+        *,
+        slot: int,
+        workers: int,
+        interval: float = SNAPSHOT_INTERVAL,
+    ) -> None:
+        self._registry = registry
+        self._directory = Path(directory)
+        self._slot = slot
+        self._workers = workers
+        self._interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._path(self._slot).unlink(missing_ok=True)
+
+    async def render(self) -> str:
+        merged: Dict[str, MetricFamily] = {}
+        self._merge(merged, await self.write_snapshot(), self._slot)
+        snapshots = await asyncio.to_thread(self._read_snapshots)
+        for slot, families in snapshots.items():
+            self._merge(merged, families, slot)
+        return render_families(merged.values())
+
+    async def write_snapshot(self) -> List[MetricFamily]:
+        families = self._registry.collect()
+        document = [
+            {"name": family.name, "kind": family.kind, "help": family.help, "samples": family.samples}
+            for family in families
+        ]
+        await asyncio.to_thread(self._write, json.dumps(document).encode())
+        return families
+
+    @staticmethod
+    def _merge(merged: Dict[str, MetricFamily], families: List[MetricFamily], slot: int) -> None:
+        for family in families:
+            target = merged.setdefault(family.name, MetricFamily(family.name, family.kind, family.help))
+            for name, labels, value in family.samples:
+                target.samples.append((name, {**labels, "worker": str(slot)}, value))
+
+    def _read_snapshots(self) -> Dict[int, List[MetricFamily]]:
+        snapshots: Dict[int, List[MetricFamily]] = {}
+        cutoff = time.time() - SNAPSHOT_MAX_AGE
+        for slot in range(self._workers):
+            if slot == self._slot:
+                continue
+            path = self._path(slot)
+            try:
+                if path.stat().st_mtime < cutoff:
+                    continue
+                document = json.loads(path.read_bytes())
+            except (OSError, ValueError) as exc:
+                if not isinstance(exc, FileNotFoundError):
+                    logger.warning("Skipping metrics snapshot %s: %s", path, exc)
+                continue
+            snapshots[slot] = [
+                MetricFamily(item["name"], item["kind"], item["help"], [tuple(sample) for sample in item["samples"]])
+                for item in document
+            ]
+        return snapshots
+
+    def _write(self, data: bytes) -> None:
+        path = self._path(self._slot)
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temporary.write_bytes(data)
+        os.replace(temporary, path)
+
+    def _path(self, slot: int) -> Path:
+        return self._directory / f"worker-{slot}.json"
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.write_snapshot()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Writing metrics snapshot failed: %s", exc)
+            await asyncio.sleep(self._interval)
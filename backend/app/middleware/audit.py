@@ -1,40 +1,52 @@
 import logging
 import time
-from typing import Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .correlation import get_correlation_id
 
 logger = logging.getLogger("audit")
 
 
-class AuditMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+class AuditMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.perf_counter()
         correlation_id = get_correlation_id()
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
 
-        client_host = request.client.host if request.client else None
         logger.info(
             "request started method=%s path=%s correlation_id=%s client=%s",
-            request.method,
-            request.url.path,
+            method,
+            path,
             correlation_id,
-            client_host,
+            client[0] if client else None,
         )
 
-        response = await call_next(request)
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_with_status)
 
         duration_ms = (time.perf_counter() - start_time) * 1000
         logger.info(
             "request completed method=%s path=%s status=%s duration_ms=%.2f correlation_id=%s",
-            request.method,
-            request.url.path,
-            response.status_code,
+            method,
+            path,
+            status_code,
             duration_ms,
             correlation_id,
         )
-
-        return response
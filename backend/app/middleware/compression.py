@@ -0,0 +1,119 @@
+import time
+from typing import Dict, Optional, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..metrics import http_compression_bytes_total, http_compression_seconds_total
+from ..utils.compression import ENCODERS, StreamEncoder, is_compressible, negotiate_encoding
+
+_UNCOMPRESSED_STATUSES = frozenset({204, 206, 304})
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        encodings: Sequence[str] = ("gzip",),
+        levels: Optional[Dict[str, int]] = None,
+        minimum_size: int = 1024,
+    ) -> None:
+        self.app = app
+        self.encodings = tuple(encodings)
+        self.levels = levels or {}
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        pending_start: Optional[Message] = None
+        encoder: Optional[StreamEncoder] = None
+        raw_bytes = 0
+        wire_bytes = 0
+        cpu_time = 0.0
+
+        def compress(active: StreamEncoder, body: bytes, more_body: bool) -> bytes:
+            nonlocal raw_bytes, wire_bytes, cpu_time
+            started = time.thread_time()
+            chunk = active.compress(body, flush=more_body)
+            if not more_body:
+                chunk += active.finish()
+            cpu_time += time.thread_time() - started
+            raw_bytes += len(body)
+            wire_bytes += len(chunk)
+            return chunk
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal pending_start, encoder
+            if message["type"] == "http.response.start":
+                if self._should_compress(message):
+                    pending_start = message
+                    return
+                if message["status"] == 304:
+                    self._mark_encoded(MutableHeaders(scope=message))
+                await send(message)
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if encoder is not None:
+                chunk = compress(encoder, body, more_body)
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                return
+            if pending_start is None:
+                await send(message)
+                return
+
+            start, pending_start = pending_start, None
+            headers = MutableHeaders(scope=start)
+            if not more_body and len(body) < self.minimum_size:
+                headers.add_vary_header("Accept-Encoding")
+                await send(start)
+                await send(message)
+                return
+
+            encoder = ENCODERS[encoding](self.levels.get(encoding, 6))
+            chunk = compress(encoder, body, more_body)
+            headers["Content-Encoding"] = encoding
+            self._mark_encoded(headers)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(chunk))
+            await send(start)
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        try:
+            await self.app(scope, receive, send_compressed)
+        finally:
+            if encoder is not None:
+                http_compression_bytes_total.inc((encoding, "raw"), raw_bytes)
+                http_compression_bytes_total.inc((encoding, "wire"), wire_bytes)
+                http_compression_seconds_total.inc((encoding,), cpu_time)
+
+    @staticmethod
+    def _mark_encoded(headers: MutableHeaders) -> None:
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = "W/" + etag
+
+    @staticmethod
+    def _should_compress(message: Message) -> bool:
+        if message["status"] < 200 or message["status"] in _UNCOMPRESSED_STATUSES:
+            return False
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers or "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        return is_compressible(headers.get("content-type", ""))
@@ -1,10 +1,8 @@
 import contextvars
 import uuid
-from typing import Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 correlation_id_ctx_var: contextvars.ContextVar[str] = contextvars.ContextVar("correlation_id", default="")
 
@@ -13,15 +11,26 @@ def get_correlation_id() -> str:
     return correlation_id_ctx_var.get()
 
 
-class CorrelationIdMiddleware(BaseHTTPMiddleware):
+class CorrelationIdMiddleware:
     header_name = "X-Request-ID"
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        request_id = request.headers.get(self.header_name) or str(uuid.uuid4())
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(self.header_name) or str(uuid.uuid4())
         token = correlation_id_ctx_var.set(request_id)
 
-        response = await call_next(request)
-        response.headers[self.header_name] = request_id
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[self.header_name] = request_id
+            await send(message)
 
-        correlation_id_ctx_var.reset(token)
-        return response
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            correlation_id_ctx_var.reset(token)
@@ -0,0 +1,94 @@
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import parse_qsl
+
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..auth import authenticate_token
+from ..auth.models import AdminUser
+from ..profiling import ProfileRecord, ProfileStore, start_profiler
+from .correlation import get_correlation_id
+
+logger = logging.getLogger(__name__)
+
+_TRUTHY = {"1", "true", "yes", "on"}
+
+
+class ProfilingMiddleware:
+    header_name = "X-Profile"
+    query_param = "_profile"
+
+    def __init__(self, app: ASGIApp, *, store: ProfileStore, role: str, interval: float) -> None:
+        self.app = app
+        self.store = store
+        self.role = role
+        self.interval = interval
+        self._query_marker = self.query_param.encode("ascii")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        admin = self._authorize(Headers(scope=scope))
+        if admin is None:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started_at = datetime.now(timezone.utc)
+        start_time = time.perf_counter()
+        profiler = start_profiler(self.interval)
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            session = profiler.stop()
+            self.store.add(
+                ProfileRecord(
+                    request_id=get_correlation_id(),
+                    admin_id=admin.id,
+                    method=scope["method"],
+                    path=scope["path"],
+                    status_code=status_code,
+                    started_at=started_at,
+                    duration_ms=(time.perf_counter() - start_time) * 1000,
+                    cpu_time_ms=session.cpu_time * 1000,
+                    session=session,
+                )
+            )
+
+    def _requested(self, scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == b"x-profile":
+                return value.decode("latin-1").strip().lower() in _TRUTHY
+        query_string = scope.get("query_string", b"")
+        if self._query_marker not in query_string:
+            return False
+        return any(
+            name == self.query_param and value.lower() in _TRUTHY
+            for name, value in parse_qsl(query_string.decode("latin-1"))
+        )
+
+    def _authorize(self, headers: Headers) -> Optional[AdminUser]:
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return None
+        try:
+            admin = authenticate_token(token)
+        except HTTPException:
+            return None
+        if self.role not in admin.roles:
+            logger.info("Ignoring profiling request from admin=%s without role %s", admin.id, self.role)
+            return None
+        return admin
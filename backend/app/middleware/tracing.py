@@ -0,0 +1,40 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.tracing import server_span
+from .correlation import get_correlation_id
+
+
+class TracingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        carrier = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+        attributes = {
+            "http.method": method,
+            "http.target": scope["path"],
+            "request.id": get_correlation_id(),
+        }
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with server_span(f"{method} {scope['path']}", carrier, attributes) as current:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                if current is not None:
+                    template = getattr(scope.get("route"), "path_format", None)
+                    if template:
+                        current.update_name(f"{method} {template}")
+                        current.set_attribute("http.route", template)
+                    current.set_attribute("http.status_code", status_code)
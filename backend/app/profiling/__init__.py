@@ -0,0 +1,11 @@
+from .sampler import collapsed_stacks, profiler_available, speedscope_document, start_profiler
+from .store import ProfileRecord, ProfileStore
+
+__all__ = [
+    "ProfileRecord",
+    "ProfileStore",
+    "collapsed_stacks",
+    "profiler_available",
+    "speedscope_document",
+    "start_profiler",
+]
@@ -0,0 +1,49 @@
+from typing import Any, List
+
+PROFILER_FRAME_SEPARATOR = ";"
+
+
+def profiler_available() -> bool:
+    try:
+        import pyinstrument  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def start_profiler(interval: float) -> Any:
+    from pyinstrument import Profiler
+
+    profiler = Profiler(interval=interval, async_mode="enabled")
+    profiler.start()
+    return profiler
+
+
+def collapsed_stacks(session: Any) -> List[str]:
+    root = session.root_frame()
+    if root is None:
+        return []
+
+    lines: List[str] = []
+    stack = [(root, _frame_label(root))]
+    while stack:
+        frame, path = stack.pop()
+        weight = int(round((frame.time - sum(child.time for child in frame.children)) * 1_000_000))
+        if weight > 0:
+            lines.append(f"{path} {weight}")
+        for child in frame.children:
+            stack.append((child, path + PROFILER_FRAME_SEPARATOR + _frame_label(child)))
+    return lines
+
+
+def speedscope_document(session: Any) -> str:
+    from pyinstrument.renderers import SpeedscopeRenderer
+
+    return SpeedscopeRenderer().render(session)
+
+
+def _frame_label(frame: Any) -> str:
+    label = frame.function or "<unknown>"
+    if frame.file_path_short and not frame.is_synthetic:
+        label = f"{label} ({frame.file_path_short}:{frame.line_no})"
+    return label.replace(PROFILER_FRAME_SEPARATOR, ",")
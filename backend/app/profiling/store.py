@@ -0,0 +1,42 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional
+
+
+@dataclass
+class ProfileRecord:
+    request_id: str
+    admin_id: str
+    method: str
+    path: str
+    status_code: int
+    started_at: datetime
+    duration_ms: float
+    cpu_time_ms: float
+    session: Any
+
+
+class ProfileStore:
+    def __init__(self, max_profiles: int) -> None:
+        self._max_profiles = max(max_profiles, 1)
+        self._records: "OrderedDict[str, ProfileRecord]" = OrderedDict()
+
+    @property
+    def capacity(self) -> int:
+        return self._max_profiles
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, record: ProfileRecord) -> None:
+        self._records.pop(record.request_id, None)
+        self._records[record.request_id] = record
+        while len(self._records) > self._max_profiles:
+            self._records.popitem(last=False)
+
+    def get(self, request_id: str) -> Optional[ProfileRecord]:
+        return self._records.get(request_id)
+
+    def list(self) -> List[ProfileRecord]:
+        return list(reversed(self._records.values()))
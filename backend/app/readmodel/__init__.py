@@ -0,0 +1,3 @@
+from .store import ReadModelStore
+
+__all__ = ["ReadModelStore"]
@@ -0,0 +1,280 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    telegram_id INTEGER,
+    username TEXT,
+    full_name TEXT,
+    status TEXT,
+    promo_group_id INTEGER,
+    position INTEGER,
+    data TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_users_status ON users (status);
+CREATE INDEX IF NOT EXISTS ix_users_promo_group_id ON users (promo_group_id);
+CREATE INDEX IF NOT EXISTS ix_users_telegram_id ON users (telegram_id);
+
+CREATE TABLE IF NOT EXISTS subscriptions (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER,
+    status TEXT,
+    is_trial INTEGER,
+    expires_at TEXT,
+    position INTEGER,
+    data TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_subscriptions_status ON subscriptions (status);
+CREATE INDEX IF NOT EXISTS ix_subscriptions_user_id ON subscriptions (user_id);
+CREATE INDEX IF NOT EXISTS ix_subscriptions_is_trial ON subscriptions (is_trial);
+CREATE INDEX IF NOT EXISTS ix_subscriptions_expires_at ON subscriptions (expires_at);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    resource TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    total INTEGER NOT NULL
+);
+"""
+
+_POSITION_INDEXES = """
+CREATE INDEX IF NOT EXISTS ix_users_position ON users (position IS NULL, position, id);
+CREATE INDEX IF NOT EXISTS ix_subscriptions_position ON subscriptions (position IS NULL, position, id);
+"""
+
+_UPSERT_USER = """
+INSERT INTO users (id, telegram_id, username, full_name, status, promo_group_id, position, data, synced_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    telegram_id = excluded.telegram_id,
+    username = excluded.username,
+    full_name = excluded.full_name,
+    status = excluded.status,
+    promo_group_id = excluded.promo_group_id,
+    position = COALESCE(excluded.position, users.position),
+    data = excluded.data,
+    synced_at = excluded.synced_at
+WHERE excluded.synced_at >= users.synced_at
+"""
+
+_UPSERT_SUBSCRIPTION = """
+INSERT INTO subscriptions (id, user_id, status, is_trial, expires_at, position, data, synced_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    user_id = excluded.user_id,
+    status = excluded.status,
+    is_trial = excluded.is_trial,
+    expires_at = excluded.expires_at,
+    position = COALESCE(excluded.position, subscriptions.position),
+    data = excluded.data,
+    synced_at = excluded.synced_at
+WHERE excluded.synced_at >= subscriptions.synced_at
+"""
+
+
+SYNC_STATE_RELOAD_INTERVAL = 1.0
+
+
+class ReadModelStore:
+    def __init__(self, path: str, *, syncing: bool = True) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        for table in ("users", "subscriptions"):
+            columns = {row[1] for row in self._connection.execute(f"PRAGMA table_info({table})")}
+            if "position" not in columns:
+                self._connection.execute(f"ALTER TABLE {table} ADD COLUMN position INTEGER")
+        self._connection.executescript(_POSITION_INDEXES)
+        self._lock = threading.Lock()
+        self._syncing = syncing
+        self._synced_at: Dict[str, float] = {}
+        self._state_loaded_at = 0.0
+        self._load_sync_state()
+
+    def is_fresh(self, resource: str, max_staleness: float) -> bool:
+        if not self._syncing and time.monotonic() - self._state_loaded_at >= SYNC_STATE_RELOAD_INTERVAL:
+            self._load_sync_state()
+        synced_at = self._synced_at.get(resource)
+        return synced_at is not None and time.time() - synced_at <= max_staleness
+
+    async def upsert_users(
+        self,
+        users: Iterable[Dict[str, Any]],
+        synced_at: Optional[float] = None,
+        first_position: Optional[int] = None,
+    ) -> None:
+        synced_at = synced_at or time.time()
+        rows = [
+            (
+                user["id"],
+                user.get("telegram_id"),
+                user.get("username"),
+                user.get("full_name"),
+                user.get("status"),
+                (user.get("promo_group") or {}).get("id"),
+                None if first_position is None else first_position + index,
+                json.dumps(user, ensure_ascii=False),
+                synced_at,
+            )
+            for index, user in enumerate(users)
+        ]
+        await self._executemany(_UPSERT_USER, rows)
+
+    async def upsert_subscriptions(
+        self,
+        subscriptions: Iterable[Dict[str, Any]],
+        synced_at: Optional[float] = None,
+        first_position: Optional[int] = None,
+    ) -> None:
+        synced_at = synced_at or time.time()
+        rows = [
+            (
+                subscription["id"],
+                subscription.get("user_id"),
+                subscription.get("status"),
+                None if subscription.get("is_trial") is None else int(subscription["is_trial"]),
+                subscription.get("expires_at"),
+                None if first_position is None else first_position + index,
+                json.dumps(subscription, ensure_ascii=False),
+                synced_at,
+            )
+            for index, subscription in enumerate(subscriptions)
+        ]
+        await self._executemany(_UPSERT_SUBSCRIPTION, rows)
+
+    async def finish_sync(self, resource: str, started_at: float) -> int:
+        def run() -> int:
+            with self._lock, self._transaction() as connection:
+                deleted = connection.execute(
+                    f"DELETE FROM {resource} WHERE synced_at < ?", (started_at,)
+                ).rowcount
+                total = connection.execute(f"SELECT COUNT(*) FROM {resource}").fetchone()[0]
+                connection.execute(
+                    "INSERT OR REPLACE INTO sync_state (resource, synced_at, total) VALUES (?, ?, ?)",
+                    (resource, started_at, total),
+                )
+                return deleted
+
+        deleted = await asyncio.to_thread(run)
+        self._synced_at[resource] = started_at
+        return deleted
+
+    async def list_users(
+        self,
+        *,
+        limit: int,
+        offset: int,
+        status: Optional[str] = None,
+        promo_group_id: Optional[int] = None,
+        search: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        clauses: List[str] = []
+        args: List[Any] = []
+        if status:
+            clauses.append("status = ?")
+            args.append(status)
+        if promo_group_id is not None:
+            clauses.append("promo_group_id = ?")
+            args.append(promo_group_id)
+        if search:
+            pattern = f"%{search}%"
+            if search.isdigit():
+                clauses.append("(telegram_id = ? OR username LIKE ? OR full_name LIKE ?)")
+                args.extend([int(search), pattern, pattern])
+            else:
+                clauses.append("(username LIKE ? OR full_name LIKE ?)")
+                args.extend([pattern, pattern])
+        return await self._page("users", clauses, args, limit, offset)
+
+    async def list_subscriptions(
+        self,
+        *,
+        limit: int,
+        offset: int,
+        status: Optional[str] = None,
+        user_id: Optional[int] = None,
+        is_trial: Optional[bool] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        clauses: List[str] = []
+        args: List[Any] = []
+        if status:
+            clauses.append("status = ?")
+            args.append(status)
+        if user_id is not None:
+            clauses.append("user_id = ?")
+            args.append(user_id)
+        if is_trial is not None:
+            clauses.append("is_trial = ?")
+            args.append(int(is_trial))
+        return await self._page("subscriptions", clauses, args, limit, offset)
+
+    async def get_users(self, user_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        if not user_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in user_ids)
+
+        def run() -> Dict[int, Dict[str, Any]]:
+            with self._lock:
+                rows = self._connection.execute(
+                    f"SELECT id, data FROM users WHERE id IN ({placeholders})", user_ids
+                ).fetchall()
+            return {row[0]: json.loads(row[1]) for row in rows}
+
+        return await asyncio.to_thread(run)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._connection
+            self._connection.execute("COMMIT")
+        except BaseException:
+            if self._connection.in_transaction:
+                self._connection.execute("ROLLBACK")
+            raise
+
+    def _load_sync_state(self) -> None:
+        with self._lock:
+            rows = self._connection.execute("SELECT resource, synced_at FROM sync_state").fetchall()
+        self._synced_at = dict(rows)
+        self._state_loaded_at = time.monotonic()
+
+    async def _page(
+        self, table: str, clauses: List[str], args: List[Any], limit: int, offset: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        def run() -> Tuple[List[Dict[str, Any]], int]:
+            with self._lock:
+                total = self._connection.execute(f"SELECT COUNT(*) FROM {table}{where}", args).fetchone()[0]
+                rows = self._connection.execute(
+                    f"SELECT data FROM {table}{where} ORDER BY position IS NULL, position, id LIMIT ? OFFSET ?",
+                    [*args, limit, offset],
+                ).fetchall()
+            return [json.loads(row[0]) for row in rows], total
+
+        return await asyncio.to_thread(run)
+
+    async def _executemany(self, statement: str, rows: List[Tuple[Any, ...]]) -> None:
+        if not rows:
+            return
+
+        def run() -> None:
+            with self._lock, self._transaction() as connection:
+                connection.executemany(statement, rows)
+
+        await asyncio.to_thread(run)
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from pydantic import BaseModel
+
+from ..clients.remnawave import RemnaWaveAdminAPIClient
+from ..services.base import BaseService
+from ..services.subscriptions import SubscriptionsService
+from ..services.users import UsersService
+from .store import ReadModelStore
+
+logger = logging.getLogger(__name__)
+
+_BATCH_SIZE = 500
+
+
+class ReadModelSyncer:
+    def __init__(
+        self,
+        client: RemnaWaveAdminAPIClient,
+        store: ReadModelStore,
+        *,
+        interval: float,
+    ) -> None:
+        self._client = client
+        self._store = store
+        self._interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def sync_once(self) -> Dict[str, int]:
+        users = UsersService(self._client)
+        subscriptions = SubscriptionsService(self._client)
+        return {
+            "users": await self._sync("users", users, users.iter_users(), self._store.upsert_users),
+            "subscriptions": await self._sync(
+                "subscriptions",
+                subscriptions,
+                subscriptions.iter_subscriptions(),
+                self._store.upsert_subscriptions,
+            ),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            try:
+                counts = await self.sync_once()
+                logger.info(
+                    "Read model synced users=%s subscriptions=%s duration_ms=%.2f",
+                    counts["users"],
+                    counts["subscriptions"],
+                    (time.perf_counter() - started) * 1000,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Read model sync failed: %s", exc)
+            await asyncio.sleep(self._interval)
+
+    async def _sync(
+        self,
+        resource: str,
+        service: BaseService,
+        rows: AsyncIterator[BaseModel],
+        upsert: Callable[[Iterable[Dict], float, int], Awaitable[None]],
+    ) -> int:
+        started_at = time.time()
+        batch: List[Dict] = []
+        seen: Set[Any] = set()
+        count = 0
+        async for row in rows:
+            seen.add(getattr(row, "id", None))
+            batch.append(row.model_dump())
+            if len(batch) >= _BATCH_SIZE:
+                await upsert(batch, started_at, count)
+                count += len(batch)
+                batch = []
+        if batch:
+            await upsert(batch, started_at, count)
+            count += len(batch)
+
+        if service.last_total is not None and len(seen) < service.last_total:
+            logger.warning(
+                "Read model sync of %s saw %s of %s rows, keeping existing rows until a complete pass",
+                resource,
+                len(seen),
+                service.last_total,
+            )
+            return count
+        await self._store.finish_sync(resource, started_at)
+        return count
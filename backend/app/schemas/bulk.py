@@ -0,0 +1,28 @@
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class BulkItemResult(BaseModel):
+    id: int
+    success: bool
+    status_code: Optional[int] = None
+    detail: Optional[str] = None
+    attempts: int = 1
+
+
+class BulkProgress(BaseModel):
+    type: Literal["progress"] = "progress"
+    completed: int
+    total: int
+    result: BulkItemResult
+
+
+class BulkReport(BaseModel):
+    type: Literal["report"] = "report"
+    total: int
+    succeeded: int
+    failed: int
+    duration_ms: float
+    succeeded_ids: List[int] = Field(default_factory=list)
+    failures: List[BulkItemResult] = Field(default_factory=list)
@@ -0,0 +1,15 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+BATCH_MAX_IDS = 100
+BULK_MAX_IDS = 1000
+
+
+class BatchRequest(BaseModel):
+    ids: List[int] = Field(min_length=1, max_length=BATCH_MAX_IDS)
+
+
+class BatchItemError(BaseModel):
+    status_code: int
+    detail: str
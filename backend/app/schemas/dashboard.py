@@ -0,0 +1,23 @@
+from typing import Dict, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from .health import HealthResponse
+from .stats import StatsOverviewResponse
+from .subscriptions import SubscriptionListResponse
+from .users import UserListResponse
+
+
+class DashboardSectionStatus(BaseModel):
+    status: Literal["ok", "timeout", "error"]
+    status_code: Optional[int] = None
+    detail: Optional[str] = None
+    duration_ms: float
+
+
+class DashboardResponse(BaseModel):
+    health: Optional[HealthResponse] = None
+    stats: Optional[StatsOverviewResponse] = None
+    recent_users: Optional[UserListResponse] = None
+    recent_subscriptions: Optional[SubscriptionListResponse] = None
+    sections: Dict[str, DashboardSectionStatus] = Field(default_factory=dict)
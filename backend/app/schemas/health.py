@@ -10,3 +10,58 @@ class HealthResponse(BaseModel):
     components: Dict[str, bool]
     features: Dict[str, bool]
     latency_ms: float
+
+
+class UpstreamPoolStats(BaseModel):
+    max_connections: Optional[int] = None
+    max_keepalive_connections: Optional[int] = None
+    keepalive_expiry: Optional[float] = None
+    http2: bool = False
+    connections: int = 0
+    active_connections: int = 0
+    idle_connections: int = 0
+    http2_connections: int = 0
+    connections_opened: int = 0
+    requests: int = 0
+    dns_lookups: int = 0
+    dns_cache_hits: int = 0
+
+
+class ResponseCacheStats(BaseModel):
+    size: int = 0
+    max_entries: int = 0
+    hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    negative_hits: int = 0
+    evictions: int = 0
+    refreshes: int = 0
+    write_throughs: int = 0
+    hit_ratio: float = 0.0
+    backend: str = "memory"
+    shared_hits: int = 0
+    shared_errors: int = 0
+    remote_invalidations: int = 0
+
+
+class SingleFlightStats(BaseModel):
+    leaders: int = 0
+    followers: int = 0
+    in_flight: int = 0
+    coalescing_ratio: float = 0.0
+
+
+class ResilienceStats(BaseModel):
+    retries: int = 0
+    retry_budget_balance: float = 0.0
+    retry_budget_exhausted: int = 0
+    circuit_state: str = "closed"
+    circuit_opened: int = 0
+    circuit_rejected: int = 0
+
+
+class UpstreamStatsResponse(BaseModel):
+    pool: Optional[UpstreamPoolStats] = None
+    resilience: Optional[ResilienceStats] = None
+    coalescing: Optional[SingleFlightStats] = None
+    cache: Optional[ResponseCacheStats] = None
@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel
+
+
+class ProfileSummary(BaseModel):
+    request_id: str
+    admin_id: str
+    method: str
+    path: str
+    status_code: int
+    started_at: datetime
+    duration_ms: float
+    cpu_time_ms: float
+
+
+class ProfileListResponse(BaseModel):
+    items: List[ProfileSummary]
+    capacity: int
+
+
+class ProfileDetailResponse(ProfileSummary):
+    sample_count: int
+    collapsed_stacks: List[str]
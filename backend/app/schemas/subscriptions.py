@@ -1,7 +1,9 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from .common import BULK_MAX_IDS, BatchItemError
+
 
 class SubscriptionPlanSummary(BaseModel):
     id: Optional[int] = None
@@ -43,9 +45,23 @@ class SubscriptionDetailResponse(BaseModel):
     subscription: Subscription
 
 
+class SubscriptionBatchItem(BaseModel):
+    subscription: Optional[Subscription] = None
+    error: Optional[BatchItemError] = None
+
+
+class SubscriptionBatchResponse(BaseModel):
+    items: Dict[int, SubscriptionBatchItem] = Field(default_factory=dict)
+
+
 class SubscriptionUpdateRequest(BaseModel):
     status: Optional[str] = None
     plan_id: Optional[int] = None
     expires_at: Optional[str] = None
     device_limit: Optional[int] = None
     traffic_limit_gb: Optional[int] = None
+
+
+class SubscriptionBulkUpdateRequest(BaseModel):
+    ids: List[int] = Field(min_length=1, max_length=BULK_MAX_IDS)
+    patch: SubscriptionUpdateRequest
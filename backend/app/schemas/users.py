@@ -1,7 +1,9 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from .common import BULK_MAX_IDS, BatchItemError
+
 
 class PromoGroupSummary(BaseModel):
     id: Optional[int] = None
@@ -58,6 +60,15 @@ class UserDetailResponse(BaseModel):
     user: UserDetail
 
 
+class UserBatchItem(BaseModel):
+    user: Optional[UserDetail] = None
+    error: Optional[BatchItemError] = None
+
+
+class UserBatchResponse(BaseModel):
+    items: Dict[int, UserBatchItem] = Field(default_factory=dict)
+
+
 class UserUpdateRequest(BaseModel):
     full_name: Optional[str] = None
     username: Optional[str] = None
@@ -66,3 +77,8 @@ class UserUpdateRequest(BaseModel):
     promo_group_id: Optional[int] = None
     is_blocked: Optional[bool] = None
     notes: Optional[str] = None
+
+
+class UserBulkUpdateRequest(BaseModel):
+    ids: List[int] = Field(min_length=1, max_length=BULK_MAX_IDS)
+    patch: UserUpdateRequest
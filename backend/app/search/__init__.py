@@ -0,0 +1,5 @@
+from .documents import token_search_texts, user_search_texts
+from .index import SearchIndex
+from .tasks import SearchSuperseded, search_tasks
+
+__all__ = ["SearchIndex", "SearchSuperseded", "search_tasks", "token_search_texts", "user_search_texts"]
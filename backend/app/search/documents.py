@@ -0,0 +1,12 @@
+from typing import Any, List
+
+from ..schemas.tokens import Token
+from ..schemas.users import UserSummary
+
+
+def user_search_texts(user: UserSummary) -> List[Any]:
+    return [user.username, user.full_name, user.telegram_id]
+
+
+def token_search_texts(token: Token) -> List[Any]:
+    return [token.name, token.token_prefix]
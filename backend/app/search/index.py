@@ -0,0 +1,235 @@
+import heapq
+import re
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_EXACT_SCORE = 3.0
+_PREFIX_SCORE = 2.0
+_MAX_PREFIX_EXPANSIONS = 2048
+_FUZZY_MIN_LENGTH = 3
+_FUZZY_THRESHOLD = 0.4
+_MAX_GRAM_TERMS = 5000
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def trigrams(term: str) -> Set[str]:
+    padded = f"  {term} "
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    def __init__(self, *, store_documents: bool = False) -> None:
+        self._store_documents = store_documents
+        self._doc_ids = array("q")
+        self._slots: Dict[int, int] = {}
+        self._dead_slots: Set[int] = set()
+        self._signatures: Dict[int, int] = {}
+
+        self._terms: List[str] = []
+        self._term_ids: Dict[str, int] = {}
+        self._sorted_terms: List[str] = []
+        self._pending_terms: List[str] = []
+        self._term_gram_counts = array("H")
+        self._postings: List[array] = []
+        self._trigram_terms: Dict[str, array] = {}
+
+        self._documents: Dict[int, Any] = {}
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def upsert(self, doc_id: int, texts: Iterable[Optional[Any]], document: Any = None) -> None:
+        if self._store_documents and document is not None:
+            self._documents[doc_id] = document
+
+        terms = frozenset(term for text in texts if text is not None for term in tokenize(str(text)))
+        signature = hash(terms)
+        if doc_id in self._slots and self._signatures.get(doc_id) == signature:
+            return
+
+        self._remove_slot(doc_id)
+        self._signatures[doc_id] = signature
+
+        slot = len(self._doc_ids)
+        self._doc_ids.append(doc_id)
+        self._slots[doc_id] = slot
+
+        for term in terms:
+            self._postings[self._term_id(term)].append(slot)
+
+        if len(self._dead_slots) > 1024 and len(self._dead_slots) * 4 > len(self._doc_ids):
+            self._compact()
+
+    def remove(self, doc_id: int) -> None:
+        self._remove_slot(doc_id)
+        self._signatures.pop(doc_id, None)
+        self._documents.pop(doc_id, None)
+
+    def _remove_slot(self, doc_id: int) -> None:
+        slot = self._slots.pop(doc_id, None)
+        if slot is not None:
+            self._dead_slots.add(slot)
+
+    def retain(self, doc_ids: Set[int]) -> None:
+        for doc_id in [doc_id for doc_id in self._slots if doc_id not in doc_ids]:
+            self.remove(doc_id)
+
+    def document(self, doc_id: int) -> Any:
+        return self._documents.get(doc_id)
+
+    def search(self, query: str, *, limit: int, offset: int = 0) -> Tuple[List[int], int]:
+        tokens = tokenize(query)
+        if not tokens:
+            return [], 0
+        self.commit()
+
+        scores: Optional[Dict[int, float]] = None
+        for token in tokens:
+            token_scores = self._match(token)
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {slot: scores[slot] + token_scores[slot] for slot in scores.keys() & token_scores.keys()}
+            if not scores:
+                return [], 0
+
+        assert scores is not None
+        ranked = heapq.nsmallest(offset + limit, zip(scores.values(), scores.keys()))
+        return [self._doc_ids[slot] for _, slot in ranked[offset:]], len(scores)
+
+    def _match(self, token: str) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+
+        start = bisect_left(self._sorted_terms, token)
+        for term in islice(self._sorted_terms, start, start + _MAX_PREFIX_EXPANSIONS):
+            if not term.startswith(token):
+                break
+            if term != token:
+                scores.update(dict.fromkeys(self._postings[self._term_ids[term]], -_PREFIX_SCORE))
+
+        exact = self._term_ids.get(token)
+        if exact is not None:
+            scores.update(dict.fromkeys(self._postings[exact], -_EXACT_SCORE))
+
+        if not scores and len(token) >= _FUZZY_MIN_LENGTH:
+            for term_id, similarity in sorted(self._similar_terms(token), key=lambda item: item[1]):
+                scores.update(dict.fromkeys(self._postings[term_id], -similarity))
+
+        if self._dead_slots:
+            for slot in self._dead_slots & scores.keys():
+                del scores[slot]
+        return scores
+
+    def _similar_terms(self, token: str) -> List[Tuple[int, float]]:
+        grams = trigrams(token)
+        shared: Counter = Counter()
+        skipped: List[str] = []
+        for gram in grams:
+            term_ids = self._trigram_terms.get(gram)
+            if term_ids is None:
+                continue
+            if len(term_ids) > _MAX_GRAM_TERMS:
+                skipped.append(gram)
+            else:
+                shared.update(term_ids)
+
+        similar: List[Tuple[int, float]] = []
+        for term_id, common in shared.items():
+            if skipped:
+                padded = f"  {self._terms[term_id]} "
+                common += sum(1 for gram in skipped if gram in padded)
+            similarity = common / (len(grams) + self._term_gram_counts[term_id] - common)
+            if similarity >= _FUZZY_THRESHOLD:
+                similar.append((term_id, similarity))
+        return similar
+
+    def commit(self) -> None:
+        if not self._pending_terms:
+            return
+        if len(self._pending_terms) > 64:
+            self._sorted_terms.extend(self._pending_terms)
+            self._sorted_terms.sort()
+        else:
+            for term in self._pending_terms:
+                insort(self._sorted_terms, term)
+        self._pending_terms = []
+
+    def snapshot(self, dump_document: Callable[[Any], Any] = lambda document: document) -> Dict[str, Any]:
+        self.commit()
+        return {
+            "doc_ids": self._doc_ids.tolist(),
+            "dead_slots": sorted(self._dead_slots),
+            "terms": self._terms,
+            "postings": [postings.tolist() for postings in self._postings],
+            "documents": [[doc_id, dump_document(document)] for doc_id, document in self._documents.items()],
+            "ready": self.ready,
+        }
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot: Dict[str, Any],
+        *,
+        store_documents: bool = False,
+        load_document: Callable[[Any], Any] = lambda document: document,
+    ) -> "SearchIndex":
+        restored = cls(store_documents=store_documents)
+        restored._doc_ids = array("q", snapshot["doc_ids"])
+        restored._dead_slots = set(snapshot["dead_slots"])
+        restored._slots = {
+            doc_id: slot for slot, doc_id in enumerate(restored._doc_ids) if slot not in restored._dead_slots
+        }
+        for term in snapshot["terms"]:
+            restored._term_id(str(term))
+        if len(snapshot["postings"]) != len(restored._terms):
+            raise ValueError("Search index snapshot has mismatched postings")
+        restored._postings = [array("I", postings) for postings in snapshot["postings"]]
+        if any(postings and max(postings) >= len(restored._doc_ids) for postings in restored._postings):
+            raise ValueError("Search index snapshot references unknown slots")
+        restored._documents = {int(doc_id): load_document(document) for doc_id, document in snapshot["documents"]}
+        restored.commit()
+        restored.ready = bool(snapshot["ready"])
+        return restored
+
+    def replace_with(self, other: "SearchIndex") -> None:
+        self.__dict__.update(other.__dict__)
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._term_ids.get(term)
+        if term_id is not None:
+            return term_id
+
+        term_id = len(self._terms)
+        self._terms.append(term)
+        self._term_ids[term] = term_id
+        self._pending_terms.append(term)
+        self._postings.append(array("I"))
+
+        grams = trigrams(term)
+        self._term_gram_counts.append(len(grams))
+        for gram in grams:
+            self._trigram_terms.setdefault(gram, array("I")).append(term_id)
+        return term_id
+
+    def _compact(self) -> None:
+        remap: Dict[int, int] = {}
+        doc_ids = array("q")
+        for slot, doc_id in enumerate(self._doc_ids):
+            if slot not in self._dead_slots:
+                remap[slot] = len(doc_ids)
+                doc_ids.append(doc_id)
+
+        self._postings = [
+            array("I", (remap[slot] for slot in postings if slot in remap)) for postings in self._postings
+        ]
+        self._doc_ids = doc_ids
+        self._slots = {doc_id: slot for slot, doc_id in enumerate(doc_ids)}
+        self._dead_slots = set()
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional, Set, Tuple
+
+from ..clients.remnawave import RemnaWaveAdminAPIClient
+from ..schemas.tokens import Token
+from ..services.tokens import TokensService
+from ..services.users import UsersService
+from .documents import token_search_texts, user_search_texts
+from .index import SearchIndex
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_POLL_INTERVAL = 5.0
+
+
+class SearchIndexer:
+    def __init__(
+        self,
+        client: RemnaWaveAdminAPIClient,
+        *,
+        users: SearchIndex,
+        tokens: SearchIndex,
+        interval: float,
+        snapshot_path: Optional[str] = None,
+        leader: bool = True,
+    ) -> None:
+        self._client = client
+        self._users = users
+        self._tokens = tokens
+        self._interval = interval
+        self._snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._snapshot_mtime: Optional[int] = None
+        self._leader = leader
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def refresh(self) -> None:
+        users = UsersService(self._client)
+        seen = set()
+        async for user in users.iter_users():
+            self._users.upsert(user.id, user_search_texts(user))
+            seen.add(user.id)
+        self._retain("users", self._users, seen, users.last_total)
+        self._users.commit()
+        self._users.ready = True
+
+        tokens = TokensService(self._client)
+        seen = set()
+        async for token in tokens.iter_tokens():
+            self._tokens.upsert(token.id, token_search_texts(token), document=token)
+            seen.add(token.id)
+        self._retain("tokens", self._tokens, seen, tokens.last_total)
+        self._tokens.commit()
+        self._tokens.ready = True
+
+        if self._snapshot_path:
+            snapshot = {
+                "users": self._users.snapshot(),
+                "tokens": self._tokens.snapshot(lambda token: token.model_dump(mode="json")),
+            }
+            await asyncio.to_thread(self._write_snapshot, json.dumps(snapshot).encode())
+
+    async def reload(self) -> bool:
+        if self._snapshot_path is None:
+            return False
+        try:
+            mtime = self._snapshot_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if mtime == self._snapshot_mtime:
+            return False
+        users, tokens = await asyncio.to_thread(self._read_snapshot)
+        self._users.replace_with(users)
+        self._tokens.replace_with(tokens)
+        self._snapshot_mtime = mtime
+        return True
+
+    def _read_snapshot(self) -> Tuple[SearchIndex, SearchIndex]:
+        snapshot = json.loads(self._snapshot_path.read_bytes())
+        return (
+            SearchIndex.from_snapshot(snapshot["users"]),
+            SearchIndex.from_snapshot(snapshot["tokens"], store_documents=True, load_document=Token.model_validate),
+        )
+
+    def _write_snapshot(self, snapshot: bytes) -> None:
+        self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._snapshot_path.with_name(f"{self._snapshot_path.name}.{os.getpid()}.tmp")
+        temporary.write_bytes(snapshot)
+        os.replace(temporary, self._snapshot_path)
+
+    @staticmethod
+    def _retain(name: str, index: SearchIndex, seen: Set[int], total: Optional[int]) -> None:
+        if total is not None and len(seen) < total:
+            logger.warning("Search index refresh of %s saw %s of %s rows, skipping prune", name, len(seen), total)
+            return
+        index.retain(seen)
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            try:
+                if self._leader:
+                    await self.refresh()
+                if self._leader or await self.reload():
+                    logger.info(
+                        "Search index %s users=%s tokens=%s duration_ms=%.2f",
+                        "refreshed" if self._leader else "loaded from snapshot",
+                        len(self._users),
+                        len(self._tokens),
+                        (time.perf_counter() - started) * 1000,
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Search index refresh failed: %s", exc)
+            await asyncio.sleep(self._interval if self._leader else min(self._interval, SNAPSHOT_POLL_INTERVAL))
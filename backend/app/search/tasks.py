@@ -0,0 +1,34 @@
+import asyncio
+from typing import Awaitable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SearchSuperseded(Exception):
+    pass
+
+
+class SupersedingTasks:
+    def __init__(self) -> None:
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+
+    async def run(self, owner: Hashable, awaitable: Awaitable[T]) -> T:
+        previous = self._tasks.get(owner)
+        if previous is not None and not previous.done():
+            previous.cancel()
+
+        task = asyncio.ensure_future(awaitable)
+        self._tasks[owner] = task
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if task.cancelled() and self._tasks.get(owner) is not task:
+                raise SearchSuperseded() from None
+            task.cancel()
+            raise
+        finally:
+            if self._tasks.get(owner) is task:
+                del self._tasks[owner]
+
+
+search_tasks = SupersedingTasks()
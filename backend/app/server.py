@@ -0,0 +1,220 @@
+import gc
+import logging
+import math
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import uvicorn
+
+from .cache.backends import resolve_cache_backend
+from .core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_CPU_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_CPU_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+CRASH_LOOP_WINDOW = 5.0
+CRASH_LOOP_BACKOFF = 1.0
+
+
+def _read(path: str) -> str:
+    with open(path, encoding="ascii") as handle:
+        return handle.read().strip()
+
+
+def cgroup_cpu_limit() -> Optional[float]:
+    try:
+        quota, period = _read(CGROUP_V2_CPU_MAX).split()[:2]
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        quota, period = int(_read(CGROUP_V1_CPU_QUOTA)), int(_read(CGROUP_V1_CPU_PERIOD))
+    except (OSError, ValueError):
+        return None
+    return quota / period if quota > 0 and period > 0 else None
+
+
+def available_cpus() -> int:
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+    return max(cpus, 1)
+
+
+def worker_count(settings: Settings) -> int:
+    return settings.backend_workers if settings.backend_workers > 0 else available_cpus()
+
+
+def _has_module(name: str) -> bool:
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
+
+def event_loop_implementation() -> str:
+    return "uvloop" if sys.platform != "win32" and _has_module("uvloop") else "asyncio"
+
+
+def http_implementation() -> str:
+    return "httptools" if _has_module("httptools") else "h11"
+
+
+def preload_app(settings: Settings) -> Any:
+    import anyio._backends._asyncio  # noqa: F401
+
+    from .auth.jwt.tokens import verification_key
+    from .main import app
+
+    verification_key(settings)
+    app.openapi()
+    app.middleware_stack = app.build_middleware_stack()
+    gc.collect()
+    gc.freeze()
+    return app
+
+
+class WorkerSupervisor:
+    def __init__(self, app: Any, settings: Settings, workers: int) -> None:
+        self.app = app
+        self.settings = settings
+        self.workers = max(workers, 1)
+        self._children: Dict[int, Tuple[int, float]] = {}
+        self._socket: Optional[socket.socket] = None
+        self._stopping = False
+
+    def run(self) -> int:
+        self._socket = uvicorn.Config(
+            self.app,
+            host=self.settings.host,
+            port=self.settings.port,
+            backlog=self.settings.backend_backlog,
+        ).bind_socket()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self._handle_stop)
+        logger.info(
+            "Starting %s workers on %s:%s (loop=%s, http=%s)",
+            self.workers,
+            self.settings.host,
+            self.settings.port,
+            event_loop_implementation(),
+            http_implementation(),
+        )
+
+        try:
+            while not self._stopping:
+                self._reap()
+                for slot in self._free_slots():
+                    if self._stopping:
+                        break
+                    self._spawn(slot)
+                time.sleep(0.2)
+        finally:
+            self._shutdown()
+            self._socket.close()
+        return 0
+
+    def _handle_stop(self, signum: int, frame: Any) -> None:
+        self._stopping = True
+
+    def _free_slots(self) -> List[int]:
+        taken = {slot for slot, _ in self._children.values()}
+        return [slot for slot in range(self.workers) if slot not in taken]
+
+    def _spawn(self, slot: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                self.app.state.worker_slot = slot
+                self.app.state.worker_count = self.workers
+                self._serve_worker()
+            except BaseException:
+                logger.exception("Worker %s crashed", os.getpid())
+                code = 1
+            finally:
+                os._exit(code)
+        self._children[pid] = (slot, time.monotonic())
+
+    def _serve_worker(self) -> None:
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, signal.SIG_DFL)
+        max_requests = None
+        if self.settings.backend_max_requests > 0:
+            jitter = self.settings.backend_max_requests_jitter
+            max_requests = self.settings.backend_max_requests + (
+                int.from_bytes(os.urandom(2), "big") % (jitter + 1) if jitter > 0 else 0
+            )
+        config = uvicorn.Config(
+            self.app,
+            loop=event_loop_implementation(),
+            http=http_implementation(),
+            lifespan="on",
+            log_level=self.settings.log_level.lower(),
+            limit_max_requests=max_requests,
+            timeout_graceful_shutdown=self.settings.backend_graceful_timeout,
+            timeout_keep_alive=self.settings.backend_keepalive_timeout,
+        )
+        uvicorn.Server(config).run(sockets=[self._socket])
+
+    def _reap(self) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            _, started_at = self._children.pop(pid, (None, time.monotonic()))
+            code = os.waitstatus_to_exitcode(status)
+            if self._stopping:
+                continue
+            if code == 0:
+                logger.info("Worker %s exited after reaching its request limit, replacing it", pid)
+            else:
+                logger.warning("Worker %s exited with code %s, replacing it", pid, code)
+                if time.monotonic() - started_at < CRASH_LOOP_WINDOW:
+                    time.sleep(CRASH_LOOP_BACKOFF)
+
+    def _shutdown(self) -> None:
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self._children.pop(pid, None)
+        deadline = time.monotonic() + self.settings.backend_graceful_timeout + 5
+        while self._children and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+        for pid in list(self._children):
+            logger.warning("Worker %s did not stop in time, killing it", pid)
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        self._children.clear()
+
+
+def main() -> int:
+    settings = get_settings()
+    workers = worker_count(settings)
+    settings.cache_backend = resolve_cache_backend(settings.cache_backend, workers)
+    app = preload_app(settings)
+    return WorkerSupervisor(app, settings, workers).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
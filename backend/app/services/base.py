@@ -1,9 +1,20 @@
-from typing import Any, Dict, Optional
+import asyncio
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
 
 import httpx
+from pydantic import BaseModel, ValidationError
 
+from ..cache import ResponseCache, get_response_cache
 from ..clients.remnawave import RemnaWaveAdminAPIClient
-from ..utils import normalize_payload
+from ..core.config import get_settings
+from ..core.tracing import span
+from ..utils import decode_payload
+from ..utils.http_cache import record_upstream_last_modified
+
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
 
 
 class RemoteServiceError(RuntimeError):
@@ -13,9 +24,34 @@ class RemoteServiceError(RuntimeError):
         self.detail = detail
 
 
+class AdaptivePageSize:
+    def __init__(self, *, initial: int, minimum: int, maximum: int, target_latency_ms: float) -> None:
+        self.minimum = max(minimum, 1)
+        self.maximum = max(maximum, self.minimum)
+        self.size = min(max(initial, self.minimum), self.maximum)
+        self._target_latency_ms = target_latency_ms
+
+    def observe(self, latency_ms: float) -> None:
+        if latency_ms > self._target_latency_ms:
+            self.size = max(self.size // 2, self.minimum)
+        elif latency_ms < self._target_latency_ms / 2:
+            self.size = min(self.size * 2, self.maximum)
+
+    def cap(self, limit: int) -> None:
+        self.maximum = max(min(self.maximum, limit), 1)
+        self.minimum = min(self.minimum, self.maximum)
+        self.size = min(self.size, self.maximum)
+
+
 class BaseService:
-    def __init__(self, client: RemnaWaveAdminAPIClient) -> None:
+    list_items_key = "items"
+    detail_item_key: Optional[str] = None
+
+    def __init__(self, client: RemnaWaveAdminAPIClient, cache: Optional[ResponseCache] = None) -> None:
         self._client = client
+        self._cache = cache or get_response_cache()
+        self.last_latency_ms = 0.0
+        self.last_total: Optional[int] = None
 
     async def _request(
         self,
@@ -25,6 +61,59 @@ class BaseService:
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
+        if method == "GET":
+            ttl = self._cache.policy.ttl_for(path)
+            if ttl > 0:
+                entry = await self._cache.get_or_fetch(
+                    self._cache.make_key(path, params),
+                    ttl,
+                    lambda: self._fetch(method, path, params=params),
+                )
+                self.last_latency_ms = entry.latency_ms
+                if entry.error is not None:
+                    raise RemoteServiceError(
+                        status_code=entry.error.status_code,
+                        detail=entry.error.detail,
+                    )
+                record_upstream_last_modified(entry.last_modified)
+                return entry.value
+
+        payload, self.last_latency_ms, last_modified = await self._fetch(method, path, params=params, json=json)
+        if method != "GET":
+            await self._after_mutation(method, path, payload, last_modified)
+        record_upstream_last_modified(last_modified)
+        return payload
+
+    async def _after_mutation(
+        self,
+        method: str,
+        path: str,
+        payload: Dict[str, Any],
+        last_modified: Optional[str],
+    ) -> None:
+        resource = self._resource_prefix(path)
+        item = payload.get(self.detail_item_key, payload) if self.detail_item_key else None
+        if method == "PATCH" and isinstance(item, dict) and "id" in item:
+            await self._cache.write_through(
+                resource,
+                item["id"],
+                item,
+                detail_key=self._cache.make_key(path),
+                detail_value=payload,
+                last_modified=last_modified,
+            )
+            return
+        await self._cache.invalidate(resource)
+
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Dict[str, Any], float, Optional[str]]:
+        start = time.perf_counter()
         try:
             response = await self._client.request(
                 method=method,
@@ -39,7 +128,126 @@ class BaseService:
             ) from exc
         except httpx.HTTPError as exc:
             raise RemoteServiceError(status_code=503, detail=str(exc)) from exc
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        with span("normalize_payload", {"payload.bytes": len(response.content)}):
+            payload = decode_payload(response.content)
+        return payload, latency_ms, response.headers.get("last-modified")
+
+    def _validate(self, model: Type[M], payload: Any) -> M:
+        with span("pydantic.validate", {"model": model.__name__}):
+            return model.model_validate(payload)
+
+    async def _iter_items(
+        self,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        settings = get_settings()
+        sizer = AdaptivePageSize(
+            initial=page_size or settings.pagination_page_size,
+            minimum=settings.pagination_min_page_size,
+            maximum=settings.pagination_max_page_size,
+            target_latency_ms=settings.pagination_target_latency_ms,
+        )
+        concurrency = max(concurrency or settings.pagination_concurrency, 1)
+
+        async def fetch_page(offset: int, limit: int) -> Tuple[Dict[str, Any], float]:
+            page_params = {**(params or {}), "limit": limit, "offset": offset}
+            payload, latency_ms, _ = await self._fetch("GET", path, params=page_params)
+            return payload, latency_ms
+
+        requested = sizer.size
+        first, latency_ms = await fetch_page(0, requested)
+        items = self._list_items(first)
+        for item in items:
+            yield item
+
+        total = first.get("total")
+        self.last_total = total if isinstance(total, int) else None
+        offset = len(items)
+        if items and len(items) < requested and (not isinstance(total, int) or offset < total):
+            sizer.cap(len(items))
+        sizer.observe(latency_ms)
+
+        if not isinstance(total, int):
+            while items:
+                requested = sizer.size
+                page, latency_ms = await fetch_page(offset, requested)
+                items = self._list_items(page)
+                for item in items:
+                    yield item
+                offset += len(items)
+                if items and len(items) < requested:
+                    sizer.cap(len(items))
+                sizer.observe(latency_ms)
+            return
+
+        while offset < total:
+            size = sizer.size
+            window: List[int] = []
+            page_offset = offset
+            while page_offset < total and len(window) < concurrency:
+                window.append(page_offset)
+                page_offset += size
+
+            pages = await asyncio.gather(*(fetch_page(page_offset, size) for page_offset in window))
+            sizer.observe(sum(latency for _, latency in pages) / len(pages))
+            for page_offset, (page, _) in zip(window, pages):
+                page_items = self._list_items(page)
+                for item in page_items:
+                    yield item
+                offset = page_offset + len(page_items)
+                if len(page_items) < min(size, total - page_offset):
+                    if not page_items:
+                        return
+                    sizer.cap(len(page_items))
+                    break
+
+    async def _fetch_many(
+        self,
+        ids: Iterable[int],
+        fetch_one: Callable[[int], Awaitable[T]],
+        *,
+        concurrency: Optional[int] = None,
+    ) -> Dict[int, Union[T, RemoteServiceError]]:
+        semaphore = asyncio.Semaphore(max(concurrency or get_settings().batch_concurrency, 1))
+
+        async def run(item_id: int) -> Union[T, RemoteServiceError]:
+            async with semaphore:
+                try:
+                    return await fetch_one(item_id)
+                except RemoteServiceError as exc:
+                    return exc
+                except ValidationError as exc:
+                    return RemoteServiceError(
+                        status_code=502,
+                        detail=f"Invalid upstream payload: {exc.error_count()} validation error(s)",
+                    )
+
+        unique_ids = list(dict.fromkeys(ids))
+        results = await asyncio.gather(*(run(item_id) for item_id in unique_ids))
+        return dict(zip(unique_ids, results))
+
+    def _list_items(self, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return payload.get("items") or payload.get(self.list_items_key) or []
+
+    def _ensure_list_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        items = self._list_items(payload)
+        total = payload.get("total", len(items))
+        limit = payload.get("limit")
+        offset = payload.get("offset")
+
+        return {
+            "items": items,
+            "total": total,
+            "limit": limit or len(items),
+            "offset": offset or 0,
+        }
 
-        payload = response.json()
-        normalized = normalize_payload(payload)
-        return normalized
+    @staticmethod
+    def _resource_prefix(path: str) -> str:
+        return "/" + path.strip("/").split("/", 1)[0]
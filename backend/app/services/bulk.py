@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, Optional, Union
+
+import httpx
+from fastapi import HTTPException
+
+from ..clients.resilience import RetryPolicy, parse_retry_after, write_not_applied
+from ..core.config import get_settings
+from ..schemas.bulk import BulkItemResult, BulkProgress, BulkReport
+from ..utils.ratelimit import RateLimiter
+from .base import RemoteServiceError
+
+logger = logging.getLogger(__name__)
+
+
+class BulkOperationRunner:
+    def __init__(
+        self,
+        *,
+        concurrency: int,
+        rate_limit: float,
+        max_retries: int,
+        retry_backoff: float = 0.5,
+    ) -> None:
+        self._concurrency = max(concurrency, 1)
+        self._limiter = RateLimiter(rate_limit, burst=self._concurrency)
+        self._max_retries = max(max_retries, 0)
+        self._retry_backoff = retry_backoff
+
+    @classmethod
+    def from_settings(cls) -> "BulkOperationRunner":
+        settings = get_settings()
+        return cls(
+            concurrency=settings.bulk_concurrency,
+            rate_limit=settings.bulk_rate_limit,
+            max_retries=settings.bulk_max_retries,
+        )
+
+    async def run(
+        self,
+        ids: Iterable[int],
+        apply: Callable[[int], Awaitable[Any]],
+    ) -> AsyncIterator[Union[BulkProgress, BulkReport]]:
+        started = time.perf_counter()
+        unique_ids = list(dict.fromkeys(ids))
+        queue: "asyncio.Queue[BulkItemResult]" = asyncio.Queue()
+        pending = iter(unique_ids)
+
+        async def worker() -> None:
+            for item_id in pending:
+                queue.put_nowait(await self._apply(item_id, apply))
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self._concurrency, len(unique_ids)))]
+        succeeded: List[int] = []
+        failures: List[BulkItemResult] = []
+        try:
+            for completed in range(1, len(unique_ids) + 1):
+                result = await queue.get()
+                if result.success:
+                    succeeded.append(result.id)
+                else:
+                    failures.append(result)
+                yield BulkProgress(completed=completed, total=len(unique_ids), result=result)
+        finally:
+            for task in workers:
+                task.cancel()
+
+        yield BulkReport(
+            total=len(unique_ids),
+            succeeded=len(succeeded),
+            failed=len(failures),
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+            succeeded_ids=succeeded,
+            failures=failures,
+        )
+
+    async def _apply(self, item_id: int, apply: Callable[[int], Awaitable[Any]]) -> BulkItemResult:
+        attempt = 0
+        while True:
+            attempt += 1
+            await self._limiter.acquire()
+            try:
+                await apply(item_id)
+                return BulkItemResult(id=item_id, success=True, attempts=attempt)
+            except (RemoteServiceError, HTTPException) as exc:
+                status_code, detail, cause = exc.status_code, str(exc.detail), self._upstream_error(exc)
+            except Exception as exc:
+                logger.exception("Bulk operation failed for id=%s", item_id)
+                return BulkItemResult(id=item_id, success=False, status_code=500, detail=str(exc), attempts=attempt)
+
+            delay = self._retry_delay(attempt, cause) if attempt <= self._max_retries else None
+            if delay is None:
+                return BulkItemResult(
+                    id=item_id,
+                    success=False,
+                    status_code=status_code,
+                    detail=detail,
+                    attempts=attempt,
+                )
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _upstream_error(exc: Optional[BaseException]) -> Optional[BaseException]:
+        while exc is not None and not isinstance(exc, httpx.HTTPError):
+            exc = exc.__cause__ or exc.__context__
+        return exc
+
+    def _retry_delay(self, attempt: int, cause: Optional[BaseException]) -> Optional[float]:
+        if cause is None or not write_not_applied(cause):
+            return None
+        if isinstance(cause, httpx.HTTPStatusError):
+            retry_after = parse_retry_after(cause.response.headers.get("retry-after"))
+            if retry_after is not None:
+                return retry_after if retry_after <= RetryPolicy.max_retry_after else None
+        return self._retry_backoff * 2 ** (attempt - 1)
@@ -0,0 +1,77 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Dict, Optional, Set, Tuple
+
+from fastapi import HTTPException
+
+from ..clients.remnawave import RemnaWaveAdminAPIClient
+from ..core.config import get_settings
+from ..readmodel import ReadModelStore
+from ..schemas.dashboard import DashboardResponse, DashboardSectionStatus
+from .base import RemoteServiceError
+from .health import HealthService
+from .stats import StatsService
+from .subscriptions import SubscriptionsService
+from .users import UsersService
+
+logger = logging.getLogger(__name__)
+
+_background_sections: Set["asyncio.Future[Any]"] = set()
+
+
+class DashboardService:
+    def __init__(
+        self,
+        client: RemnaWaveAdminAPIClient,
+        read_model: Optional[ReadModelStore] = None,
+        section_timeout: Optional[float] = None,
+    ) -> None:
+        self._client = client
+        self._read_model = read_model
+        self._section_timeout = section_timeout or get_settings().dashboard_section_timeout
+
+    async def get_dashboard(self, *, recent_limit: int) -> DashboardResponse:
+        users = UsersService(self._client, read_model=self._read_model)
+        subscriptions = SubscriptionsService(self._client, read_model=self._read_model)
+        sections: Dict[str, Awaitable[Any]] = {
+            "health": HealthService(self._client).get_health(),
+            "stats": StatsService(self._client).get_overview(),
+            "recent_users": users.list_users(limit=recent_limit, offset=0),
+            "recent_subscriptions": subscriptions.list_subscriptions(limit=recent_limit, offset=0),
+        }
+        results = await asyncio.gather(
+            *(self._run_section(name, awaitable) for name, awaitable in sections.items())
+        )
+
+        payload: Dict[str, Any] = {"sections": {}}
+        for name, (value, status) in zip(sections, results):
+            payload[name] = value
+            payload["sections"][name] = status
+        return DashboardResponse.model_validate(payload)
+
+    async def _run_section(self, name: str, awaitable: Awaitable[Any]) -> Tuple[Any, DashboardSectionStatus]:
+        started = time.perf_counter()
+        value = None
+        status: Dict[str, Any] = {"status": "ok"}
+        section = asyncio.ensure_future(awaitable)
+        try:
+            value = await asyncio.wait_for(asyncio.shield(section), timeout=self._section_timeout)
+        except asyncio.TimeoutError:
+            _background_sections.add(section)
+            section.add_done_callback(_finish_background_section)
+            status = {"status": "timeout", "detail": f"No response within {self._section_timeout:g}s"}
+        except (HTTPException, RemoteServiceError) as exc:
+            status = {"status": "error", "status_code": exc.status_code, "detail": str(exc.detail)}
+        except Exception as exc:
+            logger.exception("Dashboard section %s failed", name)
+            status = {"status": "error", "detail": str(exc) or exc.__class__.__name__}
+
+        status["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return value, DashboardSectionStatus.model_validate(status)
+
+
+def _finish_background_section(section: "asyncio.Future[Any]") -> None:
+    _background_sections.discard(section)
+    if not section.cancelled() and section.exception() is not None:
+        logger.warning("Dashboard section failed after timing out: %s", section.exception())
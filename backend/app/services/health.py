@@ -1,5 +1,4 @@
-import time
-from typing import Any, Dict, Tuple
+from typing import Any, Dict
 
 from ..clients.remnawave import RemnaWaveAdminAPIClient
 from ..schemas.health import HealthResponse
@@ -7,23 +6,11 @@ from .base import BaseService
 
 
 class HealthService(BaseService):
-    _cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
-    _cache_ttl_seconds: float = 15.0
-
     def __init__(self, client: RemnaWaveAdminAPIClient) -> None:
         super().__init__(client)
 
     async def get_health(self) -> HealthResponse:
-        cache_key = "health"
-        now = time.time()
-        cached = self._cache.get(cache_key)
-
-        if cached and now - cached[0] <= self._cache_ttl_seconds:
-            return HealthResponse.model_validate(cached[1])
-
-        start = time.perf_counter()
         payload = await self._request("GET", "/health")
-        latency_ms = (time.perf_counter() - start) * 1000
 
         response_data = {
             "status": payload.get("status", "unknown"),
@@ -31,11 +18,10 @@ class HealthService(BaseService):
             "bot_version": payload.get("bot_version"),
             "components": self._build_components(payload),
             "features": self._build_features(payload),
-            "latency_ms": round(latency_ms, 2),
+            "latency_ms": round(self.last_latency_ms, 2),
         }
 
-        self._cache[cache_key] = (now, response_data)
-        return HealthResponse.model_validate(response_data)
+        return self._validate(HealthResponse, response_data)
 
     def _build_components(self, payload: Dict[str, Any]) -> Dict[str, bool]:
         raw_components = payload.get("components") or {}
@@ -1,5 +1,4 @@
-import time
-from typing import Any, Dict, Tuple
+from typing import Any, Dict
 
 from ..clients.remnawave import RemnaWaveAdminAPIClient
 from ..schemas.stats import StatsBlock, StatsOverviewResponse, StatsPaymentsBlock
@@ -7,20 +6,10 @@ from .base import BaseService
 
 
 class StatsService(BaseService):
-    _cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
-    _cache_ttl_seconds: float = 60.0
-
     def __init__(self, client: RemnaWaveAdminAPIClient) -> None:
         super().__init__(client)
 
     async def get_overview(self) -> StatsOverviewResponse:
-        cache_key = "overview"
-        cached = self._cache.get(cache_key)
-        now = time.time()
-
-        if cached and now - cached[0] <= self._cache_ttl_seconds:
-            return StatsOverviewResponse.model_validate(cached[1])
-
         payload = await self._request("GET", "/stats/overview")
         overview = {
             "users": self._build_stats_block(payload.get("users", {})),
@@ -30,8 +19,7 @@ class StatsService(BaseService):
             "meta": payload.get("meta", {}),
         }
 
-        self._cache[cache_key] = (now, overview)
-        return StatsOverviewResponse.model_validate(overview)
+        return self._validate(StatsOverviewResponse, overview)
 
     def _build_stats_block(self, raw: Dict[str, Any]) -> StatsBlock:
         mapping = {
@@ -1,19 +1,31 @@
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from fastapi import HTTPException
 
 from ..clients.remnawave import RemnaWaveAdminAPIClient
+from ..core.config import get_settings
+from ..readmodel import ReadModelStore
+from ..schemas.bulk import BulkProgress, BulkReport
+from ..schemas.common import BatchItemError
 from ..schemas.subscriptions import (
+    Subscription,
+    SubscriptionBatchItem,
+    SubscriptionBatchResponse,
     SubscriptionDetailResponse,
     SubscriptionListResponse,
     SubscriptionUpdateRequest,
 )
 from .base import BaseService, RemoteServiceError
+from .bulk import BulkOperationRunner
 
 
 class SubscriptionsService(BaseService):
-    def __init__(self, client: RemnaWaveAdminAPIClient) -> None:
+    list_items_key = "subscriptions"
+    detail_item_key = "subscription"
+
+    def __init__(self, client: RemnaWaveAdminAPIClient, read_model: Optional[ReadModelStore] = None) -> None:
         super().__init__(client)
+        self._read_model = read_model
 
     async def list_subscriptions(
         self,
@@ -24,25 +36,69 @@ class SubscriptionsService(BaseService):
         user_id: Optional[int] = None,
         is_trial: Optional[bool] = None,
     ) -> SubscriptionListResponse:
+        if self._read_model and self._read_model.is_fresh(
+            "subscriptions", get_settings().read_model_max_staleness
+        ):
+            items, total = await self._read_model.list_subscriptions(
+                limit=limit,
+                offset=offset,
+                status=status,
+                user_id=user_id,
+                is_trial=is_trial,
+            )
+            return SubscriptionListResponse(
+                items=[Subscription.model_validate(item) for item in items],
+                total=total,
+                limit=limit,
+                offset=offset,
+            )
+
         params: Dict[str, Any] = {
             "limit": limit,
             "offset": offset,
+            **self._filter_params(status, user_id, is_trial),
         }
-        if status:
-            params["status"] = status
-        if user_id is not None:
-            params["user_id"] = user_id
-        if is_trial is not None:
-            params["is_trial"] = str(is_trial).lower()
 
         payload = await self._safe_request("GET", "/subscriptions", params=params)
         normalized = self._ensure_list_payload(payload)
-        return SubscriptionListResponse.model_validate(normalized)
+        return self._validate(SubscriptionListResponse, normalized)
+
+    async def iter_subscriptions(
+        self,
+        *,
+        status: Optional[str] = None,
+        user_id: Optional[int] = None,
+        is_trial: Optional[bool] = None,
+    ) -> AsyncIterator[Subscription]:
+        items = self._iter_items(
+            "/subscriptions",
+            params=self._filter_params(status, user_id, is_trial),
+        )
+        try:
+            async for item in items:
+                yield Subscription.model_validate(item)
+        except RemoteServiceError as exc:
+            raise HTTPException(status_code=exc.status_code, detail=exc.detail)
 
     async def get_subscription(self, subscription_id: int) -> SubscriptionDetailResponse:
         payload = await self._safe_request("GET", f"/subscriptions/{subscription_id}")
         normalized = self._ensure_detail_payload(payload)
-        return SubscriptionDetailResponse.model_validate(normalized)
+        return self._validate(SubscriptionDetailResponse, normalized)
+
+    async def get_subscriptions_batch(self, subscription_ids: List[int]) -> SubscriptionBatchResponse:
+        async def fetch_one(subscription_id: int) -> SubscriptionDetailResponse:
+            payload = await self._request("GET", f"/subscriptions/{subscription_id}")
+            return SubscriptionDetailResponse.model_validate(self._ensure_detail_payload(payload))
+
+        results = await self._fetch_many(subscription_ids, fetch_one)
+        items: Dict[int, SubscriptionBatchItem] = {}
+        for subscription_id, result in results.items():
+            if isinstance(result, RemoteServiceError):
+                error = BatchItemError(status_code=result.status_code, detail=result.detail)
+                items[subscription_id] = SubscriptionBatchItem(error=error)
+            else:
+                items[subscription_id] = SubscriptionBatchItem(subscription=result.subscription)
+        return SubscriptionBatchResponse(items=items)
 
     async def update_subscription(
         self, subscription_id: int, request: SubscriptionUpdateRequest
@@ -50,7 +106,19 @@ class SubscriptionsService(BaseService):
         body = request.model_dump(exclude_none=True)
         payload = await self._safe_request("PATCH", f"/subscriptions/{subscription_id}", json=body)
         normalized = self._ensure_detail_payload(payload)
-        return SubscriptionDetailResponse.model_validate(normalized)
+        response = SubscriptionDetailResponse.model_validate(normalized)
+        if self._read_model:
+            await self._read_model.upsert_subscriptions([response.subscription.model_dump()])
+        return response
+
+    def bulk_update_subscriptions(
+        self, subscription_ids: List[int], request: SubscriptionUpdateRequest
+    ) -> AsyncIterator[Union[BulkProgress, BulkReport]]:
+        runner = BulkOperationRunner.from_settings()
+        return runner.run(
+            subscription_ids,
+            lambda subscription_id: self.update_subscription(subscription_id, request),
+        )
 
     async def _safe_request(
         self,
@@ -64,18 +132,20 @@ class SubscriptionsService(BaseService):
         except RemoteServiceError as exc:
             raise HTTPException(status_code=exc.status_code, detail=exc.detail)
 
-    def _ensure_list_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        items = payload.get("items") or payload.get("subscriptions") or []
-        total = payload.get("total", len(items))
-        limit = payload.get("limit")
-        offset = payload.get("offset")
-
-        return {
-            "items": items,
-            "total": total,
-            "limit": limit or len(items),
-            "offset": offset or 0,
-        }
+    def _filter_params(
+        self,
+        status: Optional[str],
+        user_id: Optional[int],
+        is_trial: Optional[bool],
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if status:
+            params["status"] = status
+        if user_id is not None:
+            params["user_id"] = user_id
+        if is_trial is not None:
+            params["is_trial"] = str(is_trial).lower()
+        return params
 
     def _ensure_detail_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         if "subscription" in payload:
@@ -1,9 +1,11 @@
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from fastapi import HTTPException
 
 from ..clients.remnawave import RemnaWaveAdminAPIClient
+from ..search import SearchIndex, token_search_texts
 from ..schemas.tokens import (
+    Token,
     TokenCreateRequest,
     TokenCreateResponse,
     TokenListResponse,
@@ -13,8 +15,11 @@ from .base import BaseService, RemoteServiceError
 
 
 class TokensService(BaseService):
-    def __init__(self, client: RemnaWaveAdminAPIClient) -> None:
+    list_items_key = "tokens"
+
+    def __init__(self, client: RemnaWaveAdminAPIClient, search_index: Optional[SearchIndex] = None) -> None:
         super().__init__(client)
+        self._search_index = search_index
 
     async def list_tokens(
         self,
@@ -23,25 +28,56 @@ class TokensService(BaseService):
         offset: int,
         search: Optional[str] = None,
     ) -> TokenListResponse:
+        if search and self._search_index and self._search_index.ready:
+            token_ids, total = self._search_index.search(search, limit=limit, offset=offset)
+            documents = [self._search_index.document(token_id) for token_id in token_ids]
+            items = [item for item in documents if item is not None]
+            return TokenListResponse(
+                items=items,
+                total=total - (len(token_ids) - len(items)),
+                limit=limit,
+                offset=offset,
+            )
+
         params: Dict[str, Any] = {"limit": limit, "offset": offset}
         if search:
             params["search"] = search
 
         payload = await self._safe_request("GET", "/tokens", params=params)
         normalized = self._ensure_list_payload(payload)
-        return TokenListResponse.model_validate(normalized)
+        return self._validate(TokenListResponse, normalized)
 
     async def create_token(self, request: TokenCreateRequest) -> TokenCreateResponse:
         body = request.model_dump(exclude_none=True)
         payload = await self._safe_request("POST", "/tokens", json=body)
         normalized = self._ensure_create_payload(payload)
-        return TokenCreateResponse.model_validate(normalized)
+        response = TokenCreateResponse.model_validate(normalized)
+        if self._search_index:
+            token = response.token
+            self._search_index.upsert(token.id, token_search_texts(token), document=token)
+        return response
 
     async def revoke_token(self, token_id: int) -> TokenRevokeResponse:
         payload = await self._safe_request("POST", f"/tokens/{token_id}/revoke")
-        return TokenRevokeResponse.model_validate(
+        response = TokenRevokeResponse.model_validate(
             {"success": payload.get("success", True)}
         )
+        if self._search_index and response.success:
+            token = self._search_index.document(token_id)
+            if token is not None:
+                self._search_index.upsert(
+                    token_id,
+                    token_search_texts(token),
+                    document=token.model_copy(update={"is_active": False}),
+                )
+        return response
+
+    async def iter_tokens(self) -> AsyncIterator[Token]:
+        try:
+            async for item in self._iter_items("/tokens"):
+                yield Token.model_validate(item)
+        except RemoteServiceError as exc:
+            raise HTTPException(status_code=exc.status_code, detail=exc.detail)
 
     async def _safe_request(
         self,
@@ -55,18 +91,18 @@ class TokensService(BaseService):
         except RemoteServiceError as exc:
             raise HTTPException(status_code=exc.status_code, detail=exc.detail)
 
-    def _ensure_list_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        items = payload.get("items") or payload.get("tokens") or []
-        total = payload.get("total", len(items))
-        limit = payload.get("limit")
-        offset = payload.get("offset")
-
-        return {
-            "items": items,
-            "total": total,
-            "limit": limit or len(items),
-            "offset": offset or 0,
-        }
+    async def _after_mutation(
+        self,
+        method: str,
+        path: str,
+        payload: Dict[str, Any],
+        last_modified: Optional[str],
+    ) -> None:
+        segments = path.strip("/").split("/")
+        if len(segments) == 3 and segments[2] == "revoke" and segments[1].isdigit() and payload.get("success", True):
+            await self._cache.write_through("/tokens", int(segments[1]), {"is_active": False})
+            return
+        await super()._after_mutation(method, path, payload, last_modified)
 
     def _ensure_create_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         if "token" in payload:
@@ -1,15 +1,38 @@
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from fastapi import HTTPException
 
 from ..clients.remnawave import RemnaWaveAdminAPIClient
-from ..schemas.users import UserDetailResponse, UserListResponse, UserUpdateRequest
+from ..core.config import get_settings
+from ..readmodel import ReadModelStore
+from ..search import SearchIndex, user_search_texts
+from ..schemas.bulk import BulkProgress, BulkReport
+from ..schemas.common import BatchItemError
+from ..schemas.users import (
+    UserBatchItem,
+    UserBatchResponse,
+    UserDetailResponse,
+    UserListResponse,
+    UserSummary,
+    UserUpdateRequest,
+)
 from .base import BaseService, RemoteServiceError
+from .bulk import BulkOperationRunner
 
 
 class UsersService(BaseService):
-    def __init__(self, client: RemnaWaveAdminAPIClient) -> None:
+    list_items_key = "users"
+    detail_item_key = "user"
+
+    def __init__(
+        self,
+        client: RemnaWaveAdminAPIClient,
+        read_model: Optional[ReadModelStore] = None,
+        search_index: Optional[SearchIndex] = None,
+    ) -> None:
         super().__init__(client)
+        self._read_model = read_model
+        self._search_index = search_index
 
     async def list_users(
         self,
@@ -20,31 +43,95 @@ class UsersService(BaseService):
         promo_group_id: Optional[int] = None,
         search: Optional[str] = None,
     ) -> UserListResponse:
+        if self._can_search_index(search, status_filter, promo_group_id):
+            user_ids, total = self._search_index.search(search, limit=limit, offset=offset)
+            items = await self._hydrate_users(user_ids)
+            return UserListResponse(
+                items=items,
+                total=total - (len(user_ids) - len(items)),
+                limit=limit,
+                offset=offset,
+            )
+
+        if self._read_model and self._read_model.is_fresh("users", get_settings().read_model_max_staleness):
+            items, total = await self._read_model.list_users(
+                limit=limit,
+                offset=offset,
+                status=status_filter,
+                promo_group_id=promo_group_id,
+                search=search,
+            )
+            return UserListResponse(
+                items=[UserSummary.model_validate(item) for item in items],
+                total=total,
+                limit=limit,
+                offset=offset,
+            )
+
         params: Dict[str, Any] = {
             "limit": limit,
             "offset": offset,
+            **self._filter_params(status_filter, promo_group_id, search),
         }
-        if status_filter:
-            params["status"] = status_filter
-        if promo_group_id is not None:
-            params["promo_group_id"] = promo_group_id
-        if search:
-            params["search"] = search
 
         payload = await self._safe_request("GET", "/users", params=params)
         normalized = self._ensure_list_payload(payload)
-        return UserListResponse.model_validate(normalized)
+        return self._validate(UserListResponse, normalized)
+
+    async def iter_users(
+        self,
+        *,
+        status_filter: Optional[str] = None,
+        promo_group_id: Optional[int] = None,
+        search: Optional[str] = None,
+    ) -> AsyncIterator[UserSummary]:
+        items = self._iter_items(
+            "/users",
+            params=self._filter_params(status_filter, promo_group_id, search),
+        )
+        try:
+            async for item in items:
+                yield UserSummary.model_validate(item)
+        except RemoteServiceError as exc:
+            raise HTTPException(status_code=exc.status_code, detail=exc.detail)
 
     async def get_user(self, user_id: int) -> UserDetailResponse:
         payload = await self._safe_request("GET", f"/users/{user_id}")
         normalized = self._ensure_detail_payload(payload)
-        return UserDetailResponse.model_validate(normalized)
+        return self._validate(UserDetailResponse, normalized)
+
+    async def get_users_batch(self, user_ids: List[int]) -> UserBatchResponse:
+        async def fetch_one(user_id: int) -> UserDetailResponse:
+            payload = await self._request("GET", f"/users/{user_id}")
+            return UserDetailResponse.model_validate(self._ensure_detail_payload(payload))
+
+        results = await self._fetch_many(user_ids, fetch_one)
+        items: Dict[int, UserBatchItem] = {}
+        for user_id, result in results.items():
+            if isinstance(result, RemoteServiceError):
+                error = BatchItemError(status_code=result.status_code, detail=result.detail)
+                items[user_id] = UserBatchItem(error=error)
+            else:
+                items[user_id] = UserBatchItem(user=result.user)
+        return UserBatchResponse(items=items)
 
     async def update_user(self, user_id: int, payload: UserUpdateRequest) -> UserDetailResponse:
         body = payload.model_dump(exclude_none=True)
         response_payload = await self._safe_request("PATCH", f"/users/{user_id}", json=body)
         normalized = self._ensure_detail_payload(response_payload)
-        return UserDetailResponse.model_validate(normalized)
+        response = UserDetailResponse.model_validate(normalized)
+        summary = UserSummary.model_validate(response.user.model_dump())
+        if self._read_model:
+            await self._read_model.upsert_users([summary.model_dump()])
+        if self._search_index:
+            self._search_index.upsert(summary.id, user_search_texts(summary))
+        return response
+
+    def bulk_update_users(
+        self, user_ids: List[int], payload: UserUpdateRequest
+    ) -> AsyncIterator[Union[BulkProgress, BulkReport]]:
+        runner = BulkOperationRunner.from_settings()
+        return runner.run(user_ids, lambda user_id: self.update_user(user_id, payload))
 
     async def _safe_request(
         self,
@@ -58,18 +145,49 @@ class UsersService(BaseService):
         except RemoteServiceError as exc:
             raise HTTPException(status_code=exc.status_code, detail=exc.detail)
 
-    def _ensure_list_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        items = payload.get("items") or payload.get("users") or []
-        total = payload.get("total", len(items))
-        limit = payload.get("limit")
-        offset = payload.get("offset")
-
-        return {
-            "items": items,
-            "total": total,
-            "limit": limit or len(items),
-            "offset": offset or 0,
-        }
+    async def _hydrate_users(self, user_ids: List[int]) -> List[UserSummary]:
+        users: Dict[int, UserSummary] = {}
+        if self._read_model:
+            stored = await self._read_model.get_users(user_ids)
+            users = {user_id: UserSummary.model_validate(data) for user_id, data in stored.items()}
+
+        async def fetch_one(user_id: int) -> UserSummary:
+            payload = await self._request("GET", f"/users/{user_id}")
+            detail = UserDetailResponse.model_validate(self._ensure_detail_payload(payload))
+            return UserSummary.model_validate(detail.user.model_dump())
+
+        missing = [user_id for user_id in user_ids if user_id not in users]
+        for user_id, result in (await self._fetch_many(missing, fetch_one)).items():
+            if isinstance(result, UserSummary):
+                users[user_id] = result
+            elif result.status_code == 404 and self._search_index:
+                self._search_index.remove(user_id)
+        return [users[user_id] for user_id in user_ids if user_id in users]
+
+    def _can_search_index(
+        self,
+        search: Optional[str],
+        status_filter: Optional[str],
+        promo_group_id: Optional[int],
+    ) -> bool:
+        if not search or self._search_index is None or not self._search_index.ready:
+            return False
+        return not status_filter and promo_group_id is None
+
+    def _filter_params(
+        self,
+        status_filter: Optional[str],
+        promo_group_id: Optional[int],
+        search: Optional[str],
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if status_filter:
+            params["status"] = status_filter
+        if promo_group_id is not None:
+            params["promo_group_id"] = promo_group_id
+        if search:
+            params["search"] = search
+        return params
 
     def _ensure_detail_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         if "user" in payload:
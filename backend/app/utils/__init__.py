@@ -1,3 +1,3 @@
-from .normalization import normalize_payload
+from .normalization import decode_payload, normalize_payload
 
-__all__ = ["normalize_payload"]
+__all__ = ["decode_payload", "normalize_payload"]
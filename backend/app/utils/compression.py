@@ -0,0 +1,146 @@
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+COMPRESSIBLE_MEDIA_TYPES = frozenset(
+    {
+        "application/json",
+        "application/problem+json",
+        "application/x-ndjson",
+        "application/javascript",
+        "application/xml",
+        "image/svg+xml",
+    }
+)
+
+
+def brotli_module() -> Any:
+    try:
+        import brotli
+    except ImportError:
+        try:
+            import brotlicffi as brotli
+        except ImportError:
+            return None
+    return brotli
+
+
+def zstandard_module() -> Any:
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+class StreamEncoder(ABC):
+    @abstractmethod
+    def compress(self, data: bytes, *, flush: bool = False) -> bytes:
+        ...
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        ...
+
+
+class GzipEncoder(StreamEncoder):
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes, *, flush: bool = False) -> bytes:
+        chunk = self._compressor.compress(data)
+        if flush:
+            chunk += self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return chunk
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliEncoder(StreamEncoder):
+    def __init__(self, level: int) -> None:
+        brotli = brotli_module()
+        self._compressor = brotli.Compressor(quality=level, mode=brotli.MODE_TEXT)
+
+    def compress(self, data: bytes, *, flush: bool = False) -> bytes:
+        chunk = self._compressor.process(data)
+        if flush:
+            chunk += self._compressor.flush()
+        return chunk
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder(StreamEncoder):
+    def __init__(self, level: int) -> None:
+        zstandard = zstandard_module()
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes, *, flush: bool = False) -> bytes:
+        chunk = self._compressor.compress(data)
+        if flush:
+            chunk += self._compressor.flush(self._flush_block)
+        return chunk
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+ENCODERS: Dict[str, Type[StreamEncoder]] = {"gzip": GzipEncoder, "br": BrotliEncoder, "zstd": ZstdEncoder}
+
+_AVAILABILITY = {"br": brotli_module, "zstd": zstandard_module}
+
+
+def encoding_available(encoding: str) -> bool:
+    if encoding not in ENCODERS:
+        return False
+    check = _AVAILABILITY.get(encoding)
+    return check is None or check() is not None
+
+
+def available_encodings(preference: Sequence[str]) -> List[str]:
+    return [encoding for encoding in preference if encoding_available(encoding)]
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    accepted: Dict[str, float] = {}
+    for item in header.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+def negotiate_encoding(header: str, preference: Sequence[str]) -> Optional[str]:
+    if not header:
+        return None
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    chosen: Optional[str] = None
+    best = 0.0
+    for encoding in preference:
+        quality = accepted.get(encoding, wildcard)
+        if quality > best:
+            chosen, best = encoding, quality
+    return chosen
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.partition(";")[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in COMPRESSIBLE_MEDIA_TYPES
+        or media_type.endswith("+json")
+    )
@@ -0,0 +1,110 @@
+import csv
+import io
+import json
+import types
+import typing
+from typing import Any, AsyncIterator, Dict, List, Type, Union
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def model_columns(model: Type[BaseModel], prefix: str = "") -> List[str]:
+    columns: List[str] = []
+    for name, field in model.model_fields.items():
+        nested = _nested_model(field.annotation)
+        if nested is not None:
+            columns.extend(model_columns(nested, f"{prefix}{name}."))
+        else:
+            columns.append(f"{prefix}{name}")
+    return columns
+
+
+def _nested_model(annotation: Any) -> Union[Type[BaseModel], None]:
+    if typing.get_origin(annotation) in (Union, types.UnionType):
+        candidates = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        annotation = candidates[0] if len(candidates) == 1 else None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    return None
+
+
+def flatten_row(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    row: Dict[str, Any] = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            row.update(flatten_row(value, f"{prefix}{key}."))
+        elif isinstance(value, list):
+            row[f"{prefix}{key}"] = json.dumps(value, ensure_ascii=False)
+        else:
+            row[f"{prefix}{key}"] = value
+    return row
+
+
+async def encode_ndjson(rows: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    async for row in rows:
+        buffer += row.model_dump_json().encode()
+        buffer += b"\n"
+        if len(buffer) >= _CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def encode_csv(rows: AsyncIterator[BaseModel], columns: List[str]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    async for row in rows:
+        writer.writerow(flatten_row(row.model_dump()))
+        if buffer.tell() >= _CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def export_response(
+    rows: AsyncIterator[BaseModel],
+    *,
+    export_format: str,
+    model: Type[BaseModel],
+    filename: str,
+) -> StreamingResponse:
+    first = await anext(rows, None)
+
+    async def chained() -> AsyncIterator[BaseModel]:
+        if first is None:
+            return
+        yield first
+        async for row in rows:
+            yield row
+
+    if export_format == "csv":
+        body = encode_csv(chained(), model_columns(model))
+    else:
+        body = encode_ndjson(chained())
+
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
+
+
+def progress_response(events: AsyncIterator[BaseModel]) -> StreamingResponse:
+    async def body() -> AsyncIterator[bytes]:
+        async for event in events:
+            yield event.model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(body(), media_type=EXPORT_MEDIA_TYPES["ndjson"])
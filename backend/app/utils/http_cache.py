@@ -0,0 +1,52 @@
+import hashlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Iterator, List, Optional
+
+_upstream_last_modified: ContextVar[Optional[List[Optional[str]]]] = ContextVar(
+    "upstream_last_modified", default=None
+)
+
+
+@contextmanager
+def upstream_validator_scope() -> Iterator[List[Optional[str]]]:
+    collected: List[Optional[str]] = []
+    token = _upstream_last_modified.set(collected)
+    try:
+        yield collected
+    finally:
+        _upstream_last_modified.reset(token)
+
+
+def record_upstream_last_modified(value: Optional[str]) -> None:
+    collected = _upstream_last_modified.get()
+    if collected is not None:
+        collected.append(value)
+
+
+def latest_last_modified(values: List[Optional[str]]) -> Optional[str]:
+    if not values or any(value is None for value in values):
+        return None
+    try:
+        return max(values, key=lambda value: parsedate_to_datetime(value))  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+
+
+def payload_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def not_modified_since(if_modified_since: str, last_modified: str) -> bool:
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
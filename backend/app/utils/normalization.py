@@ -1,20 +1,55 @@
+import json
 import re
-from typing import Any, Dict, Iterable, Union
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple, Union
 
 
 _CAMEL_PATTERN = re.compile(r"(?<!^)(?=[A-Z])")
+_FREEZE = object()
 
 
+@lru_cache(maxsize=4096)
 def to_snake_case(value: str) -> str:
     value = value.replace("-", "_")
     return _CAMEL_PATTERN.sub("_", value).lower()
 
 
+def _snake_case_object(pairs: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+    return {to_snake_case(key): value for key, value in pairs}
+
+
+def decode_payload(content: Union[bytes, str]) -> Any:
+    return json.loads(content, object_pairs_hook=_snake_case_object)
+
+
 def normalize_payload(payload: Any) -> Any:
-    if isinstance(payload, dict):
-        return {to_snake_case(str(key)): normalize_payload(value) for key, value in payload.items()}
-    if isinstance(payload, list):
-        return [normalize_payload(item) for item in payload]
-    if isinstance(payload, tuple):
-        return tuple(normalize_payload(item) for item in payload)
-    return payload
+    if not isinstance(payload, (dict, list, tuple)):
+        return payload
+
+    root: List[Any] = [None]
+    stack: List[Tuple[Any, Any, Any]] = [(payload, root, 0)]
+    while stack:
+        value, target, slot = stack.pop()
+        if value is _FREEZE:
+            target[slot] = tuple(target[slot])
+            continue
+
+        if isinstance(value, dict):
+            converted: Dict[str, Any] = {}
+            for key, item in value.items():
+                name = to_snake_case(str(key))
+                converted[name] = item
+                if isinstance(item, (dict, list, tuple)):
+                    stack.append((item, converted, name))
+            target[slot] = converted
+            continue
+
+        items = list(value)
+        target[slot] = items
+        if isinstance(value, tuple):
+            stack.append((_FREEZE, target, slot))
+        for index, item in enumerate(items):
+            if isinstance(item, (dict, list, tuple)):
+                stack.append((item, items, index))
+
+    return root[0]
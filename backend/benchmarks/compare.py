@@ -0,0 +1,69 @@
+"""Compare two saved load, micro, startup or compression benchmark result files.
+
+Prints the relative change of every metric present in both runs. Run from
+``backend/``::
+
+    python -m benchmarks.compare benchmarks/results/load-A.json benchmarks/results/load-B.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+LOAD_METRICS = ("rps", "p50_ms", "p95_ms", "p99_ms", "bytes_per_request")
+COMPRESSION_METRICS = ("wire_bytes", "compress_us", "decompress_us")
+
+
+def load_rows(path: str) -> Tuple[str, Dict[str, Dict[str, float]]]:
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    benchmark = document.get("benchmark", "micro")
+    if benchmark == "load":
+        rows = {
+            f"{row['route']} c={row['concurrency']}": {metric: row[metric] for metric in LOAD_METRICS if metric in row}
+            for row in document["results"]
+        }
+    elif benchmark == "compression":
+        rows = {
+            name: {metric: values[metric] for metric in COMPRESSION_METRICS}
+            for name, values in document["results"].items()
+        }
+    elif benchmark == "startup":
+        rows = {
+            launcher: {metric: summary["median"] for metric, summary in values["summary"].items()}
+            for launcher, values in document["results"].items()
+        }
+    else:
+        rows = {name: {"us_per_op": values["us_per_op"]} for name, values in document["results"].items()}
+    return benchmark, rows
+
+
+def change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    args = parser.parse_args()
+
+    kind, baseline = load_rows(args.baseline)
+    candidate_kind, candidate = load_rows(args.candidate)
+    if kind != candidate_kind:
+        parser.error(f"cannot compare a {kind} run with a {candidate_kind} run")
+
+    comparison: Dict[str, Any] = {}
+    for name in baseline.keys() & candidate.keys():
+        comparison[name] = {
+            metric: {"before": value, "after": candidate[name][metric], "change": change(value, candidate[name][metric])}
+            for metric, value in baseline[name].items()
+            if metric in candidate[name]
+        }
+    print(json.dumps(dict(sorted(comparison.items())), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Bytes saved and CPU cost of response compression per encoding and level.
+
+Compresses the BFF's own serialized list responses (users, subscriptions and
+tokens with ``limit=200`` by default, built from the mock upstream rows) in
+one shot, and a live stats SSE stream and a paged NDJSON export
+incrementally, flushing after every chunk the way ``CompressionMiddleware``
+does. br and zstd are measured when ``brotli``/``zstandard`` are installed.
+Mock rows are more repetitive than production data, so treat ratios as an
+upper bound and CPU times as representative. Results are saved as JSON
+(``benchmarks/results/compression-<timestamp>.json`` by default). Run from
+``backend/``::
+
+    python -m benchmarks.compression --items 200 --rounds 50
+"""
+
+import argparse
+import json
+import timeit
+import zlib
+from typing import Any, Callable, Dict, List, Tuple
+
+from app.live.broadcaster import LiveEvent, merge_patch
+from app.schemas.subscriptions import SubscriptionListResponse
+from app.schemas.tokens import TokenListResponse
+from app.schemas.users import UserListResponse
+from app.utils import decode_payload
+from app.utils.compression import ENCODERS, brotli_module, encoding_available, zstandard_module
+
+from .mock_upstream import build_subscription, build_token, build_user
+from .reporting import run_metadata, save_results
+
+LEVELS = {"gzip": (1, 2, 4, 6, 9), "br": (1, 4, 6, 11), "zstd": (1, 3, 6, 12)}
+
+
+def build_bodies(items: int) -> Dict[str, bytes]:
+    def page(builder: Callable[[int], Dict[str, Any]], model: Any) -> bytes:
+        rows = [builder(index + 1) for index in range(items)]
+        payload = json.dumps({"items": rows, "total": 100000, "limit": items, "offset": 0}).encode()
+        return model.model_validate(decode_payload(payload)).model_dump_json().encode()
+
+    return {
+        "users": page(build_user, UserListResponse),
+        "subscriptions": page(build_subscription, SubscriptionListResponse),
+        "tokens": page(build_token, TokenListResponse),
+    }
+
+
+def build_streams(bodies: Dict[str, bytes], events: int) -> Dict[str, List[bytes]]:
+    snapshot: Dict[str, Any] = {}
+    chunks = [b"retry: 5000\n\n"]
+    for version in range(1, events + 1):
+        block = {"total": 1000 + version // 10, "active": 500 + version % 7, "newToday": version // 50}
+        current = {
+            "stats": {"users": block, "subscriptions": block},
+            "health": {"status": "ok", "latencyMs": version % 13},
+        }
+        patch = merge_patch(snapshot, current)
+        snapshot = current
+        chunks.append(LiveEvent("patch" if version > 1 else "snapshot", version, patch).encode())
+
+    rows = json.loads(bodies["users"])["items"]
+    export = [
+        b"".join(json.dumps(row).encode() + b"\n" for row in rows[start : start + 50])
+        for start in range(0, len(rows), 50)
+    ]
+    return {"stats_live": chunks, "users_export": export}
+
+
+def decompressor(encoding: str) -> Callable[[bytes], bytes]:
+    if encoding == "br":
+        return brotli_module().decompress
+    if encoding == "zstd":
+        reader = zstandard_module().ZstdDecompressor()
+        return lambda data: reader.decompressobj().decompress(data)
+    return lambda data: zlib.decompress(data, zlib.MAX_WBITS | 16)
+
+
+def compress_once(encoding: str, level: int, body: bytes) -> bytes:
+    encoder = ENCODERS[encoding](level)
+    return encoder.compress(body) + encoder.finish()
+
+
+def compress_stream(encoding: str, level: int, chunks: List[bytes]) -> bytes:
+    encoder = ENCODERS[encoding](level)
+    wire = [encoder.compress(chunk, flush=True) for chunk in chunks]
+    wire.append(encoder.finish())
+    return b"".join(wire)
+
+
+def measure(
+    raw: int,
+    run: Callable[[], bytes],
+    decode: Callable[[bytes], bytes],
+    rounds: int,
+    repeat: int,
+) -> Dict[str, Any]:
+    wire = run()
+    compress_us = min(timeit.repeat(run, number=rounds, repeat=repeat)) / rounds * 1_000_000
+    decompress_us = min(timeit.repeat(lambda: decode(wire), number=rounds, repeat=repeat)) / rounds * 1_000_000
+    return {
+        "raw_bytes": raw,
+        "wire_bytes": len(wire),
+        "saved_pct": round((1 - len(wire) / raw) * 100, 1),
+        "compress_us": round(compress_us, 1),
+        "decompress_us": round(decompress_us, 1),
+        "compress_mb_per_s": round(raw / compress_us, 1),
+    }
+
+
+def cases(encodings: List[str]) -> List[Tuple[str, int]]:
+    return [(encoding, level) for encoding in encodings for level in LEVELS[encoding]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--events", type=int, default=500, help="SSE events in the live stats stream")
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="result file, default benchmarks/results/compression-<timestamp>.json")
+    args = parser.parse_args()
+
+    encodings = [encoding for encoding in ("gzip", "br", "zstd") if encoding_available(encoding)]
+    bodies = build_bodies(args.items)
+    streams = build_streams(bodies, args.events)
+    results: Dict[str, Any] = {}
+    for encoding, level in cases(encodings):
+        decode = decompressor(encoding)
+        for name, body in bodies.items():
+            results[f"{name} {encoding}-{level}"] = measure(
+                len(body),
+                lambda body=body: compress_once(encoding, level, body),
+                decode,
+                args.rounds,
+                args.repeat,
+            )
+        for name, chunks in streams.items():
+            results[f"{name} {encoding}-{level}"] = measure(
+                sum(len(chunk) for chunk in chunks),
+                lambda chunks=chunks: compress_stream(encoding, level, chunks),
+                decode,
+                max(args.rounds // 10, 1),
+                args.repeat,
+            )
+        rows = [(name, results[f"{name} {encoding}-{level}"]) for name in (*bodies, *streams)]
+        summary = "  ".join(f"{name} -{row['saved_pct']}% {row['compress_us']}us" for name, row in rows)
+        print(f"{encoding}-{level:<3} {summary}", flush=True)
+
+    options = {"items": args.items, "events": args.events, "rounds": args.rounds, "repeat": args.repeat}
+    document = {
+        "benchmark": "compression",
+        **run_metadata(options),
+        "encodings": encodings,
+        "payload_bytes": {name: len(body) for name, body in bodies.items()},
+        "results": results,
+    }
+    path = save_results("compression", document, args.output)
+    print(json.dumps({"saved": str(path), "cases": len(results)}))
+
+
+if __name__ == "__main__":
+    main()
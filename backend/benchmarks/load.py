@@ -0,0 +1,177 @@
+"""Closed-loop load driver for every request/response v1 route.
+
+Starts the mock upstream and the BFF (in-process, on real sockets) unless
+``--target`` points at an already running BFF, then for each route and each
+concurrency level keeps N workers busy for ``--requests`` requests and
+reports p50/p95/p99 latency and requests/sec. Results are saved as JSON
+(``benchmarks/results/load-<timestamp>.json`` by default) so runs can be
+compared with ``python -m benchmarks.compare``. Run from ``backend/``::
+
+    python -m benchmarks.load --concurrency 1,10,50 --requests 500 --latency 0.02
+
+Streaming routes (exports, bulk progress, live stats) and token
+creation/revocation are not request/response or not idempotent against the
+mock and are left out. With the driver, the BFF and the mock sharing one
+interpreter the absolute numbers are pessimistic; use ``--target`` against
+a separately launched server for production-like figures.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from contextlib import ExitStack
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import httpx
+
+from .mock_upstream import add_mock_arguments, mock_options, serve_app, serve_mock_upstream
+from .reporting import latency_summary, run_metadata, save_results
+
+
+class RouteCase(NamedTuple):
+    name: str
+    method: str
+    path: str
+    body: Optional[Dict[str, Any]] = None
+
+
+ROUTES = (
+    RouteCase("health", "GET", "/api/v1/health"),
+    RouteCase("health_upstream", "GET", "/api/v1/health/upstream"),
+    RouteCase("dashboard", "GET", "/api/v1/dashboard"),
+    RouteCase("stats_overview", "GET", "/api/v1/stats/overview"),
+    RouteCase("users_list", "GET", "/api/v1/users/?limit=50"),
+    RouteCase("users_detail", "GET", "/api/v1/users/1"),
+    RouteCase("users_update", "PATCH", "/api/v1/users/1", {"language": "en"}),
+    RouteCase("users_batch", "POST", "/api/v1/users/batch", {"ids": [1, 2, 3, 4, 5]}),
+    RouteCase("subscriptions_list", "GET", "/api/v1/subscriptions/?limit=50"),
+    RouteCase("subscriptions_detail", "GET", "/api/v1/subscriptions/1"),
+    RouteCase("subscriptions_update", "PATCH", "/api/v1/subscriptions/1", {"device_limit": 5}),
+    RouteCase("subscriptions_batch", "POST", "/api/v1/subscriptions/batch", {"ids": [1, 2, 3, 4, 5]}),
+    RouteCase("tokens_list", "GET", "/api/v1/tokens/"),
+)
+
+
+async def measure(
+    client: httpx.AsyncClient,
+    route: RouteCase,
+    *,
+    concurrency: int,
+    requests: int,
+    headers: Dict[str, str],
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    wire_bytes = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, wire_bytes
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await client.request(route.method, route.path, json=route.body, headers=headers)
+                outcome = str(response.status_code)
+                wire_bytes += response.num_bytes_downloaded
+            except httpx.HTTPError as exc:
+                outcome = type(exc).__name__
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[outcome] = statuses.get(outcome, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    errors = sum(count for outcome, count in statuses.items() if not outcome.startswith(("2", "3")))
+    return {
+        "route": route.name,
+        "method": route.method,
+        "path": route.path,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "statuses": statuses,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "bytes_per_request": round(wire_bytes / len(latencies)) if latencies else 0,
+        **latency_summary(latencies),
+    }
+
+
+async def drive(base_url: str, args: argparse.Namespace, routes: List[RouteCase]) -> List[Dict[str, Any]]:
+    from app.auth.jwt.tokens import create_access_token
+
+    headers = {
+        "Authorization": f"Bearer {args.token or create_access_token('bench', {'roles': ['admin']})}",
+        "Accept-Encoding": args.accept_encoding,
+    }
+    limits = httpx.Limits(max_connections=max(args.concurrency), max_keepalive_connections=max(args.concurrency))
+    results: List[Dict[str, Any]] = []
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        for route in routes:
+            for concurrency in args.concurrency:
+                await measure(client, route, concurrency=concurrency, requests=args.warmup, headers=headers)
+                result = await measure(
+                    client, route, concurrency=concurrency, requests=args.requests, headers=headers
+                )
+                results.append(result)
+                print(
+                    f"{route.name:<22} c={concurrency:<4} {result['rps']:>9.1f} rps  "
+                    f"p50={result['p50_ms']:.2f} p95={result['p95_ms']:.2f} p99={result['p99_ms']:.2f} ms  "
+                    f"{result['bytes_per_request']} B/req  errors={result['errors']}",
+                    flush=True,
+                )
+    return results
+
+
+def concurrency_levels(value: str) -> List[int]:
+    return [int(level) for level in value.split(",") if level.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", help="base URL of a running BFF; by default one is started in-process")
+    parser.add_argument("--token", help="bearer token for --target (defaults to one signed with local settings)")
+    parser.add_argument("--concurrency", type=concurrency_levels, default=[1, 10, 50])
+    parser.add_argument("--requests", type=int, default=500, help="measured requests per route and level")
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--routes", help="comma separated route names, default: all")
+    parser.add_argument("--disable-cache", action="store_true", help="turn the BFF response cache off")
+    parser.add_argument("--accept-encoding", default="gzip, deflate", help='e.g. "identity" to measure uncompressed')
+    parser.add_argument("--output", help="result file, default benchmarks/results/load-<timestamp>.json")
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    selected = set(args.routes.split(",")) if args.routes else None
+    routes = [route for route in ROUTES if selected is None or route.name in selected]
+
+    with ExitStack() as stack:
+        base_url = args.target
+        if base_url is None:
+            upstream_url = stack.enter_context(serve_mock_upstream(**mock_options(args)))
+            os.environ["REMNAWAVE_API_BASE_URL"] = upstream_url
+            os.environ["LOG_LEVEL"] = "WARNING"
+            if args.disable_cache:
+                os.environ["CACHE_TTL_POLICY"] = "{}"
+            from app.main import create_app
+
+            base_url = stack.enter_context(serve_app(create_app(), lifespan="on"))
+        results = asyncio.run(drive(base_url, args, routes))
+
+    options = {
+        "target": args.target,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "warmup": args.warmup,
+        "disable_cache": args.disable_cache,
+        "accept_encoding": args.accept_encoding,
+        "mock": None if args.target else mock_options(args),
+    }
+    path = save_results("load", {"benchmark": "load", **run_metadata(options), "results": results}, args.output)
+    print(json.dumps({"saved": str(path), "routes": len(routes), "runs": len(results)}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Microbenchmarks for the CPU-bound steps of a proxied request.
+
+Covers payload decoding/normalization, admin JWT verification (cold decode
+vs the verified-token cache) and response schema validation, each over a
+mock upstream list payload. Results are saved as JSON
+(``benchmarks/results/micro-<timestamp>.json`` by default). Run from
+``backend/``::
+
+    python -m benchmarks.micro --items 200 --rounds 200
+"""
+
+import argparse
+import json
+import timeit
+from typing import Any, Callable, Dict
+
+from app.auth.dependencies import authenticate_token
+from app.auth.jwt.tokens import create_access_token, decode_access_token
+from app.schemas.stats import StatsOverviewResponse
+from app.schemas.subscriptions import SubscriptionListResponse
+from app.schemas.users import UserListResponse
+from app.utils import decode_payload, normalize_payload
+
+from .mock_upstream import build_subscription, build_user
+from .reporting import run_metadata, save_results
+
+
+def build_bodies(items: int) -> Dict[str, bytes]:
+    def page(builder: Callable[[int], Dict[str, Any]]) -> bytes:
+        rows = [builder(index + 1) for index in range(items)]
+        return json.dumps({"items": rows, "total": 100000, "limit": items, "offset": 0}).encode()
+
+    block = {"total": items, "active": items // 2, "newToday": 5}
+    stats = {"users": block, "subscriptions": block, "support": block, "payments": {"totalKopeks": 1, "todayKopeks": 1}}
+    return {
+        "users": page(build_user),
+        "subscriptions": page(build_subscription),
+        "stats": json.dumps(stats).encode(),
+    }
+
+
+def cases(bodies: Dict[str, bytes]) -> Dict[str, Callable[[], Any]]:
+    users_raw = json.loads(bodies["users"])
+    users = decode_payload(bodies["users"])
+    subscriptions = decode_payload(bodies["subscriptions"])
+    stats = decode_payload(bodies["stats"])
+    token = create_access_token("bench", {"roles": ["admin"]})
+    authenticate_token(token)
+
+    return {
+        "json_loads_users": lambda: json.loads(bodies["users"]),
+        "normalize_payload_users": lambda: normalize_payload(users_raw),
+        "decode_payload_users": lambda: decode_payload(bodies["users"]),
+        "jwt_decode": lambda: decode_access_token(token),
+        "jwt_authenticate_cached": lambda: authenticate_token(token),
+        "validate_user_list": lambda: UserListResponse.model_validate(users),
+        "validate_subscription_list": lambda: SubscriptionListResponse.model_validate(subscriptions),
+        "validate_stats_overview": lambda: StatsOverviewResponse.model_validate(stats),
+        "serialize_user_list": lambda: UserListResponse.model_validate(users).model_dump_json(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="result file, default benchmarks/results/micro-<timestamp>.json")
+    args = parser.parse_args()
+
+    bodies = build_bodies(args.items)
+    results = {}
+    for name, case in cases(bodies).items():
+        timings = timeit.repeat(case, number=args.rounds, repeat=args.repeat)
+        results[name] = {
+            "us_per_op": round(min(timings) / args.rounds * 1_000_000, 2),
+            "us_per_op_median": round(sorted(timings)[len(timings) // 2] / args.rounds * 1_000_000, 2),
+        }
+
+    options = {"items": args.items, "rounds": args.rounds, "repeat": args.repeat}
+    document = {
+        "benchmark": "micro",
+        **run_metadata(options),
+        "payload_bytes": {name: len(body) for name, body in bodies.items()},
+        "results": results,
+    }
+    path = save_results("micro", document, args.output)
+    print(json.dumps({"saved": str(path), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Per-request overhead of the correlation + audit middleware stack.
+
+Compares the previous ``BaseHTTPMiddleware`` implementations with the pure
+ASGI ones on a trivial endpoint. Run from ``backend/``::
+
+    python -m benchmarks.middleware --requests 5000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import time
+import uuid
+from typing import Callable, Dict, List
+
+import httpx
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+
+from app.middleware.audit import AuditMiddleware
+from app.middleware.correlation import CorrelationIdMiddleware, correlation_id_ctx_var, get_correlation_id
+
+audit_logger = logging.getLogger("audit")
+
+
+class LegacyCorrelationIdMiddleware(BaseHTTPMiddleware):
+    header_name = "X-Request-ID"
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        request_id = request.headers.get(self.header_name) or str(uuid.uuid4())
+        token = correlation_id_ctx_var.set(request_id)
+        response = await call_next(request)
+        response.headers[self.header_name] = request_id
+        correlation_id_ctx_var.reset(token)
+        return response
+
+
+class LegacyAuditMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        start_time = time.perf_counter()
+        correlation_id = get_correlation_id()
+        client_host = request.client.host if request.client else None
+        audit_logger.info(
+            "request started method=%s path=%s correlation_id=%s client=%s",
+            request.method,
+            request.url.path,
+            correlation_id,
+            client_host,
+        )
+        response = await call_next(request)
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        audit_logger.info(
+            "request completed method=%s path=%s status=%s duration_ms=%.2f correlation_id=%s",
+            request.method,
+            request.url.path,
+            response.status_code,
+            duration_ms,
+            correlation_id,
+        )
+        return response
+
+
+async def ping(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("pong")
+
+
+def build_app(middleware: List[Middleware]) -> Starlette:
+    return Starlette(routes=[Route("/ping", ping)], middleware=middleware)
+
+
+async def measure(app: Starlette, requests: int) -> List[float]:
+    latencies: List[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(min(requests, 200)):
+            await client.get("/ping")
+        for _ in range(requests):
+            start = time.perf_counter()
+            await client.get("/ping")
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+    latencies.sort()
+    return latencies
+
+
+def summarize(latencies: List[float], baseline: List[float]) -> Dict[str, float]:
+    return {
+        "mean_us": round(statistics.fmean(latencies), 1),
+        "p99_us": round(latencies[int(len(latencies) * 0.99) - 1], 1),
+        "overhead_mean_us": round(statistics.fmean(latencies) - statistics.fmean(baseline), 1),
+    }
+
+
+async def run(requests: int) -> Dict[str, Dict[str, float]]:
+    stacks = {
+        "none": [],
+        "base_http_middleware": [Middleware(LegacyCorrelationIdMiddleware), Middleware(LegacyAuditMiddleware)],
+        "pure_asgi": [Middleware(CorrelationIdMiddleware), Middleware(AuditMiddleware)],
+    }
+    measured = {name: await measure(build_app(stack), requests) for name, stack in stacks.items()}
+    return {name: summarize(latencies, measured["none"]) for name, latencies in measured.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    audit_logger.disabled = True
+    print(json.dumps(asyncio.run(run(args.requests)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Local stand-in for the RemnaWave bot admin API used by the benchmarks.
+
+Latency (plus uniform jitter), injected error rate, per-item payload padding,
+camelCase/snake_case key variants and gzip response compression are
+configurable. Can also be run on
+its own for external load tools; from ``backend/``::
+
+    python -m benchmarks.mock_upstream --port 8081 --latency 0.02 --error-rate 0.01 --naming snake
+"""
+
+import argparse
+import asyncio
+import random
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from app.utils.normalization import normalize_payload
+
+NAMING_VARIANTS = ("camel", "snake")
+
+
+def build_user(user_id: int) -> Dict[str, Any]:
+    return {
+        "id": user_id,
+        "telegramId": 100000 + user_id,
+        "username": f"user{user_id}",
+        "fullName": f"Test User {user_id}",
+        "language": "ru",
+        "status": "active",
+        "isBlocked": False,
+        "createdAt": "2024-01-01T00:00:00Z",
+        "subscription": {"id": user_id, "status": "active", "expiresAt": "2025-01-01T00:00:00Z"},
+        "promoGroup": {"id": 1, "name": "default"},
+        "balance": {"currentBalanceKopeks": 1000 * user_id, "currentBalanceRubles": 10.0 * user_id},
+    }
+
+
+def build_subscription(subscription_id: int) -> Dict[str, Any]:
+    return {
+        "id": subscription_id,
+        "userId": subscription_id,
+        "planId": 1,
+        "status": "active",
+        "isTrial": False,
+        "startedAt": "2024-01-01T00:00:00Z",
+        "expiresAt": "2025-01-01T00:00:00Z",
+        "trafficLimitGb": 100,
+        "trafficUsedGb": 12,
+        "deviceLimit": 3,
+        "plan": {"id": 1, "name": "Basic", "trafficLimitGb": 100, "deviceLimit": 3},
+        "devices": [{"id": subscription_id * 10, "deviceType": "ios", "name": "iPhone"}],
+    }
+
+
+def build_token(token_id: int) -> Dict[str, Any]:
+    return {
+        "id": token_id,
+        "name": f"token-{token_id}",
+        "tokenPrefix": f"rw_{token_id:06d}",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "isActive": True,
+        "scopes": ["read"],
+    }
+
+
+def create_mock_app(
+    *,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    error_rate: float = 0.0,
+    error_status: int = 503,
+    total: int = 1000,
+    padding: int = 0,
+    naming: str = "camel",
+    seed: Optional[int] = None,
+    compress: bool = False,
+) -> Starlette:
+    if naming not in NAMING_VARIANTS:
+        raise ValueError(f"naming must be one of {NAMING_VARIANTS}")
+    rng = random.Random(seed)
+    filler = "x" * padding
+
+    def shape(item: Dict[str, Any]) -> Dict[str, Any]:
+        if padding:
+            item["notes"] = filler
+        return item
+
+    async def respond(payload: Dict[str, Any]) -> JSONResponse:
+        wait = latency + (rng.uniform(0, jitter) if jitter else 0.0)
+        if wait:
+            await asyncio.sleep(wait)
+        if error_rate and rng.random() < error_rate:
+            return JSONResponse({"detail": "Injected mock failure"}, status_code=error_status)
+        if naming == "snake":
+            payload = normalize_payload(payload)
+        return JSONResponse(payload)
+
+    def page(request: Request, builder: Callable[[int], Dict[str, Any]]) -> Dict[str, Any]:
+        limit = int(request.query_params.get("limit", 20))
+        offset = int(request.query_params.get("offset", 0))
+        items: List[Dict[str, Any]] = [
+            shape(builder(index + 1)) for index in range(offset, min(offset + limit, total))
+        ]
+        return {"items": items, "total": total, "limit": limit, "offset": offset}
+
+    async def health(request: Request) -> JSONResponse:
+        return await respond(
+            {
+                "status": "ok",
+                "apiVersion": "1.0",
+                "botVersion": "3.0",
+                "components": {"database": True, "redis": True},
+                "features": {"payments": True},
+            }
+        )
+
+    async def stats_overview(request: Request) -> JSONResponse:
+        return await respond(
+            {
+                "users": {"total": total, "active": total // 2, "newToday": 5},
+                "subscriptions": {"total": total, "active": total // 3},
+                "support": {"total": 10, "active": 2},
+                "payments": {"totalKopeks": 1000000, "todayKopeks": 5000},
+                "meta": {"generatedAt": time.time()},
+            }
+        )
+
+    async def users(request: Request) -> JSONResponse:
+        return await respond(page(request, build_user))
+
+    async def user_detail(request: Request) -> JSONResponse:
+        user = shape(build_user(int(request.path_params["user_id"])))
+        if request.method == "PATCH":
+            user.update(await request.json())
+        return await respond(user)
+
+    async def subscriptions(request: Request) -> JSONResponse:
+        return await respond(page(request, build_subscription))
+
+    async def subscription_detail(request: Request) -> JSONResponse:
+        subscription = shape(build_subscription(int(request.path_params["subscription_id"])))
+        if request.method == "PATCH":
+            subscription.update(await request.json())
+        return await respond(subscription)
+
+    async def tokens(request: Request) -> JSONResponse:
+        if request.method == "POST":
+            body = await request.json()
+            token = build_token(total + 1)
+            token["name"] = body.get("name", token["name"])
+            return await respond({"token": token, "plainToken": f"rw_secret_{total + 1}"})
+        return await respond(page(request, build_token))
+
+    async def revoke_token(request: Request) -> JSONResponse:
+        return await respond({"success": True})
+
+    return Starlette(
+        routes=[
+            Route("/health", health),
+            Route("/stats/overview", stats_overview),
+            Route("/users", users),
+            Route("/users/{user_id:int}", user_detail, methods=["GET", "PATCH"]),
+            Route("/subscriptions", subscriptions),
+            Route("/subscriptions/{subscription_id:int}", subscription_detail, methods=["GET", "PATCH"]),
+            Route("/tokens", tokens, methods=["GET", "POST"]),
+            Route("/tokens/{token_id:int}/revoke", revoke_token, methods=["POST"]),
+        ],
+        middleware=[Middleware(GZipMiddleware, minimum_size=500)] if compress else [],
+    )
+
+
+@contextmanager
+def serve_app(app: Any, *, lifespan: str = "off") -> Iterator[str]:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+
+    config = uvicorn.Config(app, log_level="warning", lifespan=lifespan)
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+        sock.close()
+
+
+@contextmanager
+def serve_mock_upstream(**options: Any) -> Iterator[str]:
+    with serve_app(create_mock_app(**options)) as url:
+        yield url
+
+
+def add_mock_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("mock upstream")
+    group.add_argument("--latency", type=float, default=0.0, help="base upstream latency, seconds")
+    group.add_argument("--jitter", type=float, default=0.0, help="extra uniform latency 0..jitter, seconds")
+    group.add_argument("--error-rate", type=float, default=0.0, help="share of responses failing with --error-status")
+    group.add_argument("--error-status", type=int, default=503)
+    group.add_argument("--total", type=int, default=1000, help="rows per collection")
+    group.add_argument("--padding", type=int, default=0, help="extra bytes per list item")
+    group.add_argument("--naming", choices=NAMING_VARIANTS, default="camel")
+    group.add_argument("--seed", type=int, default=None)
+    group.add_argument("--compress", action="store_true", help="gzip responses when the client accepts it")
+
+
+def mock_options(args: argparse.Namespace) -> Dict[str, Any]:
+    return {
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "error_rate": args.error_rate,
+        "error_status": args.error_status,
+        "total": args.total,
+        "padding": args.padding,
+        "naming": args.naming,
+        "seed": args.seed,
+        "compress": args.compress,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+    uvicorn.run(create_mock_app(**mock_options(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
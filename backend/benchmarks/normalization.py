@@ -0,0 +1,68 @@
+"""Legacy ``response.json()`` + recursive regex normalization vs ``decode_payload``.
+
+Run from ``backend/``::
+
+    python -m benchmarks.normalization --items 200 --rounds 200
+"""
+
+import argparse
+import json
+import re
+import timeit
+from typing import Any, Callable, Dict
+
+from app.schemas.users import UserListResponse
+from app.utils import decode_payload, normalize_payload
+
+from .mock_upstream import build_user
+
+_LEGACY_CAMEL_PATTERN = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def legacy_to_snake_case(value: str) -> str:
+    value = value.replace("-", "_")
+    return _LEGACY_CAMEL_PATTERN.sub("_", value).lower()
+
+
+def legacy_normalize_payload(payload: Any) -> Any:
+    if isinstance(payload, dict):
+        return {legacy_to_snake_case(str(key)): legacy_normalize_payload(value) for key, value in payload.items()}
+    if isinstance(payload, list):
+        return [legacy_normalize_payload(item) for item in payload]
+    if isinstance(payload, tuple):
+        return tuple(legacy_normalize_payload(item) for item in payload)
+    return payload
+
+
+def build_body(items: int) -> bytes:
+    payload = {"items": [build_user(index + 1) for index in range(items)], "total": 100000, "limit": items, "offset": 0}
+    return json.dumps(payload).encode()
+
+
+def pipelines(body: bytes) -> Dict[str, Callable[[], Any]]:
+    return {
+        "legacy_decode_normalize": lambda: legacy_normalize_payload(json.loads(body)),
+        "iterative_normalize": lambda: normalize_payload(json.loads(body)),
+        "fused_decode": lambda: decode_payload(body),
+        "legacy_end_to_end": lambda: UserListResponse.model_validate(legacy_normalize_payload(json.loads(body))),
+        "fused_end_to_end": lambda: UserListResponse.model_validate(decode_payload(body)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    body = build_body(args.items)
+    results = {}
+    for name, pipeline in pipelines(body).items():
+        best = min(timeit.repeat(pipeline, number=args.rounds, repeat=5))
+        results[name] = {"us_per_payload": round(best / args.rounds * 1_000_000, 1)}
+
+    print(json.dumps({"items": args.items, "bytes": len(body), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Requests/sec of v1 list/detail endpoints with FastAPI's default response
+path vs ``TrustedModelRoute``.
+
+The endpoints return models that are already validated (as the services do),
+so the difference is the second ``response_model`` validation plus
+``jsonable_encoder``/``json.dumps`` vs a single ``pydantic_core.to_json``.
+Run from ``backend/``::
+
+    python -m benchmarks.responses --requests 2000 --items 200
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Type
+
+import httpx
+from fastapi import FastAPI
+from fastapi.routing import APIRoute, APIRouter
+from pydantic import BaseModel
+
+from app.api.routing import TrustedModelRoute
+from app.schemas.stats import StatsOverviewResponse
+from app.schemas.subscriptions import SubscriptionListResponse
+from app.schemas.users import UserDetailResponse, UserListResponse
+from app.utils.normalization import normalize_payload
+
+from .mock_upstream import build_subscription, build_user
+
+
+def build_models(items: int) -> Dict[str, BaseModel]:
+    users = [normalize_payload(build_user(user_id)) for user_id in range(1, items + 1)]
+    subscriptions = [normalize_payload(build_subscription(sub_id)) for sub_id in range(1, items + 1)]
+    block = {"total": items, "active": items // 2, "new": 5}
+    return {
+        "/users": UserListResponse.model_validate({"items": users, "total": items, "limit": items, "offset": 0}),
+        "/users/1": UserDetailResponse.model_validate({"user": users[0]}),
+        "/subscriptions": SubscriptionListResponse.model_validate(
+            {"items": subscriptions, "total": items, "limit": items, "offset": 0}
+        ),
+        "/stats/overview": StatsOverviewResponse.model_validate(
+            {
+                "users": block,
+                "subscriptions": block,
+                "support": block,
+                "payments": {"total_kopeks": 100000, "today_kopeks": 500},
+            }
+        ),
+    }
+
+
+def make_endpoint(model: BaseModel) -> Callable[[], Awaitable[BaseModel]]:
+    async def endpoint() -> BaseModel:
+        return model
+
+    return endpoint
+
+
+def build_app(route_class: Type[APIRoute], models: Dict[str, BaseModel]) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+    for path, model in models.items():
+        router.add_api_route(path, make_endpoint(model), response_model=type(model), methods=["GET"])
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+async def measure(app: FastAPI, path: str, requests: int) -> Dict[str, Any]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(min(requests, 50)):
+            await client.get(path)
+        started = time.perf_counter()
+        for _ in range(requests):
+            response = await client.get(path)
+        elapsed = time.perf_counter() - started
+    return {"rps": round(requests / elapsed, 1), "bytes": len(response.content), "body": response.content}
+
+
+async def run(requests: int, items: int) -> Dict[str, Dict[str, Any]]:
+    models = build_models(items)
+    default_app = build_app(APIRoute, models)
+    trusted_app = build_app(TrustedModelRoute, models)
+
+    report: Dict[str, Dict[str, Any]] = {}
+    for path in models:
+        before = await measure(default_app, path, requests)
+        after = await measure(trusted_app, path, requests)
+        report[path] = {
+            "default_rps": before["rps"],
+            "trusted_rps": after["rps"],
+            "speedup": round(after["rps"] / before["rps"], 2),
+            "bytes": after["bytes"],
+            "identical_body": json.loads(before["body"]) == json.loads(after["body"]),
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=200)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.requests, args.items)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
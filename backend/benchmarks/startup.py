@@ -0,0 +1,144 @@
+"""Cold start to first request: ``python -m app.server`` vs plain uvicorn.
+
+Each run launches the server as a fresh process against the mock upstream and
+polls an authenticated endpoint until the first 200. Reported per launcher:
+time from spawn to that first response, the latency of the first and of a
+follow-up (warm) request, and the time to exit after SIGTERM. Results are
+saved as JSON (``benchmarks/results/startup-<timestamp>.json`` by default).
+Run from ``backend/``::
+
+    python -m benchmarks.startup --runs 5 --workers 2
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+from app.auth.jwt.tokens import create_access_token
+
+from .mock_upstream import serve_mock_upstream
+from .reporting import run_metadata, save_results
+
+LAUNCHERS = {
+    "app.server": lambda port: [sys.executable, "-m", "app.server"],
+    "uvicorn": lambda port: [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "app.main:app",
+        "--host",
+        "127.0.0.1",
+        "--port",
+        str(port),
+    ],
+}
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_once(launcher: str, upstream_url: str, args: argparse.Namespace) -> Dict[str, float]:
+    port = free_port()
+    env = dict(
+        os.environ,
+        BACKEND_HOST="127.0.0.1",
+        BACKEND_PORT=str(port),
+        BACKEND_WORKERS=str(args.workers),
+        REMNAWAVE_API_BASE_URL=upstream_url,
+        LOG_LEVEL="WARNING",
+    )
+    url = f"http://127.0.0.1:{port}{args.path}"
+    headers = {"Authorization": f"Bearer {create_access_token('bench', {'roles': ['admin']})}"}
+
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        LAUNCHERS[launcher](port),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(timeout=10.0) as client:
+            while True:
+                if process.poll() is not None:
+                    raise RuntimeError(f"{launcher} exited with code {process.returncode} before serving")
+                if time.perf_counter() - started > args.timeout:
+                    raise RuntimeError(f"{launcher} did not answer within {args.timeout}s")
+                request_started = time.perf_counter()
+                try:
+                    response = client.get(url, headers=headers)
+                except httpx.TransportError:
+                    time.sleep(0.01)
+                    continue
+                if response.status_code == 200:
+                    break
+            ready = time.perf_counter()
+            first_request_ms = (ready - request_started) * 1000
+
+            warm_started = time.perf_counter()
+            client.get(url, headers=headers).raise_for_status()
+            warm_request_ms = (time.perf_counter() - warm_started) * 1000
+    finally:
+        stop_started = time.perf_counter()
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        shutdown_ms = (time.perf_counter() - stop_started) * 1000
+
+    return {
+        "cold_start_ms": round((ready - started) * 1000, 1),
+        "first_request_ms": round(first_request_ms, 2),
+        "warm_request_ms": round(warm_request_ms, 2),
+        "shutdown_ms": round(shutdown_ms, 1),
+    }
+
+
+def summarize(runs: List[Dict[str, float]]) -> Dict[str, Any]:
+    return {
+        metric: {
+            "min": min(run[metric] for run in runs),
+            "median": round(statistics.median(run[metric] for run in runs), 2),
+        }
+        for metric in runs[0]
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=1, help="BACKEND_WORKERS for app.server")
+    parser.add_argument("--launchers", default=",".join(LAUNCHERS), help="comma separated: app.server,uvicorn")
+    parser.add_argument("--path", default="/api/v1/health")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--output", help="result file, default benchmarks/results/startup-<timestamp>.json")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {}
+    with serve_mock_upstream() as upstream_url:
+        for launcher in args.launchers.split(","):
+            runs = [measure_once(launcher, upstream_url, args) for _ in range(args.runs)]
+            results[launcher] = {"summary": summarize(runs), "runs": runs}
+            print(launcher, json.dumps(results[launcher]["summary"]), flush=True)
+
+    options = {"runs": args.runs, "workers": args.workers, "path": args.path}
+    path = save_results("startup", {"benchmark": "startup", **run_metadata(options), "results": results}, args.output)
+    print(json.dumps({"saved": str(path)}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Where the time goes: per-request span trees from a local OTLP collector.
+
+Starts the mock upstream and an in-process OTLP/HTTP collector, runs the BFF
+with tracing pointed at that collector and prints the span tree (durations in
+ms) for each requested path. Run from ``backend/``::
+
+    python -m benchmarks.trace_breakdown --latency 0.02 /api/v1/users/?limit=200 /api/v1/dashboard
+"""
+
+import argparse
+import asyncio
+import os
+from typing import Any, Dict, List
+
+import httpx
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+    ExportTraceServiceRequest,
+    ExportTraceServiceResponse,
+)
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from .mock_upstream import serve_app, serve_mock_upstream
+
+
+def create_collector_app(spans: List[Dict[str, Any]]) -> Starlette:
+    async def export(request: Request) -> Response:
+        message = ExportTraceServiceRequest.FromString(await request.body())
+        for resource_spans in message.resource_spans:
+            for scope_spans in resource_spans.scope_spans:
+                for span in scope_spans.spans:
+                    spans.append(
+                        {
+                            "trace_id": span.trace_id.hex(),
+                            "span_id": span.span_id.hex(),
+                            "parent_id": span.parent_span_id.hex(),
+                            "name": span.name,
+                            "start": span.start_time_unix_nano,
+                            "duration_ms": (span.end_time_unix_nano - span.start_time_unix_nano) / 1e6,
+                        }
+                    )
+        return Response(ExportTraceServiceResponse().SerializeToString(), media_type="application/x-protobuf")
+
+    return Starlette(routes=[Route("/v1/traces", export, methods=["POST"])])
+
+
+def print_tree(spans: List[Dict[str, Any]]) -> None:
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    for span in spans:
+        children.setdefault(span["parent_id"], []).append(span)
+
+    def walk(span: Dict[str, Any], depth: int) -> None:
+        print(f"{'  ' * depth}{span['name']:<{60 - 2 * depth}} {span['duration_ms']:9.2f} ms")
+        for child in sorted(children.get(span["span_id"], []), key=lambda item: item["start"]):
+            walk(child, depth + 1)
+
+    known = {span["span_id"] for span in spans}
+    for root in sorted((span for span in spans if span["parent_id"] not in known), key=lambda item: item["start"]):
+        walk(root, 0)
+        print()
+
+
+async def drive(paths: List[str]) -> None:
+    from app.auth.jwt.tokens import create_access_token
+    from app.main import create_app
+
+    app = create_app()
+    headers = {"Authorization": f"Bearer {create_access_token('bench', {'roles': ['admin']})}"}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for path in paths:
+                response = await client.get(path, headers=headers)
+                print(f"GET {path} -> {response.status_code} ({len(response.content)} bytes)")
+    print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("paths", nargs="*", default=["/api/v1/users/?limit=200", "/api/v1/dashboard"])
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--total", type=int, default=1000)
+    args = parser.parse_args()
+
+    spans: List[Dict[str, Any]] = []
+    with serve_mock_upstream(latency=args.latency, total=args.total) as upstream_url:
+        with serve_app(create_collector_app(spans)) as collector_url:
+            os.environ["REMNAWAVE_API_BASE_URL"] = upstream_url
+            os.environ["OTEL_EXPORTER_OTLP_ENDPOINT"] = collector_url
+            os.environ["CACHE_TTL_POLICY"] = "{}"
+            os.environ["LOG_LEVEL"] = "WARNING"
+            asyncio.run(drive(args.paths))
+    print_tree(spans)
+
+
+if __name__ == "__main__":
+    main()
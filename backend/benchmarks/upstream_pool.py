@@ -0,0 +1,91 @@
+"""Per-request RemnaWave client vs the shared pooled client.
+
+Run from ``backend/``::
+
+    python -m benchmarks.upstream_pool --requests 500 --concurrency 20
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+
+from app.clients.remnawave import RemnaWaveAdminAPIClient
+from app.clients.transport import PooledTransport
+
+from .mock_upstream import serve_mock_upstream
+
+
+async def per_request_client(base_url: str) -> Callable[[], Awaitable[None]]:
+    async def call() -> None:
+        async with RemnaWaveAdminAPIClient(base_url=base_url, token="bench") as client:
+            await client.request("GET", "/stats/overview")
+
+    return call
+
+
+async def pooled_client(base_url: str) -> Callable[[], Awaitable[None]]:
+    client = RemnaWaveAdminAPIClient(
+        base_url=base_url,
+        token="bench",
+        transport=PooledTransport(limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)),
+    )
+
+    async def call() -> None:
+        await client.request("GET", "/stats/overview")
+
+    return call
+
+
+async def measure(call: Callable[[], Awaitable[None]], requests: int, concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests_per_sec": round(requests / elapsed, 1),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "p50_ms": round(latencies[len(latencies) // 2], 3),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 3),
+    }
+
+
+async def run(base_url: str, requests: int, concurrency: int) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for name, factory in (("per_request", per_request_client), ("pooled", pooled_client)):
+        call = await factory(base_url)
+        await measure(call, min(requests, 20), concurrency)
+        results[name] = await measure(call, requests, concurrency)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="mock upstream latency, seconds")
+    args = parser.parse_args()
+
+    with serve_mock_upstream(latency=args.latency) as base_url:
+        base_url = base_url.replace("127.0.0.1", "localhost")
+        results = asyncio.run(run(base_url, args.requests, args.concurrency))
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import asyncio
+from typing import Dict, List, Optional
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.bulk import BulkReport
+from app.services.base import RemoteServiceError
+from app.services.bulk import BulkOperationRunner
+
+
+def upstream_failure(status_code: int, headers: Optional[Dict[str, str]] = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("PATCH", "http://upstream/users/1")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("upstream failure", request=request, response=response)
+
+
+def run_bulk(error: Exception, failures: int = 1) -> BulkReport:
+    calls: List[int] = []
+
+    async def apply(item_id: int) -> None:
+        calls.append(item_id)
+        if len(calls) > failures:
+            return
+        try:
+            try:
+                raise error
+            except httpx.HTTPStatusError as exc:
+                raise RemoteServiceError(status_code=exc.response.status_code, detail="failed") from exc
+            except httpx.HTTPError as exc:
+                raise RemoteServiceError(status_code=503, detail=str(exc)) from exc
+        except RemoteServiceError as exc:
+            raise HTTPException(status_code=exc.status_code, detail=exc.detail)
+
+    async def run() -> BulkReport:
+        runner = BulkOperationRunner(concurrency=1, rate_limit=0, max_retries=2, retry_backoff=0)
+        events = [event async for event in runner.run([1], apply)]
+        return events[-1]
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        upstream_failure(429),
+        upstream_failure(503, {"Retry-After": "0"}),
+        httpx.ConnectError("refused"),
+        httpx.PoolTimeout("pool exhausted"),
+    ],
+)
+def test_bulk_retries_writes_the_upstream_did_not_apply(error: Exception) -> None:
+    report = run_bulk(error)
+
+    assert report.succeeded == 1
+    assert report.failures == []
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        upstream_failure(408),
+        upstream_failure(502),
+        upstream_failure(503),
+        upstream_failure(504),
+        httpx.ReadTimeout("no response"),
+    ],
+)
+def test_bulk_does_not_resend_writes_that_may_have_been_applied(error: Exception) -> None:
+    report = run_bulk(error)
+
+    assert report.succeeded == 0
+    assert report.failures[0].attempts == 1
+
+
+def test_bulk_gives_up_after_max_retries() -> None:
+    report = run_bulk(upstream_failure(429), failures=10)
+
+    assert report.failures[0].attempts == 3
+    assert report.failures[0].status_code == 429
@@ -0,0 +1,158 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from app.cache import ResponseCache, TTLPolicy
+from app.cache.response import FetchResult
+from app.services.base import RemoteServiceError
+
+
+class CountingFetcher:
+    def __init__(self, *values: Any) -> None:
+        self.values = list(values)
+        self.calls = 0
+
+    async def __call__(self) -> FetchResult:
+        self.calls += 1
+        value = self.values[min(self.calls, len(self.values)) - 1]
+        if isinstance(value, Exception):
+            raise value
+        return value, 1.0, None
+
+
+def age(cache: ResponseCache, key: str, seconds: float) -> None:
+    cache._entries[key].stored_at -= seconds
+
+
+def test_ttl_policy_prefers_the_longest_matching_prefix() -> None:
+    policy = TTLPolicy({"/users": 30.0, "/users/stats": 5.0}, default_ttl=1.0)
+
+    assert policy.ttl_for("/users") == 30.0
+    assert policy.ttl_for("/users/42") == 30.0
+    assert policy.ttl_for("/users/stats") == 5.0
+    assert policy.ttl_for("/users-archive") == 1.0
+
+
+def test_fresh_entries_are_served_without_refetching() -> None:
+    cache = ResponseCache(policy=TTLPolicy({}))
+    fetch = CountingFetcher({"id": 1})
+
+    async def run() -> List[Any]:
+        return [(await cache.get_or_fetch("/users/1", 30.0, fetch)).value for _ in range(3)]
+
+    assert asyncio.run(run()) == [{"id": 1}] * 3
+    assert fetch.calls == 1
+    assert (cache.misses, cache.hits) == (1, 2)
+
+
+def test_stale_entries_are_served_while_a_single_refresh_runs() -> None:
+    cache = ResponseCache(policy=TTLPolicy({}), stale_ttl=60.0)
+    fetch = CountingFetcher({"version": 1}, {"version": 2})
+
+    async def run() -> List[Any]:
+        await cache.get_or_fetch("/users/1", 30.0, fetch)
+        age(cache, "/users/1", 45.0)
+        stale = [(await cache.get_or_fetch("/users/1", 30.0, fetch)).value for _ in range(3)]
+        await asyncio.gather(*cache._refreshing.values())
+        return stale + [(await cache.get_or_fetch("/users/1", 30.0, fetch)).value]
+
+    assert asyncio.run(run()) == [{"version": 1}] * 3 + [{"version": 2}]
+    assert fetch.calls == 2
+    assert (cache.stale_hits, cache.refreshes, cache.hits) == (3, 1, 1)
+
+
+def test_entries_past_the_stale_window_are_fetched_inline() -> None:
+    cache = ResponseCache(policy=TTLPolicy({}), stale_ttl=60.0)
+    fetch = CountingFetcher({"version": 1}, {"version": 2})
+
+    async def run() -> Any:
+        await cache.get_or_fetch("/users/1", 30.0, fetch)
+        age(cache, "/users/1", 120.0)
+        return (await cache.get_or_fetch("/users/1", 30.0, fetch)).value
+
+    assert asyncio.run(run()) == {"version": 2}
+    assert cache.stale_hits == 0
+
+
+def test_not_found_is_cached_for_the_negative_ttl() -> None:
+    cache = ResponseCache(policy=TTLPolicy({}), stale_ttl=60.0, negative_ttl=5.0)
+    fetch = CountingFetcher(RemoteServiceError(status_code=404, detail="User not found"), {"id": 1})
+
+    async def run() -> List[Any]:
+        first = await cache.get_or_fetch("/users/1", 30.0, fetch)
+        second = await cache.get_or_fetch("/users/1", 30.0, fetch)
+        age(cache, "/users/1", 6.0)
+        third = await cache.get_or_fetch("/users/1", 30.0, fetch)
+        return [first.error.status_code, second.error.status_code, third.value]
+
+    assert asyncio.run(run()) == [404, 404, {"id": 1}]
+    assert fetch.calls == 2
+    assert cache.negative_hits == 1
+    assert cache.stale_hits == 0
+
+
+@pytest.mark.parametrize(
+    ("negative_ttl", "status_code"),
+    [(5.0, 500), (5.0, 503), (0.0, 404)],
+)
+def test_other_errors_are_never_cached(negative_ttl: float, status_code: int) -> None:
+    cache = ResponseCache(policy=TTLPolicy({}), negative_ttl=negative_ttl)
+    fetch = CountingFetcher(RemoteServiceError(status_code=status_code, detail="failed"))
+
+    async def run() -> None:
+        for _ in range(2):
+            with pytest.raises(RemoteServiceError):
+                await cache.get_or_fetch("/users/1", 30.0, fetch)
+
+    asyncio.run(run())
+
+    assert fetch.calls == 2
+    assert cache.stats().size == 0
+
+
+def test_fetch_that_races_an_invalidation_is_not_stored() -> None:
+    cache = ResponseCache(policy=TTLPolicy({}))
+
+    async def racing_fetch() -> FetchResult:
+        cache.invalidate_prefix("/users")
+        return {"version": "before-write"}, 1.0, None
+
+    fetch = CountingFetcher({"version": "after-write"})
+
+    async def run() -> List[Any]:
+        raced = await cache.get_or_fetch("/users/1", 30.0, racing_fetch)
+        fresh = await cache.get_or_fetch("/users/1", 30.0, fetch)
+        return [raced.value, fresh.value]
+
+    assert asyncio.run(run()) == [{"version": "before-write"}, {"version": "after-write"}]
+    assert fetch.calls == 1
+
+
+def test_invalidate_prefix_only_drops_matching_resources() -> None:
+    cache = ResponseCache(policy=TTLPolicy({}))
+    fetch = CountingFetcher({"ok": True})
+
+    async def run() -> int:
+        for key in ["/users", "/users?limit=20", "/users/1", "/users-archive", "/tokens"]:
+            await cache.get_or_fetch(key, 30.0, fetch)
+        return cache.invalidate_prefix("/users/")
+
+    assert asyncio.run(run()) == 3
+    assert sorted(cache._entries) == ["/tokens", "/users-archive"]
+
+
+def test_lru_evicts_the_least_recently_used_entry() -> None:
+    cache = ResponseCache(policy=TTLPolicy({}), max_entries=2)
+    fetch = CountingFetcher({"ok": True})
+
+    async def run() -> None:
+        await cache.get_or_fetch("/users/1", 30.0, fetch)
+        await cache.get_or_fetch("/users/2", 30.0, fetch)
+        await cache.get_or_fetch("/users/1", 30.0, fetch)
+        await cache.get_or_fetch("/users/3", 30.0, fetch)
+
+    asyncio.run(run())
+
+    assert sorted(cache._entries) == ["/users/1", "/users/3"]
+    assert cache.evictions == 1
@@ -0,0 +1,147 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, Iterator, List
+
+import pytest
+
+from app.cache import (
+    CacheBackend,
+    CacheEntry,
+    CachedUpstreamError,
+    RedisCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+    TTLPolicy,
+)
+from app.cache.fake_redis import FakeRedis, FakeRedisServer
+from app.cache.response import FetchResult
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def backends(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[List[CacheBackend]]:
+    if request.param == "sqlite":
+        pair: List[CacheBackend] = [
+            SQLiteCacheBackend(str(tmp_path / "cache.sqlite3"), poll_interval=0.01) for _ in range(2)
+        ]
+    else:
+        server = FakeRedisServer()
+        pair = [RedisCacheBackend(FakeRedis(server)) for _ in range(2)]
+    yield pair
+    for backend in pair:
+        asyncio.run(backend.close())
+
+
+def entry(value: Any, **kwargs: Any) -> CacheEntry:
+    return CacheEntry(value=value, stored_at=time.time(), ttl=30.0, stale_ttl=0.0, **kwargs)
+
+
+def test_entries_round_trip_between_workers(backends: List[CacheBackend]) -> None:
+    first, second = backends
+
+    async def run() -> List[CacheEntry]:
+        await first.set("/users/1", entry({"id": 1}, last_modified="Mon, 01 Jan 2024 00:00:00 GMT"))
+        await first.set("/users/2", entry(None, error=CachedUpstreamError(404, "User not found")))
+        return [await second.get("/users/1"), await second.get("/users/2"), await second.get("/users/3")]
+
+    found, missing, absent = asyncio.run(run())
+
+    assert found.value == {"id": 1}
+    assert found.last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert (missing.error.status_code, missing.error.detail) == (404, "User not found")
+    assert absent is None
+
+
+def test_delete_prefix_removes_only_matching_keys(backends: List[CacheBackend]) -> None:
+    backend = backends[0]
+    keys = ["/users", "/users?limit=20", "/users/1", "/users-archive", "/tokens"]
+
+    async def run() -> List[str]:
+        for key in keys:
+            await backend.set(key, entry({"key": key}))
+        await backend.delete_prefix("/users/")
+        return [key for key in keys if await backend.get(key) is not None]
+
+    assert asyncio.run(run()) == ["/users-archive", "/tokens"]
+
+
+def test_writes_with_an_outdated_version_are_rejected(backends: List[CacheBackend]) -> None:
+    first, second = backends
+
+    async def run() -> List[Any]:
+        version = await first.resource_version("/users")
+        await second.delete_prefix("/users/1")
+        rejected = await first.set("/users?limit=20", entry({"stale": True}), expected_version=version)
+        current = await first.resource_version("/users")
+        accepted = await first.set("/users?limit=20", entry({"stale": False}), expected_version=current)
+        untouched = await first.resource_version("/tokens")
+        return [rejected, current > version, accepted, (await second.get("/users?limit=20")).value, untouched]
+
+    assert asyncio.run(run()) == [False, True, True, {"stale": False}, 0]
+
+
+def test_invalidations_reach_other_workers_but_not_the_publisher(backends: List[CacheBackend]) -> None:
+    first, second = backends
+
+    async def run() -> str:
+        await first.resource_version("/users")
+        listener = first.invalidations()
+        received = asyncio.ensure_future(listener.__anext__())
+        await asyncio.sleep(0.05)
+        await first.publish_invalidation("/tokens")
+        await second.publish_invalidation("/users/1")
+        try:
+            return await asyncio.wait_for(received, 1.0)
+        finally:
+            await listener.aclose()
+
+    assert asyncio.run(run()) == "/users/1"
+
+
+def test_response_caches_share_entries_and_invalidations(backends: List[CacheBackend]) -> None:
+    caches = [ResponseCache(policy=TTLPolicy({}), backend=backend) for backend in backends]
+    calls: List[str] = []
+
+    def fetcher(value: Any) -> Any:
+        async def fetch() -> FetchResult:
+            calls.append(value)
+            return value, 1.0, None
+
+        return fetch
+
+    async def run() -> List[Any]:
+        caches[0].start()
+        await asyncio.sleep(0.05)
+        await caches[0].get_or_fetch("/users/1", 30.0, fetcher("original"))
+        shared = await caches[1].get_or_fetch("/users/1", 30.0, fetcher("unused"))
+        await caches[1].invalidate("/users/1")
+        for _ in range(100):
+            if caches[0].remote_invalidations:
+                break
+            await asyncio.sleep(0.01)
+        refetched = await caches[0].get_or_fetch("/users/1", 30.0, fetcher("updated"))
+        await caches[0].stop()
+        return [shared.value, refetched.value]
+
+    assert asyncio.run(run()) == ["original", "updated"]
+    assert calls == ["original", "updated"]
+    assert caches[0].remote_invalidations == 1
+    assert caches[1].shared_hits == 1
+
+
+def test_fetch_racing_a_write_in_another_worker_is_not_shared(backends: List[CacheBackend]) -> None:
+    caches = [ResponseCache(policy=TTLPolicy({}), backend=backend) for backend in backends]
+
+    async def racing_fetch() -> FetchResult:
+        await caches[1].invalidate("/users/1")
+        return "before-write", 1.0, None
+
+    async def fresh_fetch() -> FetchResult:
+        return "after-write", 1.0, None
+
+    async def run() -> List[Any]:
+        raced = await caches[0].get_or_fetch("/users?limit=20", 30.0, racing_fetch)
+        fresh = await caches[1].get_or_fetch("/users?limit=20", 30.0, fresh_fetch)
+        return [raced.value, fresh.value, caches[0].stats().size]
+
+    assert asyncio.run(run()) == ["before-write", "after-write", 0]
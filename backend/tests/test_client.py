@@ -0,0 +1,343 @@
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+import pytest
+
+from app.clients import resilience
+from app.clients.remnawave import RemnaWaveAdminAPIClient
+from app.clients.resilience import CircuitBreaker, CircuitOpenError, RetryBudget, RetryPolicy, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(resilience, "time", SimpleNamespace(monotonic=fake.monotonic, time=time.time))
+    return fake
+
+
+def status_error(status_code: int, headers: Optional[dict] = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "http://upstream/users")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("failed", request=request, response=response)
+
+
+def make_client(
+    handler: Callable[[httpx.Request], httpx.Response],
+    *,
+    retry_budget: Optional[RetryBudget] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+) -> RemnaWaveAdminAPIClient:
+    return RemnaWaveAdminAPIClient(
+        "http://upstream",
+        "token",
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0.0),
+        retry_budget=retry_budget,
+        circuit_breaker=circuit_breaker,
+    )
+
+
+def replay(*outcomes: Any) -> Callable[[httpx.Request], httpx.Response]:
+    remaining = list(outcomes)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, json={}, request=request)
+
+    return handler
+
+
+def count_calls(handler: Callable[[httpx.Request], httpx.Response]) -> Any:
+    calls: List[str] = []
+
+    def counting(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return handler(request)
+
+    return counting, calls
+
+
+@pytest.mark.parametrize(
+    ("method", "headers", "expected"),
+    [
+        ("GET", None, True),
+        ("DELETE", None, True),
+        ("POST", None, False),
+        ("PATCH", {"X-Trace": "1"}, False),
+        ("PATCH", {"idempotency-key": "abc"}, True),
+    ],
+)
+def test_retry_policy_only_treats_safe_or_keyed_methods_as_idempotent(
+    method: str, headers: Optional[dict], expected: bool
+) -> None:
+    assert RetryPolicy().allows_method(method, headers) is expected
+
+
+@pytest.mark.parametrize(
+    ("error", "idempotent", "expected"),
+    [
+        (status_error(503), True, True),
+        (status_error(429), True, True),
+        (status_error(500), True, False),
+        (status_error(404), True, False),
+        (status_error(503), False, False),
+        (httpx.ConnectError("refused"), False, True),
+        (httpx.PoolTimeout("pool exhausted"), False, True),
+        (httpx.ReadTimeout("no response"), True, True),
+        (httpx.ReadTimeout("no response"), False, False),
+        (CircuitOpenError("open"), True, False),
+    ],
+)
+def test_retry_policy_classifies_errors(error: Exception, idempotent: bool, expected: bool) -> None:
+    assert RetryPolicy().is_retryable(error, idempotent) is expected
+
+
+def test_retry_policy_honours_retry_after_up_to_the_cap() -> None:
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=2.0, max_retry_after=10.0)
+
+    assert policy.delay(1, status_error(503, {"Retry-After": "4"}).response) == 4.0
+    assert policy.delay(1, status_error(503, {"Retry-After": "60"}).response) is None
+    assert all(0.0 <= policy.delay(attempt) <= min(2.0, 0.5 * 2 ** (attempt - 1)) for attempt in range(1, 8))
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("7", 7.0), ("Mon, 01 Jan 2001 00:00:00 GMT", 0.0), ("soon", None), ("", None), (None, None)],
+)
+def test_parse_retry_after(value: Optional[str], expected: Optional[float]) -> None:
+    assert parse_retry_after(value) == expected
+
+
+def test_retry_budget_limits_retries_to_a_share_of_requests(clock: FakeClock) -> None:
+    budget = RetryBudget(ratio=0.5, min_per_second=0.0, capacity=2.0)
+
+    assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+    budget.record_request()
+    assert budget.try_spend() is False
+    budget.record_request()
+    assert budget.try_spend() is True
+    assert budget.exhausted == 2
+
+
+def test_retry_budget_refills_over_time_up_to_capacity(clock: FakeClock) -> None:
+    budget = RetryBudget(ratio=0.0, min_per_second=1.0, capacity=3.0)
+    while budget.try_spend():
+        pass
+
+    clock.now += 1.5
+    assert budget.balance == pytest.approx(1.5)
+    clock.now += 60.0
+    assert budget.balance == 3.0
+
+
+def test_circuit_opens_after_consecutive_failures_and_fails_fast(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30.0)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    breaker.before_call()
+    breaker.record_success()
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert (breaker.state, breaker.opened, breaker.rejected) == (CircuitBreaker.OPEN, 1, 1)
+
+
+@pytest.mark.parametrize(("probe_succeeds", "state"), [(True, CircuitBreaker.CLOSED), (False, CircuitBreaker.OPEN)])
+def test_circuit_allows_a_single_probe_after_the_recovery_timeout(
+    clock: FakeClock, probe_succeeds: bool, state: str
+) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+    breaker.before_call()
+    breaker.record_failure()
+
+    clock.now += 30.0
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    if probe_succeeds:
+        breaker.record_success()
+    else:
+        breaker.record_failure()
+
+    assert breaker.state == state
+
+
+def test_released_probe_lets_the_next_call_probe(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+    breaker.before_call()
+    breaker.record_failure()
+    clock.now += 30.0
+
+    breaker.before_call()
+    breaker.release()
+    breaker.before_call()
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_client_retries_idempotent_requests_on_retryable_statuses() -> None:
+    handler, calls = count_calls(replay(503, 502, 200))
+    client = make_client(handler)
+
+    response = asyncio.run(client.request("GET", "/users"))
+
+    assert response.status_code == 200
+    assert len(calls) == 3
+    assert client.resilience_stats().retries == 2
+
+
+@pytest.mark.parametrize(
+    ("outcome", "expected_calls"),
+    [(503, 1), (httpx.ReadTimeout("no response"), 1), (httpx.ConnectError("refused"), 3)],
+)
+def test_client_only_resends_writes_that_never_reached_the_upstream(outcome: Any, expected_calls: int) -> None:
+    handler, calls = count_calls(replay(outcome))
+    client = make_client(handler)
+
+    with pytest.raises(httpx.HTTPError):
+        asyncio.run(client.request("POST", "/users", json={"username": "alice"}))
+
+    assert len(calls) == expected_calls
+
+
+def test_client_stops_retrying_when_the_budget_is_spent() -> None:
+    handler, calls = count_calls(replay(503))
+    client = make_client(handler, retry_budget=RetryBudget(ratio=0.0, min_per_second=0.0, capacity=1.0))
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(client.request("GET", "/users"))
+
+    assert len(calls) == 3
+    assert client.resilience_stats().retry_budget_exhausted == 2
+
+
+def test_client_fails_fast_while_the_circuit_is_open() -> None:
+    handler, calls = count_calls(replay(500))
+    client = make_client(handler, circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=60.0))
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(client.request("GET", "/users"))
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(client.request("GET", "/users"))
+
+    assert len(calls) == 2
+    assert client.resilience_stats().circuit_state == CircuitBreaker.OPEN
+
+
+class GatedUpstream:
+    def __init__(self, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.release = asyncio.Event()
+        self.calls: List[str] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(f"{request.method} {request.url.path}?{request.url.query.decode()}")
+        await self.release.wait()
+        return httpx.Response(self.status_code, json={"call": len(self.calls)}, request=request)
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_concurrent_identical_gets_share_one_upstream_call() -> None:
+    upstream = GatedUpstream()
+    client = make_client(upstream)
+
+    async def run() -> List[Any]:
+        waiters = [
+            asyncio.ensure_future(client.request("GET", "/users", params={"limit": 20, "offset": 0}))
+            for _ in range(4)
+        ]
+        waiters.append(asyncio.ensure_future(client.request("GET", "/users", params={"offset": 0, "limit": 20})))
+        await settle()
+        upstream.release.set()
+        return [response.json() for response in await asyncio.gather(*waiters)]
+
+    assert asyncio.run(run()) == [{"call": 1}] * 5
+    assert len(upstream.calls) == 1
+    stats = client.singleflight_stats()
+    assert (stats.leaders, stats.followers, stats.in_flight, stats.coalescing_ratio) == (1, 4, 0, 0.8)
+
+
+@pytest.mark.parametrize(
+    "second",
+    [
+        {"method": "GET", "path": "/users", "params": {"limit": 50}},
+        {"method": "GET", "path": "/subscriptions", "params": {"limit": 20}},
+        {"method": "GET", "path": "/users", "params": {"limit": 20}, "headers": {"X-Trace": "1"}},
+        {"method": "POST", "path": "/users", "params": {"limit": 20}, "json": {"username": "alice"}},
+    ],
+)
+def test_distinct_requests_and_writes_are_not_coalesced(second: Dict[str, Any]) -> None:
+    upstream = GatedUpstream()
+    client = make_client(upstream)
+
+    async def run() -> None:
+        waiters = [
+            asyncio.ensure_future(client.request("GET", "/users", params={"limit": 20})),
+            asyncio.ensure_future(client.request(**second)),
+        ]
+        await settle()
+        upstream.release.set()
+        await asyncio.gather(*waiters)
+
+    asyncio.run(run())
+
+    assert len(upstream.calls) == 2
+
+
+def test_cancelled_waiter_does_not_cancel_the_shared_call() -> None:
+    upstream = GatedUpstream()
+    client = make_client(upstream)
+
+    async def run() -> Any:
+        cancelled = asyncio.ensure_future(client.request("GET", "/users"))
+        waiting = asyncio.ensure_future(client.request("GET", "/users"))
+        await settle()
+        cancelled.cancel()
+        await settle()
+        upstream.release.set()
+        return (await waiting).json()
+
+    assert asyncio.run(run()) == {"call": 1}
+    assert len(upstream.calls) == 1
+
+
+def test_shared_failure_reaches_every_waiter_and_is_not_reused() -> None:
+    upstream = GatedUpstream(status_code=404)
+    client = make_client(upstream)
+
+    async def run() -> List[Any]:
+        waiters = [asyncio.ensure_future(client.request("GET", "/users/7")) for _ in range(3)]
+        await settle()
+        upstream.release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        upstream.status_code = 200
+        return results + [(await client.request("GET", "/users/7")).status_code]
+
+    *failures, retried = asyncio.run(run())
+
+    assert all(isinstance(failure, httpx.HTTPStatusError) for failure in failures)
+    assert retried == 200
+    assert len(upstream.calls) == 2
@@ -0,0 +1,83 @@
+import asyncio
+from typing import Dict, Iterator, List
+
+import httpx
+import pytest
+
+from app.cache import get_response_cache
+from app.clients.remnawave import RemnaWaveAdminAPIClient
+from app.clients.resilience import RetryPolicy
+from app.services.dashboard import DashboardService
+
+UPSTREAM_PAYLOADS = {
+    "/health": {"status": "ok"},
+    "/stats/overview": {"users": {"total": 3}, "subscriptions": {"total": 2}, "support": {"total": 0}},
+    "/users": {"users": [{"id": 1}], "total": 1},
+    "/subscriptions": {"subscriptions": [], "total": 0},
+}
+
+
+class SlowUpstream:
+    def __init__(self, *, slow: Dict[str, float], failing: Dict[str, int]) -> None:
+        self.slow = slow
+        self.failing = failing
+        self.calls: List[str] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.calls.append(path)
+        await asyncio.sleep(self.slow.get(path, 0.0))
+        if path in self.failing:
+            return httpx.Response(self.failing[path], json={"detail": "boom"}, request=request)
+        return httpx.Response(200, json=UPSTREAM_PAYLOADS[path], request=request)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> Iterator[None]:
+    get_response_cache().clear()
+    yield
+    get_response_cache().clear()
+
+
+def make_service(upstream: SlowUpstream, section_timeout: float) -> DashboardService:
+    client = RemnaWaveAdminAPIClient(
+        "http://upstream",
+        "token",
+        transport=httpx.MockTransport(upstream),
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    return DashboardService(client, section_timeout=section_timeout)
+
+
+def test_dashboard_reports_slow_and_failing_sections_without_dropping_the_rest() -> None:
+    upstream = SlowUpstream(slow={"/stats/overview": 1.0}, failing={"/subscriptions": 404})
+    service = make_service(upstream, section_timeout=0.1)
+
+    dashboard = asyncio.run(service.get_dashboard(recent_limit=5))
+
+    assert dashboard.health.status == "ok"
+    assert [user.id for user in dashboard.recent_users.items] == [1]
+    assert dashboard.stats is None
+    assert dashboard.recent_subscriptions is None
+    assert {name: section.status for name, section in dashboard.sections.items()} == {
+        "health": "ok",
+        "stats": "timeout",
+        "recent_users": "ok",
+        "recent_subscriptions": "error",
+    }
+    assert dashboard.sections["recent_subscriptions"].status_code == 404
+    assert dashboard.sections["stats"].duration_ms < 1000
+
+
+def test_timed_out_section_keeps_loading_and_warms_the_next_render() -> None:
+    upstream = SlowUpstream(slow={"/stats/overview": 0.2}, failing={})
+    service = make_service(upstream, section_timeout=0.05)
+
+    async def run() -> List[str]:
+        first = await service.get_dashboard(recent_limit=5)
+        await asyncio.sleep(0.3)
+        second = await service.get_dashboard(recent_limit=5)
+        return [first.sections["stats"].status, second.sections["stats"].status]
+
+    assert asyncio.run(run()) == ["timeout", "ok"]
+    assert upstream.calls.count("/stats/overview") == 1
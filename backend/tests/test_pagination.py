@@ -0,0 +1,59 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+
+from app.cache import ResponseCache, TTLPolicy
+from app.services.base import BaseService
+
+
+class LimitCappingClient:
+    def __init__(self, rows: int, cap: int, *, with_total: bool = True, reported_total: Optional[int] = None) -> None:
+        self.rows = rows
+        self.cap = cap
+        self.with_total = with_total
+        self.reported_total = rows if reported_total is None else reported_total
+        self.calls: List[Dict[str, Any]] = []
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        params = params or {}
+        self.calls.append(params)
+        offset = params.get("offset", 0)
+        limit = min(params.get("limit", 20), self.cap)
+        payload: Dict[str, Any] = {
+            "items": [{"id": row_id} for row_id in range(offset + 1, min(offset + limit, self.rows) + 1)]
+        }
+        if self.with_total:
+            payload["total"] = self.reported_total
+        return httpx.Response(200, json=payload, request=httpx.Request(method, f"http://upstream{path}"))
+
+
+def collect(client: LimitCappingClient, page_size: int = 200) -> List[int]:
+    service = BaseService(client, ResponseCache(policy=TTLPolicy({})))  # type: ignore[arg-type]
+
+    async def run() -> List[int]:
+        return [item["id"] async for item in service._iter_items("/users", page_size=page_size)]
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("with_total", [True, False])
+@pytest.mark.parametrize("cap", [200, 150, 1000])
+def test_iter_items_returns_every_row_when_upstream_caps_limit(cap: int, with_total: bool) -> None:
+    client = LimitCappingClient(5000, cap, with_total=with_total)
+
+    assert collect(client) == list(range(1, 5001))
+
+
+def test_iter_items_stops_when_rows_disappear_during_the_crawl() -> None:
+    client = LimitCappingClient(4990, 200, reported_total=5000)
+
+    assert collect(client) == list(range(1, 4991))
@@ -0,0 +1,43 @@
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from app.readmodel.store import ReadModelStore
+
+
+def test_failed_batch_rolls_back_and_store_keeps_syncing(tmp_path: Path) -> None:
+    store = ReadModelStore(str(tmp_path / "read_model.sqlite3"))
+
+    async def run() -> None:
+        with pytest.raises(sqlite3.IntegrityError):
+            await store._executemany(
+                "INSERT INTO users (id, data, synced_at) VALUES (?, ?, ?)",
+                [(1, "{}", 1.0), (1, "{}", 1.0)],
+            )
+        await store.upsert_users([{"id": 2}], 10.0, 0)
+        await store.finish_sync("users", 10.0)
+
+    asyncio.run(run())
+
+    assert asyncio.run(store.list_users(limit=10, offset=0)) == ([{"id": 2}], 1)
+    assert store.is_fresh("users", float("inf"))
+    store.close()
+
+
+def test_pages_follow_upstream_crawl_order(tmp_path: Path) -> None:
+    store = ReadModelStore(str(tmp_path / "read_model.sqlite3"))
+
+    async def run() -> None:
+        await store.upsert_users([{"id": 5}, {"id": 3}], 10.0, 0)
+        await store.upsert_users([{"id": 9}, {"id": 1}], 10.0, 2)
+        await store.upsert_users([{"id": 3, "username": "renamed"}])
+        await store.upsert_users([{"id": 42}])
+
+    asyncio.run(run())
+    items, total = asyncio.run(store.list_users(limit=3, offset=1))
+
+    assert [item["id"] for item in items] == [3, 9, 1]
+    assert total == 5
+    store.close()
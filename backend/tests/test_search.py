@@ -0,0 +1,84 @@
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from app.schemas.tokens import Token
+from app.search import SearchIndex
+from app.services.base import RemoteServiceError
+from app.services.users import UsersService
+
+
+class FakeReadModel:
+    def __init__(self, users: Dict[int, Dict[str, Any]]) -> None:
+        self.users = users
+
+    async def get_users(self, user_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        return {user_id: self.users[user_id] for user_id in user_ids if user_id in self.users}
+
+
+class FakeUsersService(UsersService):
+    def __init__(self, read_model: FakeReadModel, search_index: SearchIndex, upstream: Dict[int, Dict[str, Any]]):
+        super().__init__(client=None, read_model=read_model, search_index=search_index)
+        self.upstream = upstream
+        self.requested: List[str] = []
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
+        self.requested.append(path)
+        user_id = int(path.rsplit("/", 1)[-1])
+        if user_id not in self.upstream:
+            raise RemoteServiceError(status_code=404, detail="User not found")
+        return self.upstream[user_id]
+
+
+def build_index(store_documents: bool = False) -> SearchIndex:
+    index = SearchIndex(store_documents=store_documents)
+    for user_id, name in [(1, "alice smith"), (2, "bob stone"), (3, "alina stark")]:
+        document = Token(id=user_id, name=name, token_prefix=f"rw{user_id}") if store_documents else None
+        index.upsert(user_id, [name], document)
+    index.remove(2)
+    index.commit()
+    index.ready = True
+    return index
+
+
+def test_snapshot_round_trips_through_json() -> None:
+    index = build_index(store_documents=True)
+    snapshot = json.loads(json.dumps(index.snapshot(lambda token: token.model_dump(mode="json"))))
+
+    restored = SearchIndex.from_snapshot(snapshot, store_documents=True, load_document=Token.model_validate)
+
+    assert restored.ready
+    assert len(restored) == 2
+    for query in ["ali", "stone", "smith", "alna"]:
+        assert restored.search(query, limit=10) == index.search(query, limit=10)
+    assert restored.document(3) == index.document(3)
+    assert isinstance(restored.document(3), Token)
+
+
+@pytest.mark.parametrize("postings", [[[0]], [[0], [0], [1], [1], [7], [2]]])
+def test_snapshot_rejects_inconsistent_postings(postings: List[List[int]]) -> None:
+    snapshot = build_index().snapshot()
+    snapshot["postings"] = postings
+
+    with pytest.raises(ValueError):
+        SearchIndex.from_snapshot(snapshot)
+
+
+def test_search_hydrates_read_model_misses_upstream_and_adjusts_total() -> None:
+    index = build_index()
+    index.upsert(4, ["alicia stern"])
+    index.commit()
+    service = FakeUsersService(
+        FakeReadModel({1: {"id": 1, "full_name": "alice smith"}}),
+        index,
+        upstream={3: {"id": 3, "full_name": "alina stark"}},
+    )
+
+    response = asyncio.run(service.list_users(limit=10, offset=0, search="ali"))
+
+    assert sorted(item.id for item in response.items) == [1, 3]
+    assert response.total == 2
+    assert sorted(service.requested) == ["/users/3", "/users/4"]
+    assert index.search("ali", limit=10)[1] == 2
@@ -0,0 +1,51 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app.cache import resolve_cache_backend
+from app.metrics import MetricsRegistry, WorkerMetrics
+
+
+def test_worker_metrics_merge_every_worker_under_a_worker_label(tmp_path: Path) -> None:
+    registries = [MetricsRegistry() for _ in range(2)]
+    counters = [registry.counter("bff_requests_total", "Requests.", ("route",)) for registry in registries]
+    workers = [
+        WorkerMetrics(registry, str(tmp_path), slot=slot, workers=2) for slot, registry in enumerate(registries)
+    ]
+    counters[0].inc(("/users",), 3)
+    counters[1].inc(("/users",), 5)
+
+    async def run() -> str:
+        await workers[1].write_snapshot()
+        return await workers[0].render()
+
+    body = asyncio.run(run())
+
+    assert body.count("# TYPE bff_requests_total counter") == 1
+    assert 'bff_requests_total{route="/users",worker="0"} 3' in body
+    assert 'bff_requests_total{route="/users",worker="1"} 5' in body
+
+
+def test_worker_metrics_never_report_less_than_a_previous_scrape(tmp_path: Path) -> None:
+    registries = [MetricsRegistry() for _ in range(2)]
+    counters = [registry.counter("bff_requests_total", "Requests.") for registry in registries]
+    workers = [
+        WorkerMetrics(registry, str(tmp_path), slot=slot, workers=2) for slot, registry in enumerate(registries)
+    ]
+
+    async def run() -> str:
+        await workers[1].write_snapshot()
+        counters[1].inc(amount=4)
+        await workers[1].render()
+        return await workers[0].render()
+
+    assert 'bff_requests_total{worker="1"} 4' in asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    ("configured", "workers", "expected"),
+    [("auto", 1, "memory"), ("auto", 4, "sqlite"), ("memory", 4, "memory"), ("Redis", 4, "redis")],
+)
+def test_auto_cache_backend_is_shared_across_workers(configured: str, workers: int, expected: str) -> None:
+    assert resolve_cache_backend(configured, workers) == expected